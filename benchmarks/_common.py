@@ -0,0 +1,60 @@
+"""
+Shared helpers of the benchmark scripts.
+
+Run a benchmark from the repository root, e.g. `python benchmarks/bench_enum_registries.py`.
+Results depend on the machine; compare the numbers of one run with each other.
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def best_of(function, repeat: int = 5, number: int = 1) -> float:
+    """Return the best time in seconds of calling function `number` times, over `repeat` runs."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def call(tool, **arguments):
+    """Call an MCP tool the way the server does, through its worker pool."""
+    return asyncio.run(tool(**arguments))
+
+
+def server():
+    import ppt_mcp_server
+    return ppt_mcp_server
+
+
+def scratch_dir() -> str:
+    return tempfile.mkdtemp(prefix="ppt_bench_")
+
+
+def build_deck(file_path: str, slides: int = 500) -> None:
+    """Save a deck with a title, 8 bullets, a 12x6 table and notes on each slide."""
+    from pptx import Presentation
+    from pptx.util import Inches
+    import ppt_utils
+    presentation = Presentation()
+    for i in range(slides):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {i}"
+        slide.placeholders[1].text = "\n".join(f"bullet {k}" for k in range(8))
+        table = slide.shapes.add_table(12, 6, Inches(1), Inches(3), Inches(8), Inches(3)).table
+        ppt_utils.fill_table(table, [[f"{row}.{column}" for column in range(6)] for row in range(12)])
+        slide.notes_slide.notes_text_frame.text = f"notes {i}"
+    ppt_utils.save_presentation(presentation, file_path)
+
+
+def report(label: str, value: float, unit: str = "ms") -> None:
+    print(f"{label:<48} {value:>12.3f} {unit}")
@@ -0,0 +1,51 @@
+"""
+Per-call cost of resolving shape, chart and alignment names (user-018).
+
+Compares building a name -> enum dict on every call, as add_shape, add_chart
+and the formatting functions used to, with a lookup in the registries built
+once at import. Also times the add_shape tool end to end.
+"""
+import _common
+from _common import best_of, call, report
+
+import ppt_utils
+
+CALLS = 100000
+
+
+def per_call_map(registry):
+    """
+    Build a lookup function like those the registries replaced: a literal dict
+    of enum attribute lookups, evaluated on every call.
+    """
+    enum = type(next(iter(registry.members.values())))
+    entries = ', '.join(f"{name!r}: {enum.__name__}.{member.name}" for name, member in registry.members.items())
+    namespace = {enum.__name__: enum}
+    exec(f"def lookup(name):\n    return {{{entries}}}.get(str(name).lower())", namespace)
+    return namespace['lookup']
+
+
+def main():
+    for registry, name in ((ppt_utils.SHAPE_TYPES, 'flowchart_connector'),
+                           (ppt_utils.CHART_TYPES, 'radar_markers'),
+                           (ppt_utils.ALIGNMENTS, 'justify')):
+        lookup = per_call_map(registry)
+        rebuilt = best_of(lambda: lookup(name), number=CALLS) / CALLS
+        shared = best_of(lambda: registry.lookup(name), number=CALLS) / CALLS
+        report(f"{registry.kind}: dict built per call", rebuilt * 1e6, "us")
+        report(f"{registry.kind}: shared registry", shared * 1e6, "us")
+
+    server = _common.server()
+    call(server.create_presentation, id="bench")
+    call(server.add_slide, layout_index=6, presentation_id="bench")
+    shapes = 500
+    seconds = best_of(lambda: [
+        call(server.add_shape, slide_index=0, shape_type='star', left=1, top=1, width=1, height=1,
+             presentation_id="bench")
+        for _ in range(shapes)
+    ], repeat=1)
+    report("add_shape tool, per call", seconds / shapes * 1e3)
+
+
+if __name__ == "__main__":
+    main()
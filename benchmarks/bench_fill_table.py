@@ -0,0 +1,52 @@
+"""
+Table population throughput, per-cell loop against fill_table (user-003).
+
+The loop sets each cell through set_cell_text, the way add_table used to;
+table.cell() walks the rows, so the loop is quadratic in the row count and
+takes minutes past a few thousand rows. Pass other row counts as arguments,
+e.g. `python benchmarks/bench_fill_table.py 100 2000`.
+"""
+import _common
+from _common import report
+
+import sys
+import time
+
+from pptx import Presentation
+from pptx.util import Inches
+
+import ppt_utils
+
+COLUMNS = 10
+ROWS = (100, 1000)
+
+
+def new_table(rows: int):
+    presentation = Presentation()
+    slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+    return slide.shapes.add_table(rows, COLUMNS, 0, 0, Inches(8), Inches(5)).table
+
+
+def main(row_counts=ROWS):
+    for rows in row_counts:
+        data = [[f"{row * column + 0.5}" for column in range(COLUMNS)] for row in range(rows)]
+        cells = rows * COLUMNS
+
+        table = new_table(rows)
+        start = time.perf_counter()
+        for row, values in enumerate(data):
+            for column, value in enumerate(values):
+                ppt_utils.set_cell_text(table, row, column, value)
+        loop = time.perf_counter() - start
+
+        table = new_table(rows)
+        start = time.perf_counter()
+        ppt_utils.fill_table(table, data, [",.2f"] * COLUMNS, {"bold": True, "alignment": "center"})
+        bulk = time.perf_counter() - start
+
+        report(f"{cells} cells: set_cell_text loop", cells / loop, "cells/s")
+        report(f"{cells} cells: fill_table", cells / bulk, "cells/s")
+
+
+if __name__ == "__main__":
+    main([int(rows) for rows in sys.argv[1:]] or ROWS)
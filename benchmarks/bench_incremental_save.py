@@ -0,0 +1,75 @@
+"""
+Full against incremental save after a small edit (user-013).
+
+Opens a generated 500 slide deck through the server tools, eager and lazy,
+adds a textbox to one slide, sets the title property and adds a slide, then
+times a full save, an incremental save to a new file and, after a second edit,
+an incremental save over that file. The output is checked against the full save.
+"""
+import _common
+from _common import build_deck, call, report, scratch_dir, server
+
+import os
+import shutil
+import time
+import zipfile
+
+from pptx import Presentation
+
+import ppt_utils
+
+SLIDES = 500
+
+
+def edit(srv, pres_id, slide_index, text):
+    call(srv.add_textbox, slide_index=slide_index, left=1, top=1, width=3, height=1, text=text,
+         presentation_id=pres_id)
+
+
+def main():
+    srv = server()
+    directory = scratch_dir()
+    deck = os.path.join(directory, 'deck.pptx')
+    build_deck(deck, SLIDES)
+    for lazy in (False, True):
+        mode = "lazy" if lazy else "eager"
+        source = os.path.join(directory, f'{mode}.pptx')
+        full = os.path.join(directory, f'{mode}_full.pptx')
+        incremental = os.path.join(directory, f'{mode}_incremental.pptx')
+        shutil.copy(deck, source)
+
+        pres_id = call(srv.open_presentation, file_path=source, lazy=lazy, id=mode)["presentation_id"]
+        edit(srv, pres_id, SLIDES // 2, "edited")
+        call(srv.set_core_properties, title="Title", presentation_id=pres_id)
+        call(srv.add_slide, title="New slide", presentation_id=pres_id)
+
+        start = time.perf_counter()
+        ppt_utils.save_presentation(srv.presentations[pres_id], full, incremental=False, update_source=False)
+        report(f"{mode}: full save", (time.perf_counter() - start) * 1000)
+
+        start = time.perf_counter()
+        call(srv.save_presentation, file_path=incremental, presentation_id=pres_id)
+        report(f"{mode}: incremental save", (time.perf_counter() - start) * 1000)
+
+        edit(srv, pres_id, 3, "second")
+        start = time.perf_counter()
+        call(srv.save_presentation, file_path=incremental, presentation_id=pres_id)
+        report(f"{mode}: incremental save in place", (time.perf_counter() - start) * 1000)
+        call(srv.close_presentation, presentation_id=pres_id)
+
+        with zipfile.ZipFile(incremental) as saved, zipfile.ZipFile(full) as reference:
+            assert saved.testzip() is None
+            assert sorted(saved.namelist()) == sorted(reference.namelist())
+        saved, reference = Presentation(incremental), Presentation(full)
+        assert len(saved.slides) == SLIDES + 1
+        assert saved.slides[SLIDES // 2].shapes[-1].text == "edited"
+        assert saved.slides[3].shapes[-1].text == "second"
+        assert saved.slides[SLIDES].shapes.title.text == "New slide"
+        assert saved.core_properties.title == "Title"
+        for index in range(0, SLIDES, 7):
+            if index != 3:
+                assert saved.slides[index].part.blob == reference.slides[index].part.blob
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Eager against lazy open of a large deck (user-010).
+
+Generates a deck of SLIDES slides with a title, bullets, a table and notes,
+then for both modes times opening it, reading the deck info, editing one slide
+and saving, reports the memory estimate, and checks that the edit was saved.
+"""
+import _common
+from _common import build_deck, report, scratch_dir
+
+import os
+import time
+
+from pptx import Presentation
+
+import ppt_utils
+
+SLIDES = 500
+
+
+def main():
+    directory = scratch_dir()
+    source = os.path.join(directory, 'deck.pptx')
+    build_deck(source, SLIDES)
+    report("deck size", os.path.getsize(source) / 1e6, "MB")
+    edited = SLIDES // 2
+    for lazy in (False, True):
+        mode = "lazy" if lazy else "eager"
+        start = time.perf_counter()
+        presentation = ppt_utils.open_presentation(source, lazy=lazy)
+        opened = time.perf_counter()
+        len(presentation.slides)
+        ppt_utils.get_slide_layouts(presentation)
+        ppt_utils.get_core_properties(presentation)
+        info = time.perf_counter()
+        slide = presentation.slides[edited]
+        slide.shapes.title.text = "edited"
+        ppt_utils.mark_modified(slide.part)
+        edit = time.perf_counter()
+        target = os.path.join(directory, f'{mode}.pptx')
+        ppt_utils.save_presentation(presentation, target)
+        saved = time.perf_counter()
+        report(f"{mode}: open", (opened - start) * 1000)
+        report(f"{mode}: info", (info - opened) * 1000)
+        report(f"{mode}: edit one slide", (edit - info) * 1000)
+        report(f"{mode}: save", (saved - edit) * 1000)
+        report(f"{mode}: estimated size", ppt_utils.estimate_presentation_size(presentation) / 1e6, "MB")
+
+        reopened = Presentation(target)
+        assert len(reopened.slides) == SLIDES
+        assert reopened.slides[edited].shapes.title.text == "edited"
+        assert reopened.slides[10].notes_slide.notes_text_frame.text == "notes 10"
+
+
+if __name__ == "__main__":
+    main()
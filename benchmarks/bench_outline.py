@@ -0,0 +1,48 @@
+"""
+Response size and time of the info tools by detail level (user-016).
+
+Builds a 200 slide deck with a title, 5 bullets and 15 textboxes per slide and
+reports the JSON size and time of get_presentation_info, of get_slide_info
+called for every slide, and of get_presentation_outline.
+"""
+import _common
+from _common import best_of, report, server
+
+import json
+
+import ppt_utils
+
+SLIDES = 200
+
+
+def measure(label, function, repeat=3):
+    result = function()
+    report(f"{label}: size", len(json.dumps(result, default=str)) / 1024, "KB")
+    report(f"{label}: time", best_of(function, repeat) * 1000)
+
+
+def main():
+    srv = server()
+    pres_id = srv.create_presentation.__wrapped__(id="outline")["presentation_id"]
+    presentation = srv.presentations[pres_id]
+    for index in range(SLIDES):
+        slide, _ = ppt_utils.add_slide(presentation, 1)
+        ppt_utils.set_title(slide, f"Slide {index} title")
+        ppt_utils.add_bullet_points(slide.placeholders[1], [f"Point {k} of slide {index}" for k in range(5)])
+        for k in range(15):
+            ppt_utils.add_textbox(slide, k % 5, 5 + k // 5 * 0.5, 1, 0.5, f"note {k}")
+
+    presentation_info = srv.get_presentation_info.__wrapped__
+    slide_info = srv.get_slide_info.__wrapped__
+    for detail in ("full", "summary", "ids"):
+        measure(f"presentation_info {detail}", lambda: presentation_info(detail=detail, presentation_id=pres_id))
+    for detail in ("full", "summary", "ids"):
+        measure(f"{SLIDES} x slide_info {detail}",
+                lambda: [slide_info(index, detail=detail, presentation_id=pres_id) for index in range(SLIDES)], 1)
+    measure(f"{SLIDES} x slide_info fields=index,name",
+            lambda: [slide_info(index, fields=["index", "name"], presentation_id=pres_id) for index in range(SLIDES)], 1)
+    measure("presentation_outline", lambda: srv.get_presentation_outline.__wrapped__(presentation_id=pres_id))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Peak memory and time of saving a large deck (user-005).
+
+Builds a deck of SLIDES slides, each holding a distinct incompressible image
+of IMAGE_MB, and compares python-pptx's own save (to a BytesIO then base64
+encoded, or straight to a file) with presentation_to_base64, save_presentation
+and save_presentation_base64.
+Each mode runs in its own process, so that its peak RSS is measured alone.
+"""
+import _common
+from _common import report, scratch_dir
+
+import io
+import os
+import resource
+import subprocess
+import sys
+import time
+
+SLIDES = 40
+IMAGE_MB = 5
+MODES = ('bytesio_base64', 'presentation_to_base64', 'pptx_save_to_file', 'save_presentation',
+         'save_presentation_base64')
+
+
+def build_deck():
+    from PIL import Image
+    from pptx import Presentation
+    presentation = Presentation()
+    for i in range(SLIDES):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+        image = io.BytesIO()
+        Image.new('RGB', (8, 8), (i, 0, 0)).save(image, 'JPEG')
+        picture = slide.shapes.add_picture(image, 0, 0)
+        part = slide.part.related_part(picture._element.blipFill.blip.rEmbed)
+        part._blob = part._blob + os.urandom(IMAGE_MB * 1024 * 1024)
+    return presentation
+
+
+def run(mode, directory):
+    import base64
+    import ppt_utils
+    presentation = build_deck()
+    base = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    if mode == 'bytesio_base64':
+        buffer = io.BytesIO()
+        presentation.save(buffer)
+        base64.b64encode(buffer.getvalue()).decode('utf-8')
+    elif mode == 'presentation_to_base64':
+        ppt_utils.presentation_to_base64(presentation)
+    elif mode == 'pptx_save_to_file':
+        presentation.save(os.path.join(directory, 'deck.pptx'))
+    elif mode == 'save_presentation':
+        ppt_utils.save_presentation(presentation, os.path.join(directory, 'deck.pptx'))
+    else:
+        ppt_utils.save_presentation_base64(presentation, os.path.join(directory, 'deck.b64'))
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    report(f"{mode}: extra peak RSS", (peak - base) / 1024, "MB")
+    report(f"{mode}: time", elapsed * 1000)
+
+
+def main():
+    directory = scratch_dir()
+    for mode in MODES:
+        subprocess.run([sys.executable, __file__, mode, directory], check=True)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 3:
+        run(*sys.argv[1:])
+    else:
+        main()
@@ -0,0 +1,40 @@
+"""
+Throughput of creating new decks from the default template (user-011).
+
+Compares Presentation(), which reads and parses the template package for every
+deck, with create_presentation(), which clones the pre-parsed template. Both
+are timed creating decks only, and creating a deck, adding a titled slide and
+saving it to memory.
+"""
+import _common
+from _common import report
+
+import io
+import time
+
+from pptx import Presentation
+
+import ppt_utils
+
+DECKS = 300
+
+
+def decks_per_second(make, work: bool) -> float:
+    start = time.perf_counter()
+    for i in range(DECKS):
+        presentation = make()
+        if work:
+            slide, _ = ppt_utils.add_slide(presentation, 1)
+            ppt_utils.set_title(slide, f"Deck {i}")
+            ppt_utils.write_presentation(presentation, io.BytesIO())
+    return DECKS / (time.perf_counter() - start)
+
+
+def main():
+    for work, label in ((False, "create"), (True, "create, add a slide, save")):
+        report(f"{label}: Presentation()", decks_per_second(Presentation, work), "decks/s")
+        report(f"{label}: create_presentation()", decks_per_second(ppt_utils.create_presentation, work), "decks/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Per-call cost of checking tool arguments (user-017).
+
+Compares the validation format_table_cell used to build on every call, a dict
+of (value, [(check, message)]) pairs passed to validate_parameters, with the
+validator compiled from its schema at import. The parameter checks are timed
+alone and together with the slide and shape index checks.
+"""
+import _common
+from _common import best_of, report, server
+
+CALLS = 100000
+
+
+def main():
+    srv = server()
+    pres_id = srv.create_presentation.__wrapped__(id="validation")["presentation_id"]
+    srv.add_slide.__wrapped__(layout_index=6, presentation_id=pres_id)
+    srv.add_table.__wrapped__(slide_index=0, rows=3, cols=3, left=1, top=1, width=4, height=2,
+                              presentation_id=pres_id)
+    presentation = srv.presentations[pres_id]
+    arguments = dict(slide_index=0, shape_index=0, row=0, col=0, font_size=12, font_name=None, bold=None,
+                     italic=None, color=[1, 2, 3], bg_color=[1, 2, 3], alignment="center",
+                     vertical_alignment="middle", presentation_id=pres_id)
+
+    def per_call_parameters():
+        valid_alignments = ['left', 'center', 'right', 'justify']
+        valid_vertical_alignments = ['top', 'middle', 'bottom']
+        validations = {}
+        validations["font_size"] = (12, [(srv.is_positive, "must be a positive integer")])
+        validations["alignment"] = ("center".lower(), [
+            (lambda x: x in valid_alignments, f"must be one of {', '.join(valid_alignments)}")])
+        validations["vertical_alignment"] = ("middle".lower(), [
+            (lambda x: x in valid_vertical_alignments, f"must be one of {', '.join(valid_vertical_alignments)}")])
+        validations["color"] = ([1, 2, 3], [(srv.is_valid_rgb, "must be a valid RGB list [R, G, B] with values 0-255")])
+        validations["bg_color"] = ([1, 2, 3], [(srv.is_valid_rgb, "must be a valid RGB list [R, G, B] with values 0-255")])
+        return srv.validate_parameters(validations)
+
+    def per_call_with_indices():
+        if not 0 <= 0 < srv.ppt_utils.get_slide_count(presentation):
+            return
+        slide = srv.ppt_utils.get_slide(presentation, 0)
+        if not 0 <= 0 < len(srv.ppt_utils.get_shapes(presentation, slide)):
+            return
+        return per_call_parameters()
+
+    compiled_parameters = srv.compile_schema({
+        "font_size": [srv.POSITIVE_INTEGER],
+        "alignment": [srv.HORIZONTAL_ALIGNMENT],
+        "vertical_alignment": [srv.VERTICAL_ALIGNMENT],
+        "color": [srv.RGB_COLOR],
+        "bg_color": [srv.RGB_COLOR]
+    })
+    compiled_with_indices = srv.format_table_cell.__wrapped__.validator
+
+    assert per_call_parameters()[0] and compiled_parameters(arguments) is None
+    assert compiled_with_indices(arguments) is None
+    for label, function in (("parameters, built per call", per_call_parameters),
+                            ("parameters, compiled schema", lambda: compiled_parameters(arguments)),
+                            ("with index checks, built per call", per_call_with_indices),
+                            ("with index checks, compiled schema", lambda: compiled_with_indices(arguments))):
+        report(label, best_of(function, 5, CALLS) / CALLS * 1e6, "us/call")
+
+
+if __name__ == "__main__":
+    main()
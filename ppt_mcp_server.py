@@ -4,8 +4,24 @@ MCP Server for PowerPoint manipulation using python-pptx.
 """
 import os
 import json
+import asyncio
+import functools
+import hashlib
+import inspect
+import io
+import itertools
+import re
+import shutil
 import tempfile
-from typing import Dict, List, Optional, Any, Union
+import threading
+import time
+import weakref
+import contextvars
+import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import Dict, List, Optional, Any, Tuple, Union
 from mcp.server.fastmcp import FastMCP
 
 import ppt_utils
@@ -13,21 +29,945 @@ import ppt_utils
 # Initialize the FastMCP server
 app = FastMCP(
     name="ppt-mcp-server",
-    description="MCP Server for PowerPoint manipulation using python-pptx",
-    version="1.0.0"
+    instructions="MCP Server for PowerPoint manipulation using python-pptx"
 )
 
+# Memory budget for open presentations, configurable through the environment
+MAX_PRESENTATIONS = int(os.environ.get("PPT_MCP_MAX_PRESENTATIONS", "16"))
+MAX_PRESENTATION_MEMORY_MB = int(os.environ.get("PPT_MCP_MAX_MEMORY_MB", "1024"))
+
+# Levels of detail of the information tools, from the most compact
+DETAIL_LEVELS = ["ids", "summary", "full"]
+
+# Failed records listed in a merge_presentations result; all of them are counted
+MAX_REPORTED_FAILURES = 100
+
+class ReadWriteLock:
+    """
+    Lock that can be held by many readers or by a single writer.
+
+    Waiting writers take precedence over new readers, so a steady stream of reads
+    cannot starve writes. The thread holding the write lock may acquire it again,
+    for reading or writing; read locks are not reentrant.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._writer_depth = 0
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self):
+        """Hold the lock for reading."""
+        if self._writer == threading.get_ident():
+            with self.write():
+                yield
+            return
+
+        with self._condition:
+            while self._writer is not None or self._waiting_writers:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self):
+        """Hold the lock for writing."""
+        thread_id = threading.get_ident()
+        with self._condition:
+            if self._writer != thread_id:
+                self._waiting_writers += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._condition.wait()
+                finally:
+                    self._waiting_writers -= 1
+                self._writer = thread_id
+            self._writer_depth += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer_depth -= 1
+                if not self._writer_depth:
+                    self._writer = None
+                    self._condition.notify_all()
+
+class PresentationStore:
+    """
+    Bounded store of open presentations, keyed by presentation ID.
+
+    Presentations are kept in memory up to a maximum count and approximate total
+    size. When a new presentation is stored or a spilled one is reloaded and the
+    budget is exceeded, the least recently used presentations are saved to a
+    temporary .pptx file and dropped from memory. They are reloaded transparently
+    the next time they are accessed. Presentations that are in use (see use())
+    are never spilled.
+
+    Spilling and reloading happen outside the store's lock: while a presentation
+    is being saved or loaded, only callers that need that presentation wait.
+
+    A limit of 0 disables the corresponding bound. The store is thread-safe.
+    """
+
+    def __init__(self, max_count: int = 0, max_bytes: int = 0):
+        self.max_count = max_count
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._spill_dir = None
+        self._lock = threading.RLock()
+        # Notified when an entry has finished loading or spilling
+        self._idle = threading.Condition(self._lock)
+        self._ids = itertools.count(1)
+
+    def __contains__(self, pres_id) -> bool:
+        with self._lock:
+            return pres_id in self._entries
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def __getitem__(self, pres_id):
+        with self._lock:
+            entry = self._idle_entry(pres_id)
+            self._entries.move_to_end(pres_id)
+            if entry["presentation"] is not None:
+                return entry["presentation"]
+            entry["state"] = "loading"
+
+        # Reload a spilled presentation
+        try:
+            presentation = ppt_utils.open_presentation(entry["spill_path"], lazy=True)
+            size = ppt_utils.estimate_presentation_size(presentation)
+            os.remove(entry["spill_path"])
+        except BaseException:
+            with self._lock:
+                entry["state"] = None
+                self._idle.notify_all()
+            raise
+
+        with self._lock:
+            entry.update(presentation=presentation, size=size, spill_path=None, state=None)
+            self._idle.notify_all()
+            spills = self._select_spills()
+        self._spill_all(spills)
+        return presentation
+
+    def __setitem__(self, pres_id, presentation) -> None:
+        sizes = self._measure(presentation)
+        with self._lock:
+            previous, spills = self._store(pres_id, presentation, sizes)
+        if previous is not None:
+            self._release(previous)
+        self._spill_all(spills)
+
+    def __delitem__(self, pres_id) -> None:
+        with self._lock:
+            entry = self._idle_entry(pres_id)
+            del self._entries[pres_id]
+        self._release(entry)
+
+    def add(self, presentation, pres_id: Optional[str] = None) -> str:
+        """
+        Store a presentation and return its ID.
+
+        If no ID is given, a new one is allocated atomically, so concurrent callers
+        never receive the same ID, even after presentations have been removed.
+        """
+        sizes = self._measure(presentation)
+        with self._lock:
+            if pres_id is None:
+                pres_id = f"presentation_{next(self._ids)}"
+                while pres_id in self._entries:
+                    pres_id = f"presentation_{next(self._ids)}"
+            previous, spills = self._store(pres_id, presentation, sizes)
+        if previous is not None:
+            self._release(previous)
+        self._spill_all(spills)
+        return pres_id
+
+    @contextmanager
+    def use(self, pres_id, write: bool = True):
+        """
+        Lock a presentation for use by the calling thread.
+
+        Many threads may read a presentation at the same time, while a writer has
+        it to itself. The presentation is not spilled while it is in use or a
+        thread is waiting to use it. Unknown IDs are not locked, so callers can
+        report them as errors.
+        """
+        with self._lock:
+            entry = self._entries.get(pres_id)
+            if entry is not None:
+                # Pinned before taking its lock, so it cannot be selected for spilling meanwhile
+                while entry["state"] == "spilling":
+                    self._idle.wait()
+                entry["pins"] += 1
+
+        if entry is None:
+            yield
+            return
+
+        try:
+            with entry["lock"].write() if write else entry["lock"].read():
+                yield
+        finally:
+            with self._lock:
+                entry["pins"] -= 1
+
+    def info(self, pres_id) -> Dict:
+        """Return residency and size information for a stored presentation."""
+        with self._lock:
+            entry = self._idle_entry(pres_id)
+            resident = entry["presentation"] is not None
+            if resident:
+                entry["pins"] += 1
+
+        if resident:
+            # Measured under the presentation's read lock, so it is not walked while being changed
+            try:
+                with entry["lock"].read():
+                    entry["size"], entry["slide_count"] = self._measure(entry["presentation"])
+            finally:
+                with self._lock:
+                    entry["pins"] -= 1
+
+        with self._lock:
+            return {
+                "presentation_id": pres_id,
+                "resident": resident,
+                "in_use": entry["pins"] > 0,
+                "approximate_size_bytes": entry["size"],
+                "slide_count": entry["slide_count"],
+                "spill_path": entry["spill_path"]
+            }
+
+    def _idle_entry(self, pres_id) -> Dict:
+        """Wait until no thread is loading or spilling a presentation and return its entry; needs the lock."""
+        entry = self._entries[pres_id]
+        while entry["state"] is not None:
+            self._idle.wait()
+            entry = self._entries[pres_id]
+        return entry
+
+    @staticmethod
+    def _measure(presentation) -> Tuple[int, int]:
+        return ppt_utils.estimate_presentation_size(presentation), ppt_utils.get_slide_count(presentation)
+
+    def _store(self, pres_id, presentation, sizes: Tuple[int, int]) -> Tuple[Optional[Dict], List[Dict]]:
+        """Store a presentation, returning the entry it replaces and the entries to spill; needs the lock."""
+        previous = self._idle_entry(pres_id) if pres_id in self._entries else None
+        self._entries[pres_id] = {
+            "presentation": presentation,
+            "size": sizes[0],
+            "slide_count": sizes[1],
+            "spill_path": None,
+            # Set while the presentation is being spilled or reloaded outside the lock
+            "state": None,
+            # Keep the lock of a replaced presentation, other threads may be waiting on it
+            "lock": previous["lock"] if previous is not None else ReadWriteLock(),
+            "pins": previous["pins"] if previous is not None else 0
+        }
+        self._entries.move_to_end(pres_id)
+        return previous, self._select_spills()
+
+    def _select_spills(self) -> List[Dict]:
+        """
+        Choose the least recently used presentations to spill until the store fits its budget.
+
+        The chosen entries are marked as spilling; the caller must pass them to
+        _spill_all() after releasing the lock. Needs the lock.
+        """
+        resident = [entry for entry in self._entries.values()
+                    if entry["presentation"] is not None and entry["state"] is None]
+        total_size = sum(entry["size"] for entry in resident)
+        over_count = len(resident) - self.max_count if self.max_count else 0
+
+        # The most recently used presentation is never spilled
+        spills = []
+        for entry in resident[:-1]:
+            over_size = self.max_bytes and total_size > self.max_bytes
+            if not (over_count > 0 or over_size):
+                break
+            if entry["pins"]:
+                continue
+
+            entry["state"] = "spilling"
+            spills.append(entry)
+            over_count -= 1
+            total_size -= entry["size"]
+        return spills
+
+    def _spill_all(self, entries: List[Dict]) -> None:
+        error = None
+        for entry in entries:
+            try:
+                self._spill(entry)
+            except Exception as e:
+                # The other entries must still be spilled or released from the spilling state
+                error = error or e
+        if error is not None:
+            raise error
+
+    def _spill(self, entry) -> None:
+        """Save a presentation marked by _select_spills() to the spill directory and drop it from memory."""
+        try:
+            with self._lock:
+                if self._spill_dir is None:
+                    self._spill_dir = tempfile.mkdtemp(prefix="ppt_mcp_")
+            fd, spill_path = tempfile.mkstemp(suffix=".pptx", dir=self._spill_dir)
+            os.close(fd)
+            ppt_utils.save_presentation(entry["presentation"], spill_path)
+            slide_count = ppt_utils.get_slide_count(entry["presentation"])
+            ppt_utils.release_presentation(entry["presentation"])
+        except BaseException:
+            # Stays in memory
+            with self._lock:
+                entry["state"] = None
+                self._idle.notify_all()
+            raise
+
+        with self._lock:
+            entry.update(presentation=None, spill_path=spill_path, slide_count=slide_count, state=None)
+            self._idle.notify_all()
+
+    def _release(self, entry) -> None:
+        """Free the memory or spill file of an entry that is removed or replaced."""
+        if entry["presentation"] is not None:
+            ppt_utils.release_presentation(entry["presentation"])
+        if entry["spill_path"] is not None and os.path.exists(entry["spill_path"]):
+            os.remove(entry["spill_path"])
+
+# Memory budget for the shared image cache
+ppt_utils.image_cache.max_bytes = int(os.environ.get("PPT_MCP_IMAGE_CACHE_MB", "256")) * 1024 * 1024
+
+# Server-wide policy for optimizing images when they are inserted
+image_optimization = {
+    "enabled": os.environ.get("PPT_MCP_OPTIMIZE_IMAGES", "0").lower() in ("1", "true", "yes"),
+    "target_dpi": int(os.environ.get("PPT_MCP_IMAGE_DPI", ppt_utils.DEFAULT_IMAGE_OPTIMIZATION["target_dpi"])),
+    "jpeg_quality": int(os.environ.get("PPT_MCP_JPEG_QUALITY", ppt_utils.DEFAULT_IMAGE_OPTIMIZATION["jpeg_quality"])),
+    "png_optimize": ppt_utils.DEFAULT_IMAGE_OPTIMIZATION["png_optimize"],
+    "strip_metadata": ppt_utils.DEFAULT_IMAGE_OPTIMIZATION["strip_metadata"]
+}
+
 # Global state to store presentations in memory
-presentations = {}
-current_presentation_id = None
+presentations = PresentationStore(
+    max_count=MAX_PRESENTATIONS,
+    max_bytes=MAX_PRESENTATION_MEMORY_MB * 1024 * 1024
+)
+
+class SessionRegistry:
+    """
+    Current presentation of each client session.
+
+    Every client connected to the server has its own current presentation, so
+    clients creating or opening presentations do not switch each other's default
+    target. Sessions are held weakly and forgotten when the client disconnects.
+    Calls made outside a client session share a default entry.
+    """
+
+    def __init__(self):
+        self._current = weakref.WeakKeyDictionary()
+        self._default = None
+        self._lock = threading.Lock()
+
+    def get_current(self, session) -> Optional[str]:
+        with self._lock:
+            if session is None:
+                return self._default
+            return self._current.get(session)
+
+    def set_current(self, session, pres_id: Optional[str]) -> None:
+        with self._lock:
+            if session is None:
+                self._default = pres_id
+            else:
+                self._current[session] = pres_id
+
+    def discard(self, pres_id: str) -> None:
+        """Clear the current presentation of every session that points to pres_id."""
+        with self._lock:
+            if self._default == pres_id:
+                self._default = None
+            for session, current in list(self._current.items()):
+                if current == pres_id:
+                    self._current[session] = None
+
+sessions = SessionRegistry()
+
+# Client session of the tool call being handled
+current_session = contextvars.ContextVar("current_session", default=None)
+
+class OperationJournal:
+    """
+    Write-ahead journal of the operations applied to open presentations.
+
+    Every presentation gets a directory holding checkpoints and journal segments:
+    checkpoint-<seq>.pptx is the presentation after operation <seq>, and
+    journal-<seq>.jsonl holds the operations from <seq> on, one compact JSON
+    record per line. Records are flushed and fsynced in batches by a background
+    thread. External inputs of the operations, such as image files and base64
+    payloads, are stored next to them as input-<sha1> files, once per content,
+    and the records refer to those. Checkpoints are written in the background
+    once enough time has passed or enough operations were recorded, after which
+    older checkpoints and segments and the inputs only they used are removed.
+
+    After a restart, recover() reopens the latest checkpoint of each presentation
+    and replays the operations recorded after it through the tools.
+    """
+
+    def __init__(self, directory: str, fsync_interval: float = 0.05,
+                 checkpoint_interval: float = 60, checkpoint_operations: int = 500):
+        self.directory = directory
+        self.fsync_interval = fsync_interval
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_operations = checkpoint_operations
+        self.recovered = {}
+        self._journals = {}
+        self._lock = threading.RLock()
+        self._checkpoint_requested = threading.Event()
+        self._threads = []
+
+    def start_background_threads(self) -> None:
+        """Start the threads that fsync records and write checkpoints."""
+        for target, name in ((self._fsync_loop, "ppt-mcp-journal-fsync"),
+                             (self._checkpoint_loop, "ppt-mcp-journal-checkpoint")):
+            thread = threading.Thread(target=target, name=name, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def start(self, pres_id: str, presentation, source_file: Optional[str] = None) -> None:
+        """
+        Start journaling a new presentation, replacing any previous journal for its ID.
+
+        The initial checkpoint is a copy of source_file if the presentation was just
+        opened from it, or the presentation itself otherwise.
+        """
+        self.discard(pres_id)
+        path = self._path_for(pres_id)
+        os.makedirs(path)
+
+        checkpoint_path = os.path.join(path, "checkpoint-0.pptx")
+        if source_file is not None:
+            shutil.copyfile(source_file, checkpoint_path)
+        else:
+            ppt_utils.write_presentation(presentation, checkpoint_path)
+
+        with self._lock:
+            self._journals[pres_id] = {
+                "path": path,
+                "segment": open(os.path.join(path, "journal-1.jsonl"), "a", encoding="utf-8"),
+                "seq": 0,
+                "checkpoint_seq": 0,
+                "checkpoint_time": time.monotonic(),
+                "unsynced": False,
+                "inputs": {}
+            }
+
+    def record(self, pres_id: str, tool_name: str, arguments: Dict) -> None:
+        """
+        Append an operation to the journal of a presentation.
+
+        The external inputs of the tool, see run_in_worker, are copied into the
+        journal first. Must be called while the presentation is locked for writing.
+        """
+        with self._lock:
+            journal = self._journals.get(pres_id)
+            if journal is None:
+                return
+
+        # Copy the inputs outside the lock, so large files do not hold up other presentations
+        arguments = {name: value for name, value in arguments.items() if name != "presentation_id"}
+        input_names = set()
+        arguments = self._copy_inputs(journal["path"], tool_name, arguments, input_names)
+
+        with self._lock:
+            journal["seq"] += 1
+            for input_name in input_names:
+                journal["inputs"][input_name] = journal["seq"]
+            record = {"seq": journal["seq"], "tool": tool_name, "args": arguments}
+            journal["segment"].write(json.dumps(record, separators=(",", ":"), default=str) + "\n")
+            journal["unsynced"] = True
+
+            if journal["seq"] - journal["checkpoint_seq"] >= self.checkpoint_operations:
+                self._checkpoint_requested.set()
+
+    def discard(self, pres_id: str) -> None:
+        """Stop journaling a presentation and remove its journal."""
+        with self._lock:
+            journal = self._journals.pop(pres_id, None)
+            if journal is not None:
+                journal["segment"].close()
+
+        path = self._path_for(pres_id)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+
+    def record_checkpoint(self, pres_id: str) -> None:
+        """
+        Journal an operation by writing a checkpoint of the presentation after it.
+
+        Used for operations that cannot be replayed on their own, such as copying
+        slides from another presentation, which may be closed or changed by the
+        time the journal is replayed. Must be called while the presentation is
+        locked for writing.
+        """
+        with self._lock:
+            journal = self._journals.get(pres_id)
+            if journal is None:
+                return
+            journal["seq"] += 1
+        self._checkpoint(pres_id)
+
+    def checkpoint(self, pres_id: str) -> None:
+        """Write a checkpoint of a presentation and drop the journal records it covers."""
+        # Operations are recorded while the presentation is locked for writing, so
+        # holding it for reading keeps the journal and the presentation in step
+        with presentations.use(pres_id, write=False):
+            self._checkpoint(pres_id)
+
+    def _checkpoint(self, pres_id: str) -> None:
+        """Write a checkpoint of a presentation that the caller has locked."""
+        with self._lock:
+            journal = self._journals.get(pres_id)
+            if journal is None or journal["seq"] == journal["checkpoint_seq"]:
+                return
+            seq = journal["seq"]
+            journal["segment"].flush()
+            os.fsync(journal["segment"].fileno())
+            journal["segment"].close()
+            journal["segment"] = open(os.path.join(journal["path"], f"journal-{seq + 1}.jsonl"),
+                                      "a", encoding="utf-8")
+
+        checkpoint_path = os.path.join(journal["path"], f"checkpoint-{seq}.pptx")
+        ppt_utils.save_presentation(presentations[pres_id], checkpoint_path + ".tmp", update_source=False)
+        with open(checkpoint_path + ".tmp", "rb") as checkpoint_file:
+            os.fsync(checkpoint_file.fileno())
+        os.replace(checkpoint_path + ".tmp", checkpoint_path)
+
+        # Remove the inputs of the operations the checkpoint covers, while no
+        # new operation can refer to them again
+        with self._lock:
+            for input_name, input_seq in list(journal["inputs"].items()):
+                if input_seq <= seq:
+                    del journal["inputs"][input_name]
+            live_inputs = set(journal["inputs"])
+        for file_name in os.listdir(journal["path"]):
+            if file_name.startswith("input-") and file_name not in live_inputs:
+                os.remove(os.path.join(journal["path"], file_name))
+
+        with self._lock:
+            journal["checkpoint_seq"] = seq
+            journal["checkpoint_time"] = time.monotonic()
+
+        # Remove the checkpoints and segments that are now superseded
+        for kind, file_seq, file_path in self._files(journal["path"]):
+            if file_seq < seq if kind == "checkpoint" else file_seq <= seq:
+                os.remove(file_path)
+
+    def recover(self, tools: Dict[str, Any]) -> Dict[str, Dict]:
+        """
+        Rebuild the presentations found in the journal directory.
+
+        Each presentation is reopened from its latest checkpoint, and the operations
+        recorded after it are replayed by calling the matching function in tools,
+        with the copies of their external inputs. A record that was only partly
+        written when the server stopped ends the replay of its presentation.
+
+        Returns:
+            A report per recovered presentation ID
+        """
+        if not os.path.isdir(self.directory):
+            return {}
+
+        for name in sorted(os.listdir(self.directory)):
+            path = os.path.join(self.directory, name)
+            files = self._files(path)
+            checkpoints = [(file_seq, file_path) for kind, file_seq, file_path in files if kind == "checkpoint"]
+            if not checkpoints:
+                continue
+
+            pres_id = urllib.parse.unquote(name)
+            checkpoint_seq, checkpoint_path = max(checkpoints)
+            presentations[pres_id] = ppt_utils.open_presentation(checkpoint_path, lazy=True)
+
+            seq, replayed, failed, inputs = checkpoint_seq, 0, [], {}
+            for record in self._read_records(files):
+                if record["seq"] <= seq:
+                    continue
+                seq = record["seq"]
+                input_names = set()
+                try:
+                    arguments = self._resolve_inputs(path, record["args"], input_names)
+                    result = tools[record["tool"]](**dict(arguments, presentation_id=pres_id))
+                    if isinstance(result, dict) and "error" in result:
+                        failed.append({"seq": seq, "tool": record["tool"], "error": result["error"]})
+                except Exception as e:
+                    failed.append({"seq": seq, "tool": record["tool"], "error": str(e)})
+                inputs.update(dict.fromkeys(input_names, seq))
+                replayed += 1
+
+            with self._lock:
+                self._journals[pres_id] = {
+                    "path": path,
+                    "segment": open(os.path.join(path, f"journal-{seq + 1}.jsonl"), "a", encoding="utf-8"),
+                    "seq": seq,
+                    "checkpoint_seq": checkpoint_seq,
+                    # Compact a replayed journal right away, rather than replaying it
+                    # again after another restart
+                    "checkpoint_time": float("-inf") if replayed else time.monotonic(),
+                    "unsynced": False,
+                    "inputs": inputs
+                }
+
+            self.recovered[pres_id] = {
+                "checkpoint_seq": checkpoint_seq,
+                "replayed": replayed,
+                "failed": failed
+            }
+
+        return self.recovered
+
+    def status(self) -> Dict:
+        """Return the journal state of each presentation."""
+        with self._lock:
+            return {
+                pres_id: {
+                    "seq": journal["seq"],
+                    "checkpoint_seq": journal["checkpoint_seq"],
+                    "path": journal["path"]
+                }
+                for pres_id, journal in self._journals.items()
+            }
+
+    def _path_for(self, pres_id: str) -> str:
+        return os.path.join(self.directory, urllib.parse.quote(pres_id, safe=""))
+
+    def _copy_inputs(self, path: str, tool_name: str, arguments: Dict, input_names: set) -> Dict:
+        """
+        Return the arguments of a tool call with its external inputs replaced by
+        references to copies in the journal directory, adding their names to
+        input_names. A file that cannot be read is recorded by its path.
+        """
+        inputs = tool_inputs.get(tool_name)
+        if not inputs:
+            return arguments
+
+        arguments = dict(arguments)
+        for name, kind in inputs.items():
+            value = arguments.get(name)
+            if value is None:
+                continue
+            if kind == "operations":
+                arguments[name] = [
+                    dict(operation, arguments=self._copy_inputs(path, operation.get("tool"),
+                                                                operation.get("arguments") or {}, input_names))
+                    for operation in value
+                ]
+                continue
+            try:
+                if kind == "file":
+                    with open(value, "rb") as input_file:
+                        input_name = self._store_input(path, input_file, os.path.splitext(value)[1].lower())
+                else:
+                    input_name = self._store_input(path, io.BytesIO(str(value).encode("utf-8")), "")
+            except OSError:
+                continue
+            arguments[name] = {f"${kind}": input_name}
+            input_names.add(input_name)
+        return arguments
+
+    @staticmethod
+    def _store_input(path: str, input_file, extension: str) -> str:
+        """Copy an input into a journal directory, named by its content, and return its file name."""
+        digest = hashlib.sha1()
+        fd, temp_path = tempfile.mkstemp(prefix="input-", suffix=".tmp", dir=path)
+        try:
+            with os.fdopen(fd, "wb") as temp_file:
+                for chunk in iter(lambda: input_file.read(ppt_utils.STREAM_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+                    temp_file.write(chunk)
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            input_name = f"input-{digest.hexdigest()}{extension}"
+            os.replace(temp_path, os.path.join(path, input_name))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return input_name
+
+    @classmethod
+    def _resolve_inputs(cls, path: str, value: Any, input_names: set) -> Any:
+        """Replace the input references in recorded arguments by the inputs, adding their names to input_names."""
+        if isinstance(value, list):
+            return [cls._resolve_inputs(path, item, input_names) for item in value]
+        if not isinstance(value, dict):
+            return value
+        if len(value) == 1 and ("$file" in value or "$data" in value):
+            input_name = value.get("$file") or value.get("$data")
+            input_names.add(input_name)
+            input_path = os.path.join(path, input_name)
+            if "$file" in value:
+                return input_path
+            with open(input_path, encoding="utf-8") as input_file:
+                return input_file.read()
+        return {name: cls._resolve_inputs(path, item, input_names) for name, item in value.items()}
+
+    @staticmethod
+    def _files(path: str) -> List:
+        """Return the (kind, seq, path) of the checkpoints and segments in a journal directory, by seq."""
+        files = []
+        for file_name in os.listdir(path):
+            match = re.fullmatch(r"(checkpoint|journal)-(\d+)\.(?:pptx|jsonl)", file_name)
+            if match:
+                files.append((match.group(1), int(match.group(2)), os.path.join(path, file_name)))
+        return sorted(files, key=lambda file: file[1])
+
+    @staticmethod
+    def _read_records(files: List):
+        for kind, _, file_path in files:
+            if kind != "journal":
+                continue
+            with open(file_path, encoding="utf-8") as segment:
+                for line in segment:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        return
+
+    def _fsync_loop(self) -> None:
+        while True:
+            time.sleep(self.fsync_interval)
+
+            # Flush under the lock, but fsync outside it so recording is not held up
+            with self._lock:
+                segments = []
+                for journal in self._journals.values():
+                    if journal["unsynced"]:
+                        journal["segment"].flush()
+                        journal["unsynced"] = False
+                        segments.append(journal["segment"])
+
+            for segment in segments:
+                try:
+                    os.fsync(segment.fileno())
+                except (OSError, ValueError):
+                    # Closed in the meantime, which syncs it first
+                    pass
+
+    def _checkpoint_loop(self) -> None:
+        while True:
+            self._checkpoint_requested.wait(timeout=1)
+            self._checkpoint_requested.clear()
+
+            now = time.monotonic()
+            with self._lock:
+                due = [
+                    pres_id for pres_id, journal in self._journals.items()
+                    if journal["seq"] > journal["checkpoint_seq"]
+                    and (now - journal["checkpoint_time"] >= self.checkpoint_interval
+                         or journal["seq"] - journal["checkpoint_seq"] >= self.checkpoint_operations)
+                ]
+
+            for pres_id in due:
+                # Spilled presentations are checkpointed once they are used again
+                if pres_id not in presentations or not presentations.info(pres_id)["resident"]:
+                    continue
+                try:
+                    self.checkpoint(pres_id)
+                except Exception:
+                    # The journal still holds the operations, try again next round
+                    pass
+
+# Operation journal for crash recovery, disabled unless a directory is configured
+JOURNAL_DIR = os.environ.get("PPT_MCP_JOURNAL_DIR")
+journal = OperationJournal(
+    JOURNAL_DIR,
+    fsync_interval=int(os.environ.get("PPT_MCP_JOURNAL_FSYNC_MS", "50")) / 1000,
+    checkpoint_interval=int(os.environ.get("PPT_MCP_CHECKPOINT_SECONDS", "60")),
+    checkpoint_operations=int(os.environ.get("PPT_MCP_CHECKPOINT_OPERATIONS", "500"))
+) if JOURNAL_DIR else None
+
+# Worker pool that runs the blocking python-pptx work of the tools
+TOOL_WORKERS = int(os.environ.get("PPT_MCP_WORKERS", "4"))
+tool_executor = ThreadPoolExecutor(max_workers=TOOL_WORKERS, thread_name_prefix="ppt-mcp-worker")
+
+# Synchronous implementations of the tools by name, used to replay the journal
+tool_functions = {}
+
+# Names of the tools that do not modify the presentation they target
+read_only_tools = set()
+
+# Arguments of each tool that name other presentations it reads, see run_in_worker
+tool_reads = {}
+
+# Arguments of each tool that refer to external inputs, see run_in_worker
+tool_inputs = {}
 
 # ---- Helper Functions ----
 
+def run_in_worker(func=None, *, read_only: bool = False, reads: Tuple[str, ...] = (),
+                  inputs: Dict[str, str] = None):
+    """
+    Make a tool asynchronous by running it in the worker pool.
+
+    While the tool runs, the presentation it targets is locked: calls on different
+    presentations run concurrently, calls on the same presentation run one at a
+    time, except for read_only tools, which can run alongside each other. A call
+    without a presentation_id is pinned to the client's current presentation when
+    it starts. The presentations named by the arguments listed in reads, also in
+    the operations of a batch, are locked for reading as well; all locks are taken
+    in order of presentation ID, so tools locking the same presentations cannot
+    deadlock. The synchronous function stays available as `__wrapped__`.
+
+    Successful calls of tools that modify a presentation are recorded in the
+    operation journal, if enabled. Calls that fail validation or return an error
+    leave the presentation as it was and are not recorded. Calls that read other
+    presentations are journaled as a checkpoint of the presentation after them. The arguments listed
+    in inputs are read from outside the server: "file" arguments name a file,
+    "data" arguments carry an inline payload and "operations" arguments hold
+    operations of other tools. The journal keeps a copy of what they refer to,
+    so replaying does not depend on files that may have changed or disappeared.
+    """
+    if func is None:
+        return functools.partial(run_in_worker, read_only=read_only, reads=reads, inputs=inputs)
+
+    takes_presentation = "presentation_id" in inspect.signature(func).parameters
+    tool_functions[func.__name__] = func
+    if reads:
+        tool_reads[func.__name__] = reads
+    if inputs:
+        tool_inputs[func.__name__] = inputs
+    if read_only:
+        read_only_tools.add(func.__name__)
+
+    def call(kwargs):
+        if not takes_presentation:
+            return func(**kwargs)
+
+        kwargs["presentation_id"] = resolve_presentation_id(kwargs.get("presentation_id"))
+
+        locks = {kwargs["presentation_id"]: not read_only}
+        for pres_id in presentations_read(func.__name__, kwargs):
+            locks.setdefault(pres_id, False)
+
+        with ExitStack() as stack:
+            for pres_id in sorted(locks, key=str):
+                stack.enter_context(presentations.use(pres_id, write=locks[pres_id]))
+            result = func(**kwargs)
+            if journal is not None and not read_only:
+                arguments = journaled_arguments(func.__name__, kwargs, result)
+                if arguments is None:
+                    pass
+                elif presentations_read(func.__name__, arguments) - {kwargs["presentation_id"]}:
+                    # Replaying would depend on the state of other presentations
+                    journal.record_checkpoint(kwargs["presentation_id"])
+                else:
+                    journal.record(kwargs["presentation_id"], func.__name__, arguments)
+            return result
+
+    @functools.wraps(func)
+    async def wrapper(**kwargs):
+        current_session.set(get_client_session())
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(tool_executor, contextvars.copy_context().run, call, kwargs)
+
+    return wrapper
+
+def presentations_read(tool_name: str, arguments: Dict) -> set:
+    """Return the IDs of the other presentations a tool call reads, including those read by a batch of operations."""
+    pres_ids = {arguments[name] for name in tool_reads.get(tool_name, ()) if isinstance(arguments.get(name), str)}
+    for name, kind in (tool_inputs.get(tool_name) or {}).items():
+        if kind == "operations" and isinstance(arguments.get(name), list):
+            for operation in arguments[name]:
+                if isinstance(operation, dict) and isinstance(operation.get("arguments"), dict):
+                    pres_ids |= presentations_read(operation.get("tool"), operation["arguments"])
+    return pres_ids
+
+def journaled_arguments(tool_name: str, arguments: Dict, result: Any) -> Optional[Dict]:
+    """
+    Return the arguments to record in the journal for a tool call, or None if it
+    changed nothing.
+
+    A batch of operations is recorded with only the operations that succeeded
+    and modified the presentation. Read-only operations are left out, so that
+    replaying a batch does not save over files written since, for example.
+    Arguments that default to a server setting are recorded with the value the
+    call used, since the setting may be different when the journal is replayed.
+    """
+    if isinstance(result, dict) and "error" in result:
+        return None
+    if tool_name == "apply_operations":
+        succeeded = {entry["index"] for entry in result["results"] if "error" not in entry["result"]}
+        operations = [dict(operation, arguments=_with_settings(operation["tool"], operation.get("arguments") or {}))
+                      for index, operation in enumerate(arguments["operations"])
+                      if index in succeeded and operation["tool"] not in read_only_tools]
+        if not operations:
+            return None
+        return dict(arguments, operations=operations)
+    return _with_settings(tool_name, arguments)
+
+def _with_settings(tool_name: str, arguments: Dict) -> Dict:
+    """Fill in the arguments of a tool call that default to a server setting."""
+    if "optimize" in inspect.signature(tool_functions[tool_name]).parameters and arguments.get("optimize") is None:
+        return dict(arguments, optimize=image_optimization["enabled"])
+    return arguments
+
+def get_client_session():
+    """Return the session of the client whose request is being handled, or None outside a request."""
+    try:
+        return app.get_context().request_context.session
+    except (LookupError, ValueError):
+        return None
+
+def get_current_presentation_id() -> Optional[str]:
+    """Get the ID of the calling client's current presentation."""
+    return sessions.get_current(current_session.get())
+
+def set_current_presentation_id(pres_id: Optional[str]) -> None:
+    """Set the calling client's current presentation."""
+    sessions.set_current(current_session.get(), pres_id)
+
+def resolve_presentation_id(presentation_id: Optional[str] = None) -> Optional[str]:
+    """Use the specified presentation or the calling client's current one."""
+    return presentation_id if presentation_id is not None else get_current_presentation_id()
+
 def get_current_presentation():
     """Get the current presentation object or raise an error if none is loaded."""
-    if current_presentation_id is None or current_presentation_id not in presentations:
+    pres_id = get_current_presentation_id()
+    if pres_id is None or pres_id not in presentations:
         raise ValueError("No presentation is currently loaded. Please create or open a presentation first.")
-    return presentations[current_presentation_id]
+    return presentations[pres_id]
+
+def get_image_optimization(optimize: Optional[bool] = None) -> Optional[Dict]:
+    """Return the image optimization options to use, or None if images should be embedded as is."""
+    enabled = image_optimization["enabled"] if optimize is None else optimize
+    if not enabled:
+        return None
+    return {key: value for key, value in image_optimization.items() if key != "enabled"}
+
+def image_optimization_report(original_bytes: int, picture) -> Dict:
+    """Report the size of an inserted image before and after optimization."""
+    embedded_bytes = len(picture.image.blob)
+    return {
+        "original_bytes": original_bytes,
+        "embedded_bytes": embedded_bytes,
+        "bytes_saved": original_bytes - embedded_bytes
+    }
 
 def validate_parameters(params):
     """
@@ -45,6 +985,21 @@ def validate_parameters(params):
                 return False, f"Parameter '{param_name}': {error_msg}"
     return True, None
 
+def select_fields(info: Dict, fields: Optional[List[str]]) -> Dict:
+    """
+    Project a dictionary onto a set of fields.
+    
+    Args:
+        info: The dictionary to project
+        fields: Keys to keep, or None to keep all keys
+        
+    Returns:
+        A dictionary with only the requested keys that are present in info
+    """
+    if fields is None:
+        return info
+    return {key: value for key, value in info.items() if key in fields}
+
 def is_positive(value):
     """Check if a value is positive."""
     return value > 0
@@ -67,102 +1022,220 @@ def is_valid_rgb(color_list):
         return False
     return all(isinstance(c, int) and 0 <= c <= 255 for c in color_list)
 
-def add_shape_direct(slide, shape_type: str, left: float, top: float, width: float, height: float) -> Any:
+def is_valid_rgb_list(color_lists):
+    """Check if a value is a non-empty list of valid RGB lists."""
+    return isinstance(color_lists, list) and len(color_lists) > 0 and all(is_valid_rgb(c) for c in color_lists)
+
+# ---- Parameter Schemas ----
+
+# Markers for constraints checked against the target presentation
+SLIDE_INDEX = "slide_index"
+SLIDE_INDICES = "slide_indices"
+SHAPE_INDEX = "shape_index"
+
+NO_PRESENTATION_ERROR = "No presentation is currently loaded or the specified ID is invalid"
+
+# Constraints shared by the tool schemas
+POSITIVE_INTEGER = (is_positive, "must be a positive integer")
+POSITIVE = (is_positive, "must be positive")
+NON_NEGATIVE = (is_non_negative, "must be non-negative")
+RGB_COLOR = (is_valid_rgb, "must be a valid RGB list [R, G, B] with values 0-255")
+RGB_COLORS = (is_valid_rgb_list, "must be a non-empty list of valid RGB lists [R, G, B] with values 0-255")
+HORIZONTAL_ALIGNMENT = (is_in_list(ppt_utils.ALIGNMENTS), f"must be one of {', '.join(ppt_utils.ALIGNMENTS.names)}")
+VERTICAL_ALIGNMENT = (is_in_list(ppt_utils.VERTICAL_ALIGNMENTS),
+                      f"must be one of {', '.join(ppt_utils.VERTICAL_ALIGNMENTS.names)}")
+LEGEND_POSITION = (is_in_list(ppt_utils.LEGEND_POSITIONS),
+                   f"must be one of {', '.join(ppt_utils.LEGEND_POSITIONS.names)}")
+DETAIL_LEVEL = (is_in_list(frozenset(DETAIL_LEVELS)), f"must be one of {', '.join(DETAIL_LEVELS)}")
+MAX_POINTS = (lambda x: isinstance(x, int) and x >= 3, "must be an integer of at least 3")
+SEARCH_QUERY = (lambda q: isinstance(q, str) and len(q) > 0, "must be a non-empty string")
+DOWNSAMPLE_METHOD = (is_in_list(ppt_utils.DOWNSAMPLE_METHODS),
+                     f"must be one of {', '.join(ppt_utils.DOWNSAMPLE_METHODS)}")
+
+def _check_slide_index(presentation, arguments, value):
+    slide_count = ppt_utils.get_slide_count(presentation)
+    if not 0 <= value < slide_count:
+        return f"Invalid slide index: {value}. Available slides: 0-{slide_count - 1}"
+    return None
+
+def _check_slide_indices(presentation, arguments, value):
+    slide_count = ppt_utils.get_slide_count(presentation)
+    if not all(0 <= i < slide_count for i in value):
+        return f"Parameter 'slide_indices': slide indices must be in 0-{slide_count - 1}"
+    return None
+
+def _check_shape_index(presentation, arguments, value):
+    slide = ppt_utils.get_slide(presentation, arguments["slide_index"])
+    shape_count = len(ppt_utils.get_shapes(presentation, slide))
+    if not 0 <= value < shape_count:
+        return f"Invalid shape index: {value}. Available shapes: 0-{shape_count - 1}"
+    return None
+
+_PRESENTATION_CHECKS = {
+    SLIDE_INDEX: _check_slide_index,
+    SLIDE_INDICES: _check_slide_indices,
+    SHAPE_INDEX: _check_shape_index
+}
+
+def compile_schema(schema: Dict[str, List]):
     """
-    Add an auto shape to a slide using direct integer values instead of enum objects.
+    Compile a declarative parameter schema into a validator function.
     
-    This implementation provides a reliable alternative that bypasses potential 
-    enum-related issues in the python-pptx library.
+    The schema maps parameter names to lists of constraints. A constraint is a
+    (check, message) pair as used by validate_parameters, or one of the markers
+    SLIDE_INDEX, SLIDE_INDICES and SHAPE_INDEX, which check indices against the
+    target presentation. Parameters whose value is None are not checked.
+    Constraints are checked in schema order and error messages are built once,
+    so a call only evaluates the checks.
     
     Args:
-        slide: The slide object
-        shape_type: Shape type string (e.g., 'rectangle', 'oval', 'triangle')
-        left: Left position in inches
-        top: Top position in inches
-        width: Width in inches
-        height: Height in inches
+        schema: Dictionary of parameter name: constraints
         
     Returns:
-        The created shape
+        A function taking the arguments of a call and returning an error message,
+        or None if all arguments are valid
     """
-    from pptx.util import Inches
-    
-    # Direct mapping of shape types to their integer values
-    # These values are directly from the MS Office VBA documentation
-    shape_type_map = {
-        'rectangle': 1,
-        'rounded_rectangle': 2, 
-        'oval': 9,
-        'diamond': 4,
-        'triangle': 5,  # This is ISOSCELES_TRIANGLE
-        'right_triangle': 6,
-        'pentagon': 56,
-        'hexagon': 10,
-        'heptagon': 11,
-        'octagon': 12,
-        'star': 12,  # This is STAR_5_POINTS (value 12)
-        'arrow': 13,
-        'cloud': 35,
-        'heart': 21,
-        'lightning_bolt': 22,
-        'sun': 23,
-        'moon': 24,
-        'smiley_face': 17,
-        'no_symbol': 19,
-        'flowchart_process': 112,
-        'flowchart_decision': 114,
-        'flowchart_data': 115,
-        'flowchart_document': 119
-    }
+    checks = []
+    uses_presentation = False
+    for param_name, constraints in schema.items():
+        for constraint in constraints:
+            if isinstance(constraint, str):
+                checks.append((param_name, None, _PRESENTATION_CHECKS[constraint]))
+                uses_presentation = True
+            else:
+                constraint_func, error_msg = constraint
+                checks.append((param_name, constraint_func, f"Parameter '{param_name}': {error_msg}"))
+    checks = tuple(checks)
+    
+    def validator(arguments: Dict) -> Optional[str]:
+        presentation = None
+        if uses_presentation:
+            pres_id = resolve_presentation_id(arguments.get("presentation_id"))
+            if pres_id is None or pres_id not in presentations:
+                return NO_PRESENTATION_ERROR
+            presentation = presentations[pres_id]
+        for param_name, constraint_func, error in checks:
+            value = arguments.get(param_name)
+            if value is None:
+                continue
+            if constraint_func is None:
+                message = error(presentation, arguments, value)
+                if message is not None:
+                    return message
+            elif not constraint_func(value):
+                return error
+        return None
+    
+    return validator
+
+def validate_arguments(schema: Dict[str, List]):
+    """
+    Validate the arguments of a tool against a schema before the tool runs.
     
-    # Check if shape type is valid before trying to use it
-    shape_type_lower = str(shape_type).lower()
-    if shape_type_lower not in shape_type_map:
-        available_shapes = ', '.join(sorted(shape_type_map.keys()))
-        raise ValueError(f"Unsupported shape type: '{shape_type}'. Available shape types: {available_shapes}")
+    The schema is compiled once, when the tool is defined. Invalid calls return
+    {"error": message} without running the tool. The check is part of the tool's
+    synchronous function, so direct calls, batch operations and journal replays
+    are validated the same way.
     
-    # Get the integer value for the shape type
-    shape_value = shape_type_map[shape_type_lower]
+    Args:
+        schema: Dictionary of parameter name: constraints, see compile_schema
+    """
+    validator = compile_schema(schema)
+    
+    def decorator(func):
+        parameters = inspect.signature(func).parameters
+        names = tuple(parameters)
+        defaults = {
+            name: parameter.default
+            for name, parameter in parameters.items()
+            if parameter.default is not inspect.Parameter.empty
+        }
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            arguments = {**defaults, **dict(zip(names, args)), **kwargs}
+            error = validator(arguments)
+            if error is not None:
+                return {"error": error}
+            return func(*args, **kwargs)
+        
+        wrapper.validator = validator
+        return wrapper
     
-    # Create the shape using the direct integer value
-    try:
-        # The integer value is passed directly to add_shape
-        shape = slide.shapes.add_shape(
-            shape_value, Inches(left), Inches(top), Inches(width), Inches(height)
-        )
-        return shape
-    except Exception as e:
-        raise ValueError(f"Failed to create '{shape_type}' shape using direct value {shape_value}: {str(e)}")
+    return decorator
 
 # ---- Presentation Tools ----
 
 @app.tool()
-def create_presentation(id: Optional[str] = None) -> Dict:
-    """Create a new PowerPoint presentation."""
-    global current_presentation_id
-    
+@run_in_worker
+def create_presentation(id: Optional[str] = None, template: Optional[str] = None) -> Dict:
+    """Create a new PowerPoint presentation.
+
+    Args:
+        id: ID for the new presentation, generated if not provided
+        template: Name of a registered template or path to a .pptx file to create
+            the presentation from. Uses the default template if not provided.
+    """
     # Create a new presentation
-    pres = ppt_utils.create_presentation()
-    
-    # Generate an ID if not provided
-    if id is None:
-        id = f"presentation_{len(presentations) + 1}"
+    try:
+        pres = ppt_utils.create_presentation(template)
+    except Exception as e:
+        return {
+            "error": f"Failed to create presentation: {str(e)}"
+        }
     
-    # Store the presentation
-    presentations[id] = pres
-    current_presentation_id = id
+    # Store the presentation, generating an ID if not provided
+    id = presentations.add(pres, id)
+    set_current_presentation_id(id)
+    if journal is not None:
+        journal.start(id, pres)
     
     return {
         "presentation_id": id,
         "message": f"Created new presentation with ID: {id}",
-        "slide_count": len(pres.slides)
+        "slide_count": ppt_utils.get_slide_count(pres)
     }
 
 @app.tool()
-def open_presentation(file_path: str, id: Optional[str] = None) -> Dict:
-    """Open an existing PowerPoint presentation from a file."""
-    global current_presentation_id
-    
+@run_in_worker
+def register_template(name: str, file_path: str) -> Dict:
+    """Register a .pptx file as a named template for create_presentation.
+
+    The template is parsed once and new presentations are cloned from it, which is
+    much faster than opening the file for every new presentation.
+    """
+    try:
+        ppt_utils.template_registry.register(name, file_path)
+    except Exception as e:
+        return {
+            "error": f"Failed to register template: {str(e)}"
+        }
+
+    return {
+        "message": f"Registered template '{name}' from {file_path}",
+        "name": name,
+        "file_path": file_path
+    }
+
+@app.tool()
+@run_in_worker
+def list_templates() -> Dict:
+    """List the registered presentation templates."""
+    return {
+        "templates": [
+            {"name": name, "file_path": file_path}
+            for name, file_path in ppt_utils.template_registry.templates().items()
+        ]
+    }
+
+@app.tool()
+@run_in_worker
+def open_presentation(file_path: str, id: Optional[str] = None, lazy: bool = False) -> Dict:
+    """Open an existing PowerPoint presentation from a file.
+
+    With lazy=True, slides are only parsed when they are first used, which makes
+    opening large decks to read their info or edit a few slides much faster.
+    """
     # Check if file exists
     if not os.path.exists(file_path):
         return {
@@ -171,31 +1244,83 @@ def open_presentation(file_path: str, id: Optional[str] = None) -> Dict:
     
     # Open the presentation
     try:
-        pres = ppt_utils.open_presentation(file_path)
+        pres = ppt_utils.open_presentation(file_path, lazy=lazy)
     except Exception as e:
         return {
             "error": f"Failed to open presentation: {str(e)}"
         }
     
-    # Generate an ID if not provided
-    if id is None:
-        id = f"presentation_{len(presentations) + 1}"
-    
-    # Store the presentation
-    presentations[id] = pres
-    current_presentation_id = id
+    # Store the presentation, generating an ID if not provided
+    id = presentations.add(pres, id)
+    set_current_presentation_id(id)
+    if journal is not None:
+        journal.start(id, pres, source_file=file_path)
     
     return {
         "presentation_id": id,
         "message": f"Opened presentation from {file_path} with ID: {id}",
-        "slide_count": len(pres.slides)
+        "slide_count": ppt_utils.get_slide_count(pres)
+    }
+
+@app.tool()
+@run_in_worker
+def merge_decks(file_paths: List[str], output_path: Optional[str] = None, id: Optional[str] = None) -> Dict:
+    """Merge deck files into one new presentation.
+
+    The first deck is the base: its slide master, layouts and theme are kept, and the
+    slides of the other decks are appended in order, mapped onto its layouts by name.
+    Images and media that are identical across decks are stored once.
+
+    Args:
+        file_paths: Paths of the .pptx files to merge, the base first
+        output_path: File to save the merged presentation to, if given
+        id: ID for the merged presentation, generated if not given
+    """
+    if not file_paths:
+        return {
+            "error": "file_paths must list at least one deck"
+        }
+    missing = [file_path for file_path in file_paths if not os.path.exists(file_path)]
+    if missing:
+        return {
+            "error": f"File not found: {', '.join(missing)}"
+        }
+    
+    try:
+        pres = ppt_utils.open_presentation(file_paths[0], lazy=True)
+        reports = ppt_utils.merge_decks(pres, file_paths[1:])
+    except Exception as e:
+        return {
+            "error": f"Failed to merge decks: {str(e)}"
+        }
+    
+    id = presentations.add(pres, id)
+    set_current_presentation_id(id)
+    if journal is not None:
+        journal.start(id, pres)
+    
+    result = {
+        "presentation_id": id,
+        "message": f"Merged {len(file_paths)} decks with ID: {id}",
+        "slide_count": ppt_utils.get_slide_count(pres),
+        "merged": reports
     }
+    
+    if output_path is not None:
+        try:
+            result["file_path"] = ppt_utils.save_presentation(pres, output_path)
+            result["file_size"] = os.path.getsize(output_path)
+        except Exception as e:
+            result["warning"] = f"Decks merged but failed to save: {str(e)}"
+    
+    return result
 
 @app.tool()
+@run_in_worker(read_only=True)
 def save_presentation(file_path: str, presentation_id: Optional[str] = None) -> Dict:
     """Save a presentation to a file."""
     # Use the specified presentation or the current one
-    pres_id = presentation_id if presentation_id is not None else current_presentation_id
+    pres_id = resolve_presentation_id(presentation_id)
     
     if pres_id is None or pres_id not in presentations:
         return {
@@ -215,10 +1340,26 @@ def save_presentation(file_path: str, presentation_id: Optional[str] = None) ->
         }
 
 @app.tool()
-def get_presentation_info(presentation_id: Optional[str] = None) -> Dict:
-    """Get information about a presentation."""
+@run_in_worker(read_only=True)
+@validate_arguments({
+    "detail": [DETAIL_LEVEL]
+})
+def get_presentation_info(
+    detail: str = "full",
+    fields: Optional[List[str]] = None,
+    presentation_id: Optional[str] = None
+) -> Dict:
+    """
+    Get information about a presentation.
+
+    Args:
+        detail: 'ids' for the slide ids only, 'summary' for the title and layout names,
+            or 'full' for all layouts and core properties
+        fields: Top-level fields to return, all fields if not given
+        presentation_id: Presentation to describe, the current one if not given
+    """
     # Use the specified presentation or the current one
-    pres_id = presentation_id if presentation_id is not None else current_presentation_id
+    pres_id = resolve_presentation_id(presentation_id)
     
     if pres_id is None or pres_id not in presentations:
         return {
@@ -227,20 +1368,94 @@ def get_presentation_info(presentation_id: Optional[str] = None) -> Dict:
     
     pres = presentations[pres_id]
     
-    # Get slide layouts
-    layouts = ppt_utils.get_slide_layouts(pres)
-    
-    # Get core properties
-    core_props = ppt_utils.get_core_properties(pres)
+    info = {
+        "presentation_id": pres_id,
+        "slide_count": ppt_utils.get_slide_count(pres)
+    }
+    if detail == "ids":
+        info["slide_ids"] = ppt_utils.get_presentation_index(pres).slide_ids()
+    elif detail == "summary":
+        info["title"] = pres.core_properties.title
+        info["slide_layouts"] = [layout.name for layout in pres.slide_layouts]
+    else:
+        # Get slide layouts
+        info["slide_layouts"] = ppt_utils.get_slide_layouts(pres)
+        
+        # Get core properties
+        info["core_properties"] = ppt_utils.get_core_properties(pres)
     
+    return select_fields(info, fields)
+
+@app.tool()
+@run_in_worker
+def close_presentation(presentation_id: Optional[str] = None) -> Dict:
+    """Close a presentation and release its memory. Unsaved changes are discarded."""
+    # Use the specified presentation or the current one
+    pres_id = resolve_presentation_id(presentation_id)
+
+    if pres_id is None or pres_id not in presentations:
+        return {
+            "error": "No presentation is currently loaded or the specified ID is invalid"
+        }
+
+    del presentations[pres_id]
+    sessions.discard(pres_id)
+    if journal is not None:
+        journal.discard(pres_id)
+
     return {
-        "presentation_id": pres_id,
-        "slide_count": len(pres.slides),
-        "slide_layouts": layouts,
-        "core_properties": core_props
+        "message": f"Closed presentation {pres_id}",
+        "presentation_id": pres_id
+    }
+
+@app.tool()
+@run_in_worker
+def list_presentations() -> Dict:
+    """List open presentations with their memory residency and approximate size.
+
+    Presentations that have not been used recently may be spilled to a temporary
+    file to stay within the server's memory budget; they are reloaded automatically
+    on next use.
+    """
+    current_id = get_current_presentation_id()
+    pres_infos = []
+    for pres_id in presentations:
+        pres_info = presentations.info(pres_id)
+        pres_info["current"] = pres_id == current_id
+        pres_infos.append(pres_info)
+
+    return {
+        "presentations": pres_infos,
+        "resident_count": sum(1 for p in pres_infos if p["resident"]),
+        "resident_size_bytes": sum(p["approximate_size_bytes"] for p in pres_infos if p["resident"]),
+        "max_presentations": presentations.max_count,
+        "max_memory_bytes": presentations.max_bytes
     }
 
 @app.tool()
+@run_in_worker
+def get_journal_status() -> Dict:
+    """Get the state of the operation journal used to recover presentations after a restart.
+
+    Shows, per open presentation, the number of journaled operations and the
+    operation the latest checkpoint covers, and which presentations were
+    recovered when the server started.
+    """
+    if journal is None:
+        return {
+            "enabled": False,
+            "message": "The operation journal is disabled. Set PPT_MCP_JOURNAL_DIR to enable it."
+        }
+
+    return {
+        "enabled": True,
+        "directory": journal.directory,
+        "presentations": journal.status(),
+        "recovered": journal.recovered
+    }
+
+@app.tool()
+@run_in_worker
 def set_core_properties(
     title: Optional[str] = None,
     subject: Optional[str] = None,
@@ -251,7 +1466,7 @@ def set_core_properties(
 ) -> Dict:
     """Set core document properties."""
     # Use the specified presentation or the current one
-    pres_id = presentation_id if presentation_id is not None else current_presentation_id
+    pres_id = resolve_presentation_id(presentation_id)
     
     if pres_id is None or pres_id not in presentations:
         return {
@@ -262,6 +1477,7 @@ def set_core_properties(
     
     # Set core properties
     try:
+        ppt_utils.mark_modified(pres.core_properties)
         ppt_utils.set_core_properties(
             pres, title=title, subject=subject, author=author, 
             keywords=keywords, comments=comments
@@ -282,6 +1498,7 @@ def set_core_properties(
 # ---- Slide Tools ----
 
 @app.tool()
+@run_in_worker
 def add_slide(
     layout_index: int = 1,
     title: Optional[str] = None,
@@ -289,7 +1506,7 @@ def add_slide(
 ) -> Dict:
     """Add a new slide to the presentation."""
     # Use the specified presentation or the current one
-    pres_id = presentation_id if presentation_id is not None else current_presentation_id
+    pres_id = resolve_presentation_id(presentation_id)
     
     if pres_id is None or pres_id not in presentations:
         return {
@@ -306,6 +1523,7 @@ def add_slide(
         }
     
     # Add the slide
+    ppt_utils.mark_modified(pres.part)
     slide, error = ppt_utils.safe_operation(
         "add_slide",
         lambda: ppt_utils.add_slide(pres, layout_index)
@@ -323,7 +1541,7 @@ def add_slide(
         if error:
             return {
                 "warning": f"Slide created but failed to set title: {error}",
-                "slide_index": len(pres.slides) - 1,
+                "slide_index": ppt_utils.get_slide_count(pres) - 1,
                 "layout_name": slide[1].name
             }
     
@@ -338,16 +1556,35 @@ def add_slide(
     
     return {
         "message": f"Added slide with layout '{slide[1].name}'",
-        "slide_index": len(pres.slides) - 1,
+        "slide_index": ppt_utils.get_slide_count(pres) - 1,
         "layout_name": slide[1].name,
         "placeholders": placeholders
     }
 
 @app.tool()
-def get_slide_info(slide_index: int, presentation_id: Optional[str] = None) -> Dict:
-    """Get information about a specific slide."""
+@run_in_worker(read_only=True)
+@validate_arguments({
+    "slide_index": [SLIDE_INDEX],
+    "detail": [DETAIL_LEVEL]
+})
+def get_slide_info(
+    slide_index: int,
+    detail: str = "full",
+    fields: Optional[List[str]] = None,
+    presentation_id: Optional[str] = None
+) -> Dict:
+    """
+    Get information about a specific slide.
+
+    Args:
+        slide_index: Index of the slide
+        detail: 'ids' for the shape ids only, 'summary' for the title, a text preview and the
+            name and type of each shape, or 'full' for placeholders and shape positions
+        fields: Fields to return for each shape, all fields if not given
+        presentation_id: Presentation containing the slide, the current one if not given
+    """
     # Use the specified presentation or the current one
-    pres_id = presentation_id if presentation_id is not None else current_presentation_id
+    pres_id = resolve_presentation_id(presentation_id)
     
     if pres_id is None or pres_id not in presentations:
         return {
@@ -356,38 +1593,152 @@ def get_slide_info(slide_index: int, presentation_id: Optional[str] = None) -> D
     
     pres = presentations[pres_id]
     
-    # Check if slide index is valid
-    if slide_index < 0 or slide_index >= len(pres.slides):
+    index = ppt_utils.get_presentation_index(pres)
+    slide = index.slide(slide_index)
+    
+    if detail == "ids":
         return {
-            "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
+            "slide_index": slide_index,
+            "slide_id": index.slide_ids()[slide_index],
+            "shape_ids": [record["shape_id"] for record in index.shape_records(slide)]
         }
     
-    slide = pres.slides[slide_index]
+    if detail == "summary":
+        info = ppt_utils.get_slide_outline(pres, slide_index)
+        del info["shape_count"]
+        info["shapes"] = [
+            select_fields({
+                "index": i,
+                "shape_id": record["shape_id"],
+                "name": record["name"],
+                "shape_type": record["shape_type"]
+            }, fields)
+            for i, record in enumerate(index.shape_records(slide))
+        ]
+        return info
     
     # Get placeholders
     placeholders = ppt_utils.get_placeholders(slide)
     
-    # Get shapes information
+    # Get shapes information, reading names and positions from the index
     shapes_info = []
-    for i, shape in enumerate(slide.shapes):
+    for i, (shape, record) in enumerate(zip(index.shapes(slide), index.shape_records(slide))):
         shape_info = {
             "index": i,
-            "name": shape.name,
+            "shape_id": record["shape_id"],
+            "name": record["name"],
             "shape_type": str(shape.shape_type),
-            "width": shape.width.inches,
-            "height": shape.height.inches,
-            "left": shape.left.inches,
-            "top": shape.top.inches
+            "width": record["width"],
+            "height": record["height"],
+            "left": record["left"],
+            "top": record["top"]
+        }
+        shapes_info.append(select_fields(shape_info, fields))
+    
+    return {
+        "slide_index": slide_index,
+        "placeholders": placeholders,
+        "shapes": shapes_info
+    }
+
+@app.tool()
+@run_in_worker(read_only=True)
+@validate_arguments({
+    "slide_indices": [SLIDE_INDICES],
+    "max_text_length": [NON_NEGATIVE]
+})
+def get_presentation_outline(
+    slide_indices: Optional[List[int]] = None,
+    max_text_length: int = 80,
+    fields: Optional[List[str]] = None,
+    presentation_id: Optional[str] = None
+) -> Dict:
+    """
+    Get a compact digest of every slide of a presentation in one call.
+
+    Args:
+        slide_indices: Slides to include, all slides if not given
+        max_text_length: Maximum length of the text preview of each slide
+        fields: Fields to return for each slide (slide_index, slide_id, layout, title,
+            shape_count, text), all fields if not given
+        presentation_id: Presentation to outline, the current one if not given
+
+    Returns:
+        The layout, title, shape count and a text preview of each slide
+    """
+    pres_id = resolve_presentation_id(presentation_id)
+    
+    if pres_id is None or pres_id not in presentations:
+        return {
+            "error": "No presentation is currently loaded or the specified ID is invalid"
+        }
+    
+    pres = presentations[pres_id]
+    slide_count = ppt_utils.get_slide_count(pres)
+    
+    if slide_indices is None:
+        slide_indices = range(slide_count)
+    return {
+        "presentation_id": pres_id,
+        "slide_count": slide_count,
+        "slides": [
+            select_fields(ppt_utils.get_slide_outline(pres, i, max_text_length), fields)
+            for i in slide_indices
+        ]
+    }
+
+@app.tool()
+@run_in_worker(read_only=True)
+@validate_arguments({
+    "slide_indices": [SLIDE_INDICES],
+    "mode": [(is_in_list(frozenset(["intersects", "within"])), "must be 'intersects' or 'within'")],
+    "bbox": [(lambda b: len(b) == 4 and b[2] >= 0 and b[3] >= 0,
+              "must be [left, top, width, height] with a non-negative size")]
+})
+def find_shapes(
+    name: Optional[str] = None,
+    shape_type: Optional[str] = None,
+    bbox: Optional[List[float]] = None,
+    mode: str = "intersects",
+    slide_indices: Optional[List[int]] = None,
+    presentation_id: Optional[str] = None
+) -> Dict:
+    """
+    Find shapes by name, type or position across the slides of a presentation.
+
+    Args:
+        name: Case-insensitive substring of the shape name
+        shape_type: Shape type name, e.g. 'PICTURE', 'TABLE', 'CHART', 'AUTO_SHAPE' or 'TEXT_BOX'
+        bbox: Bounding box [left, top, width, height] in inches
+        mode: 'intersects' to match shapes overlapping the box, 'within' to match shapes inside it
+        slide_indices: Slides to search, all slides if not given
+        presentation_id: Presentation to search, the current one if not given
+
+    Returns:
+        The matching shapes with their slide index, shape index, id, name, type and position
+    """
+    pres_id = resolve_presentation_id(presentation_id)
+    
+    if pres_id is None or pres_id not in presentations:
+        return {
+            "error": "No presentation is currently loaded or the specified ID is invalid"
         }
-        shapes_info.append(shape_info)
     
+    pres = presentations[pres_id]
+    
+    matches = ppt_utils.get_presentation_index(pres).find_shapes(
+        name=name, shape_type=shape_type, bbox=bbox, mode=mode, slide_indices=slide_indices
+    )
     return {
-        "slide_index": slide_index,
-        "placeholders": placeholders,
-        "shapes": shapes_info
+        "shapes": matches,
+        "count": len(matches)
     }
 
 @app.tool()
+@run_in_worker
+@validate_arguments({
+    "slide_index": [SLIDE_INDEX]
+})
 def populate_placeholder(
     slide_index: int,
     placeholder_idx: int,
@@ -396,7 +1747,7 @@ def populate_placeholder(
 ) -> Dict:
     """Populate a placeholder with text."""
     # Use the specified presentation or the current one
-    pres_id = presentation_id if presentation_id is not None else current_presentation_id
+    pres_id = resolve_presentation_id(presentation_id)
     
     if pres_id is None or pres_id not in presentations:
         return {
@@ -405,13 +1756,8 @@ def populate_placeholder(
     
     pres = presentations[pres_id]
     
-    # Check if slide index is valid
-    if slide_index < 0 or slide_index >= len(pres.slides):
-        return {
-            "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-        }
-    
-    slide = pres.slides[slide_index]
+    slide = ppt_utils.get_slide(pres, slide_index)
+    ppt_utils.mark_modified(slide.part)
     
     try:
         # Check if placeholder exists
@@ -432,6 +1778,10 @@ def populate_placeholder(
         }
 
 @app.tool()
+@run_in_worker
+@validate_arguments({
+    "slide_index": [SLIDE_INDEX]
+})
 def add_bullet_points(
     slide_index: int,
     placeholder_idx: int,
@@ -440,7 +1790,7 @@ def add_bullet_points(
 ) -> Dict:
     """Add bullet points to a placeholder."""
     # Use the specified presentation or the current one
-    pres_id = presentation_id if presentation_id is not None else current_presentation_id
+    pres_id = resolve_presentation_id(presentation_id)
     
     if pres_id is None or pres_id not in presentations:
         return {
@@ -449,13 +1799,8 @@ def add_bullet_points(
     
     pres = presentations[pres_id]
     
-    # Check if slide index is valid
-    if slide_index < 0 or slide_index >= len(pres.slides):
-        return {
-            "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-        }
-    
-    slide = pres.slides[slide_index]
+    slide = ppt_utils.get_slide(pres, slide_index)
+    ppt_utils.mark_modified(slide.part)
     
     try:
         # Check if placeholder exists
@@ -478,9 +1823,150 @@ def add_bullet_points(
             "error": f"Failed to add bullet points: {str(e)}"
         }
 
+@app.tool()
+@run_in_worker
+@validate_arguments({
+    "slide_index": [SLIDE_INDEX],
+    "insert_index": [NON_NEGATIVE]
+})
+def duplicate_slide(
+    slide_index: int,
+    insert_index: Optional[int] = None,
+    presentation_id: Optional[str] = None
+) -> Dict:
+    """Duplicate a slide, including its charts and notes; images are shared with the original.
+
+    Args:
+        slide_index: Index of the slide to duplicate
+        insert_index: Index to insert the copy at, by default right after the slide
+        presentation_id: ID of the presentation, the current one by default
+    """
+    pres_id = resolve_presentation_id(presentation_id)
+    
+    if pres_id is None or pres_id not in presentations:
+        return {
+            "error": "No presentation is currently loaded or the specified ID is invalid"
+        }
+    
+    pres = presentations[pres_id]
+    
+    try:
+        result = ppt_utils.duplicate_slide(pres, slide_index, insert_index)
+    except IndexError as e:
+        return {
+            "error": f"Invalid insert index: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            "error": f"Failed to duplicate slide: {str(e)}"
+        }
+    
+    return dict({"message": f"Duplicated slide {slide_index}", "slide_index": result["slide_indices"][0]}, **result)
+
+@app.tool()
+@run_in_worker(reads=("source_presentation_id",))
+@validate_arguments({
+    "insert_index": [NON_NEGATIVE]
+})
+def copy_slides(
+    source_presentation_id: str,
+    slide_indices: List[int],
+    insert_index: Optional[int] = None,
+    presentation_id: Optional[str] = None
+) -> Dict:
+    """Copy slides from another open presentation, or within one, in a single operation.
+
+    Slides are copied with their charts, embedded workbooks and notes. Images and
+    media are not re-encoded: identical media already in the target is reused.
+    Slide layouts are matched by name in the target.
+
+    Args:
+        source_presentation_id: ID of the presentation to copy from
+        slide_indices: Indices of the slides to copy, in the order to insert them
+        insert_index: Index to insert the copies at, by default after the last slide
+        presentation_id: ID of the presentation to copy to, the current one by default
+    """
+    pres_id = resolve_presentation_id(presentation_id)
+    
+    if pres_id is None or pres_id not in presentations:
+        return {
+            "error": "No presentation is currently loaded or the specified ID is invalid"
+        }
+    if source_presentation_id not in presentations:
+        return {
+            "error": f"Source presentation not found: {source_presentation_id}"
+        }
+    
+    pres = presentations[pres_id]
+    source = presentations[source_presentation_id]
+    
+    slide_count = ppt_utils.get_slide_count(source)
+    invalid = [i for i in slide_indices if not isinstance(i, int) or not 0 <= i < slide_count]
+    if invalid or not slide_indices:
+        return {
+            "error": f"Invalid slide indices: {invalid or slide_indices}. Available slides in the source: 0-{slide_count - 1}"
+        }
+    
+    try:
+        result = ppt_utils.copy_slides(source, pres, slide_indices, insert_index)
+    except IndexError as e:
+        return {
+            "error": f"Invalid insert index: {str(e)}"
+        }
+    except Exception as e:
+        return {
+            "error": f"Failed to copy slides: {str(e)}"
+        }
+    
+    return dict({"message": f"Copied {len(slide_indices)} slides from {source_presentation_id}"}, **result)
+
+@app.tool()
+@run_in_worker
+def reorder_slides(
+    order: List[int],
+    presentation_id: Optional[str] = None
+) -> Dict:
+    """Reorder the slides of a presentation.
+
+    Args:
+        order: The current slide indices in their new order, listing every slide once,
+            e.g. [2, 0, 1] moves the third slide to the front
+        presentation_id: ID of the presentation, the current one by default
+    """
+    pres_id = resolve_presentation_id(presentation_id)
+    
+    if pres_id is None or pres_id not in presentations:
+        return {
+            "error": "No presentation is currently loaded or the specified ID is invalid"
+        }
+    
+    pres = presentations[pres_id]
+    
+    try:
+        ppt_utils.reorder_slides(pres, order)
+    except ValueError as e:
+        return {
+            "error": str(e)
+        }
+    except Exception as e:
+        return {
+            "error": f"Failed to reorder slides: {str(e)}"
+        }
+    
+    return {
+        "message": f"Reordered {len(order)} slides"
+    }
+
 # ---- Text Tools ----
 
 @app.tool()
+@run_in_worker
+@validate_arguments({
+    "slide_index": [SLIDE_INDEX],
+    "font_size": [POSITIVE_INTEGER],
+    "color": [RGB_COLOR],
+    "alignment": [HORIZONTAL_ALIGNMENT]
+})
 def add_textbox(
     slide_index: int,
     left: float,
@@ -498,7 +1984,7 @@ def add_textbox(
 ) -> Dict:
     """Add a textbox to a slide."""
     # Use the specified presentation or the current one
-    pres_id = presentation_id if presentation_id is not None else current_presentation_id
+    pres_id = resolve_presentation_id(presentation_id)
     
     if pres_id is None or pres_id not in presentations:
         return {
@@ -507,13 +1993,8 @@ def add_textbox(
     
     pres = presentations[pres_id]
     
-    # Check if slide index is valid
-    if slide_index < 0 or slide_index >= len(pres.slides):
-        return {
-            "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-        }
-    
-    slide = pres.slides[slide_index]
+    slide = ppt_utils.get_slide(pres, slide_index)
+    ppt_utils.mark_modified(slide.part)
     
     try:
         # Add the textbox
@@ -533,16 +2014,120 @@ def add_textbox(
         
         return {
             "message": f"Added textbox to slide {slide_index}",
-            "shape_index": len(slide.shapes) - 1
+            "shape_index": len(ppt_utils.get_shapes(pres, slide)) - 1
         }
     except Exception as e:
         return {
             "error": f"Failed to add textbox: {str(e)}"
         }
 
+@app.tool()
+@run_in_worker(read_only=True)
+@validate_arguments({
+    "query": [SEARCH_QUERY],
+    "slide_indices": [SLIDE_INDICES],
+    "limit": [POSITIVE_INTEGER]
+})
+def search_text(
+    query: str,
+    match_case: bool = False,
+    whole_word: bool = False,
+    slide_indices: Optional[List[int]] = None,
+    limit: int = 100,
+    presentation_id: Optional[str] = None
+) -> Dict:
+    """
+    Find text in the titles, placeholders, textboxes, table cells, chart titles and notes of a presentation.
+
+    Args:
+        query: The text to find; matches may span runs with different formatting
+        match_case: Whether the case of letters must match
+        whole_word: Whether the query must not be part of a longer word
+        slide_indices: Slides to search, all slides if not given
+        limit: Maximum number of matches to return
+        presentation_id: Presentation to search, the current one if not given
+
+    Returns:
+        The matches with their slide index and id, kind of text, shape id and name,
+        paragraph, run and offset, surrounding text and, for table cells, row and column
+    """
+    pres_id = resolve_presentation_id(presentation_id)
+    
+    if pres_id is None or pres_id not in presentations:
+        return {
+            "error": "No presentation is currently loaded or the specified ID is invalid"
+        }
+    
+    pres = presentations[pres_id]
+    
+    matches = ppt_utils.search_text(
+        pres, query, match_case=match_case, whole_word=whole_word, slide_indices=slide_indices
+    )
+    return {
+        "matches": matches[:limit],
+        "match_count": len(matches),
+        "truncated": len(matches) > limit
+    }
+
+@app.tool()
+@run_in_worker
+@validate_arguments({
+    "query": [SEARCH_QUERY],
+    "slide_indices": [SLIDE_INDICES]
+})
+def replace_text(
+    query: str,
+    replacement: str,
+    match_case: bool = False,
+    whole_word: bool = False,
+    slide_indices: Optional[List[int]] = None,
+    presentation_id: Optional[str] = None
+) -> Dict:
+    """
+    Replace text in the titles, placeholders, textboxes, table cells, chart titles and notes of a presentation.
+
+    Args:
+        query: The text to replace; matches may span runs with different formatting
+        replacement: The new text, which takes the formatting of the run the match starts in
+        match_case: Whether the case of letters must match
+        whole_word: Whether the query must not be part of a longer word
+        slide_indices: Slides to replace in, all slides if not given
+        presentation_id: Presentation to change, the current one if not given
+
+    Returns:
+        The number of replacements and the indices of the changed slides
+    """
+    pres_id = resolve_presentation_id(presentation_id)
+    
+    if pres_id is None or pres_id not in presentations:
+        return {
+            "error": "No presentation is currently loaded or the specified ID is invalid"
+        }
+    
+    pres = presentations[pres_id]
+    
+    try:
+        result = ppt_utils.replace_text(
+            pres, query, replacement, match_case=match_case, whole_word=whole_word, slide_indices=slide_indices
+        )
+        return {
+            "message": f"Replaced {result['replacements']} occurrences of '{query}'",
+            **result
+        }
+    except Exception as e:
+        return {
+            "error": f"Failed to replace text: {str(e)}"
+        }
+
 # ---- Image Tools ----
 
 @app.tool()
+@run_in_worker(inputs={"image_path": "file"})
+@validate_arguments({
+    "slide_index": [SLIDE_INDEX],
+    "width": [POSITIVE],
+    "height": [POSITIVE]
+})
 def add_image(
     slide_index: int,
     image_path: str,
@@ -550,11 +2135,24 @@ def add_image(
     top: float,
     width: Optional[float] = None,
     height: Optional[float] = None,
+    optimize: Optional[bool] = None,
     presentation_id: Optional[str] = None
 ) -> Dict:
-    """Add an image to a slide with graceful error recovery."""
+    """Add an image to a slide with graceful error recovery.
+
+    Args:
+        slide_index: Index of the slide to add the image to (0-based)
+        image_path: Path to the image file
+        left: Left position in inches
+        top: Top position in inches
+        width: Width in inches (optional, aspect ratio is kept if only one dimension is given)
+        height: Height in inches (optional)
+        optimize: Downscale and recompress the image for its placed size before embedding it
+            (uses the server's image optimization policy if not specified)
+        presentation_id: ID of the presentation to use (uses current presentation if not specified)
+    """
     # Use the specified presentation or the current one
-    pres_id = presentation_id if presentation_id is not None else current_presentation_id
+    pres_id = resolve_presentation_id(presentation_id)
     
     if pres_id is None or pres_id not in presentations:
         return {
@@ -563,13 +2161,8 @@ def add_image(
     
     pres = presentations[pres_id]
     
-    # Check if slide index is valid
-    if slide_index < 0 or slide_index >= len(pres.slides):
-        return {
-            "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-        }
-    
-    slide = pres.slides[slide_index]
+    slide = ppt_utils.get_slide(pres, slide_index)
+    ppt_utils.mark_modified(slide.part)
     
     # Check if image file exists
     if not os.path.exists(image_path):
@@ -587,29 +2180,28 @@ def add_image(
                 "error": f"Image file not found: {image_path}. Searched in {', '.join(common_dirs)}"
             }
     
+    optimization = get_image_optimization(optimize)
+    
     # Define multiple approaches to add the image
     def add_with_size():
-        return ppt_utils.add_image(slide, image_path, left, top, width, height)
+        return ppt_utils.add_image(slide, image_path, left, top, width, height, optimization)
         
     def add_without_size():
-        return ppt_utils.add_image(slide, image_path, left, top)
+        return ppt_utils.add_image(slide, image_path, left, top, optimization=optimization)
     
     def add_with_pil():
-        from PIL import Image
-        img = Image.open(image_path)
-        img_width, img_height = img.size
+        # The pixel size is probed with PIL once and then kept by the image cache
+        img_width, img_height = ppt_utils.image_cache.load_file(image_path).size
         
         # Calculate aspect ratio and use it to determine missing dimension
         aspect_ratio = img_width / img_height
+        w, h = width, height
         
         if width is not None and height is None:
             h = width / aspect_ratio
-            return ppt_utils.add_image(slide, image_path, left, top, width, h)
         elif height is not None and width is None:
             w = height * aspect_ratio
-            return ppt_utils.add_image(slide, image_path, left, top, w, height)
-        else:
-            return ppt_utils.add_image(slide, image_path, left, top, width, height)
+        return ppt_utils.add_image(slide, image_path, left, top, w, h, optimization)
     
     approaches = [
         (add_with_size, "Adding image with specified dimensions"),
@@ -624,14 +2216,25 @@ def add_image(
             "error": error
         }
     
-    return {
+    result = {
         "message": f"Added image to slide {slide_index}",
-        "shape_index": len(slide.shapes) - 1,
+        "shape_index": len(ppt_utils.get_shapes(pres, slide)) - 1,
         "width": picture.width.inches,
         "height": picture.height.inches
     }
+    
+    if optimization is not None:
+        result["image_optimization"] = image_optimization_report(os.path.getsize(image_path), picture)
+    
+    return result
 
 @app.tool()
+@run_in_worker(inputs={"base64_string": "data"})
+@validate_arguments({
+    "slide_index": [SLIDE_INDEX],
+    "width": [POSITIVE],
+    "height": [POSITIVE]
+})
 def add_image_from_base64(
     slide_index: int,
     base64_string: str,
@@ -639,11 +2242,24 @@ def add_image_from_base64(
     top: float,
     width: Optional[float] = None,
     height: Optional[float] = None,
+    optimize: Optional[bool] = None,
     presentation_id: Optional[str] = None
 ) -> Dict:
-    """Add an image from a base64 encoded string to a slide."""
+    """Add an image from a base64 encoded string to a slide.
+
+    Args:
+        slide_index: Index of the slide to add the image to (0-based)
+        base64_string: Base64 encoded image
+        left: Left position in inches
+        top: Top position in inches
+        width: Width in inches (optional, aspect ratio is kept if only one dimension is given)
+        height: Height in inches (optional)
+        optimize: Downscale and recompress the image for its placed size before embedding it
+            (uses the server's image optimization policy if not specified)
+        presentation_id: ID of the presentation to use (uses current presentation if not specified)
+    """
     # Use the specified presentation or the current one
-    pres_id = presentation_id if presentation_id is not None else current_presentation_id
+    pres_id = resolve_presentation_id(presentation_id)
     
     if pres_id is None or pres_id not in presentations:
         return {
@@ -652,32 +2268,105 @@ def add_image_from_base64(
     
     pres = presentations[pres_id]
     
-    # Check if slide index is valid
-    if slide_index < 0 or slide_index >= len(pres.slides):
-        return {
-            "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-        }
+    slide = ppt_utils.get_slide(pres, slide_index)
+    ppt_utils.mark_modified(slide.part)
     
-    slide = pres.slides[slide_index]
+    optimization = get_image_optimization(optimize)
     
     try:
         # Add the image
-        picture = ppt_utils.add_image_from_base64(slide, base64_string, left, top, width, height)
+        picture = ppt_utils.add_image_from_base64(slide, base64_string, left, top, width, height, optimization)
         
-        return {
+        result = {
             "message": f"Added image to slide {slide_index}",
-            "shape_index": len(slide.shapes) - 1,
+            "shape_index": len(ppt_utils.get_shapes(pres, slide)) - 1,
             "width": picture.width.inches,
             "height": picture.height.inches
         }
+        
+        if optimization is not None:
+            original_bytes = len(ppt_utils.image_cache.load_base64(base64_string).blob)
+            result["image_optimization"] = image_optimization_report(original_bytes, picture)
+        
+        return result
     except Exception as e:
         return {
             "error": f"Failed to add image: {str(e)}"
         }
 
+@app.tool()
+@run_in_worker
+@validate_arguments({
+    "target_dpi": [POSITIVE_INTEGER],
+    "jpeg_quality": [(is_in_range(1, 95), "must be between 1 and 95")]
+})
+def configure_image_optimization(
+    enabled: Optional[bool] = None,
+    target_dpi: Optional[int] = None,
+    jpeg_quality: Optional[int] = None,
+    png_optimize: Optional[bool] = None,
+    strip_metadata: Optional[bool] = None
+) -> Dict:
+    """Configure how images are optimized when they are inserted, for the whole server.
+
+    When enabled, add_image and add_image_from_base64 downscale images to at most
+    target_dpi pixels per inch at their placed size and recompress them before
+    embedding them. Options that are not specified keep their current value.
+
+    Args:
+        enabled: Whether images are optimized by default
+        target_dpi: Maximum resolution of placed images in pixels per inch
+        jpeg_quality: JPEG quality (1-95) used when re-encoding JPEG images
+        png_optimize: Whether PNG images are re-encoded with PIL's optimize flag
+        strip_metadata: Whether EXIF and other metadata is removed (the color profile is kept)
+    """
+    updates = {
+        "enabled": enabled,
+        "target_dpi": target_dpi,
+        "jpeg_quality": jpeg_quality,
+        "png_optimize": png_optimize,
+        "strip_metadata": strip_metadata
+    }
+    image_optimization.update({key: value for key, value in updates.items() if value is not None})
+    
+    return {
+        "message": "Image optimization policy updated",
+        "image_optimization": dict(image_optimization)
+    }
+
+@app.tool()
+@run_in_worker
+def get_image_cache_stats(clear: bool = False) -> Dict:
+    """Get hit/miss counters and size of the shared image cache.
+
+    Images inserted with add_image and add_image_from_base64 are cached by content,
+    so inserting the same image again skips reading, decoding and probing it.
+
+    Args:
+        clear: Empty the cache and reset its counters after reading them
+    """
+    stats = ppt_utils.image_cache.stats()
+    lookups = stats["hits"] + stats["misses"]
+    stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+
+    if clear:
+        ppt_utils.image_cache.clear()
+
+    return stats
+
 # ---- Table Tools ----
 
 @app.tool()
+@run_in_worker
+@validate_arguments({
+    "slide_index": [SLIDE_INDEX],
+    "rows": [POSITIVE_INTEGER],
+    "cols": [POSITIVE_INTEGER],
+    "left": [NON_NEGATIVE],
+    "top": [NON_NEGATIVE],
+    "width": [POSITIVE],
+    "height": [POSITIVE]
+})
 def add_table(
     slide_index: int,
     rows: int,
@@ -687,12 +2376,30 @@ def add_table(
     width: float,
     height: float,
     data: Optional[List[List[str]]] = None,
+    column_formats: Optional[List[Optional[str]]] = None,
+    header_format: Optional[Dict[str, Any]] = None,
     presentation_id: Optional[str] = None,
     filename: Optional[str] = None  # Added to satisfy MCP framework validation
 ) -> Dict:
-    """Add a table to a slide with comprehensive parameter validation."""
+    """Add a table to a slide with comprehensive parameter validation.
+
+    Args:
+        slide_index: Index of the slide to add the table to (0-based)
+        rows: Number of rows
+        cols: Number of columns
+        left: Left position in inches
+        top: Top position in inches
+        width: Width in inches
+        height: Height in inches
+        data: List of rows, each a list of cell values
+        column_formats: Python number format per column applied to numeric values,
+            e.g. [None, ",.2f", ".1%"]; use None to leave a column unformatted
+        header_format: Formatting for the first row of data, which is then treated as
+            a header row. Keys: font_size, font_name, bold, italic, color, bg_color, alignment
+        presentation_id: ID of the presentation to use (uses current presentation if not specified)
+    """
     # Use the specified presentation or the current one
-    pres_id = presentation_id if presentation_id is not None else current_presentation_id
+    pres_id = resolve_presentation_id(presentation_id)
     
     if pres_id is None or pres_id not in presentations:
         return {
@@ -701,26 +2408,8 @@ def add_table(
     
     pres = presentations[pres_id]
     
-    # Validate parameters
-    valid, error = validate_parameters({
-        "rows": (rows, [(is_positive, "must be a positive integer")]),
-        "cols": (cols, [(is_positive, "must be a positive integer")]),
-        "left": (left, [(is_non_negative, "must be non-negative")]),
-        "top": (top, [(is_non_negative, "must be non-negative")]),
-        "width": (width, [(is_positive, "must be positive")]),
-        "height": (height, [(is_positive, "must be positive")]),
-    })
-    
-    if not valid:
-        return {"error": error}
-    
-    # Check if slide index is valid
-    if slide_index < 0 or slide_index >= len(pres.slides):
-        return {
-            "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-        }
-    
-    slide = pres.slides[slide_index]
+    slide = ppt_utils.get_slide(pres, slide_index)
+    ppt_utils.mark_modified(slide.part)
     
     # Validate data if provided
     if data is not None:
@@ -731,6 +2420,14 @@ def add_table(
             if not isinstance(row, list):
                 return {"error": f"Row {i} must be a list of cell values"}
     
+    if header_format is not None:
+        if not isinstance(header_format, dict):
+            return {"error": "Header format must be an object"}
+        
+        for color_key in ("color", "bg_color"):
+            if header_format.get(color_key) is not None and not is_valid_rgb(header_format[color_key]):
+                return {"error": f"Parameter 'header_format.{color_key}': must be a valid RGB list [R, G, B] with values 0-255"}
+    
     try:
         # Add the table
         table, error = ppt_utils.safe_operation(
@@ -744,27 +2441,19 @@ def add_table(
         # Populate the table if data is provided
         warnings = []
         if data:
-            for row_idx, row_data in enumerate(data):
-                if row_idx >= rows:
-                    warnings.append(f"Ignored excess data: table has only {rows} rows but data has {len(data)} rows")
-                    break
-                    
-                for col_idx, cell_text in enumerate(row_data):
-                    if col_idx >= cols:
-                        warnings.append(f"Ignored excess data in row {row_idx}: table has only {cols} columns")
-                        break
-                        
-                    _, cell_error = ppt_utils.safe_operation(
-                        f"set_cell_text(row={row_idx}, col={col_idx})",
-                        lambda: ppt_utils.set_cell_text(table, row_idx, col_idx, str(cell_text))
-                    )
-                    
-                    if cell_error:
-                        warnings.append(cell_error)
+            fill_warnings, error = ppt_utils.safe_operation(
+                "fill_table",
+                lambda: ppt_utils.fill_table(table, data, column_formats, header_format)
+            )
+            
+            if error:
+                warnings.append(error)
+            else:
+                warnings.extend(fill_warnings)
         
         result = {
             "message": f"Added {rows}x{cols} table to slide {slide_index}",
-            "shape_index": len(slide.shapes) - 1
+            "shape_index": len(ppt_utils.get_shapes(pres, slide)) - 1
         }
         
         if warnings:
@@ -777,6 +2466,16 @@ def add_table(
         }
 
 @app.tool()
+@run_in_worker
+@validate_arguments({
+    "slide_index": [SLIDE_INDEX],
+    "shape_index": [SHAPE_INDEX],
+    "font_size": [POSITIVE_INTEGER],
+    "alignment": [HORIZONTAL_ALIGNMENT],
+    "vertical_alignment": [VERTICAL_ALIGNMENT],
+    "color": [RGB_COLOR],
+    "bg_color": [RGB_COLOR]
+})
 def format_table_cell(
     slide_index: int,
     shape_index: int,
@@ -827,7 +2526,7 @@ def format_table_cell(
             format_table_cell(0, 1, 2, 3, alignment="center", vertical_alignment="middle")
     """
     # Use the specified presentation or the current one
-    pres_id = presentation_id if presentation_id is not None else current_presentation_id
+    pres_id = resolve_presentation_id(presentation_id)
     
     if pres_id is None or pres_id not in presentations:
         return {
@@ -836,50 +2535,10 @@ def format_table_cell(
     
     pres = presentations[pres_id]
     
-    # Check if slide index is valid
-    if slide_index < 0 or slide_index >= len(pres.slides):
-        return {
-            "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-        }
-    
-    slide = pres.slides[slide_index]
-    
-    # Check if shape index is valid
-    if shape_index < 0 or shape_index >= len(slide.shapes):
-        return {
-            "error": f"Invalid shape index: {shape_index}. Available shapes: 0-{len(slide.shapes) - 1}"
-        }
-    
-    shape = slide.shapes[shape_index]
+    slide = ppt_utils.get_slide(pres, slide_index)
+    ppt_utils.mark_modified(slide.part)
     
-    # Validate parameters
-    valid_alignments = ['left', 'center', 'right', 'justify']
-    valid_vertical_alignments = ['top', 'middle', 'bottom']
-    
-    validations = {}
-    
-    if font_size is not None:
-        validations["font_size"] = (font_size, [(is_positive, "must be a positive integer")])
-    
-    if alignment is not None:
-        validations["alignment"] = (alignment.lower(), [(lambda x: x in valid_alignments, 
-                                    f"must be one of {', '.join(valid_alignments)}")])
-    
-    if vertical_alignment is not None:
-        validations["vertical_alignment"] = (vertical_alignment.lower(), 
-                                           [(lambda x: x in valid_vertical_alignments, 
-                                             f"must be one of {', '.join(valid_vertical_alignments)}")])
-    
-    if color is not None:
-        validations["color"] = (color, [(is_valid_rgb, "must be a valid RGB list [R, G, B] with values 0-255")])
-    
-    if bg_color is not None:
-        validations["bg_color"] = (bg_color, [(is_valid_rgb, "must be a valid RGB list [R, G, B] with values 0-255")])
-    
-    if validations:
-        valid, error = validate_parameters(validations)
-        if not valid:
-            return {"error": error}
+    shape = ppt_utils.get_shapes(pres, slide)[shape_index]
     
     try:
         # Check if shape is a table
@@ -946,7 +2605,7 @@ def format_table_cell(
                  "background color"),
                 
                 (lambda: setattr(cell.text_frame, 'vertical_anchor', 
-                                ppt_utils.vertical_alignment_map.get(vertical_alignment)) 
+                                ppt_utils.VERTICAL_ALIGNMENTS.get(vertical_alignment)) 
                  if vertical_alignment else None,
                  "vertical alignment")
             ]
@@ -960,19 +2619,184 @@ def format_table_cell(
         result = {
             "message": f"Formatted cell at row {row}, column {col} in table at shape index {shape_index} on slide {slide_index}"
         }
-        
-        if warnings:
-            result["warnings"] = warnings
-            
-        return result
+        
+        if warnings:
+            result["warnings"] = warnings
+            
+        return result
+    except Exception as e:
+        return {
+            "error": f"Failed to format table cell: {str(e)}"
+        }
+
+@app.tool()
+@run_in_worker
+@validate_arguments({
+    "slide_index": [SLIDE_INDEX],
+    "shape_index": [SHAPE_INDEX],
+    "font_size": [POSITIVE_INTEGER],
+    "alignment": [HORIZONTAL_ALIGNMENT],
+    "vertical_alignment": [VERTICAL_ALIGNMENT],
+    "color": [RGB_COLOR],
+    "bg_color": [RGB_COLOR],
+    "band_bg_colors": [RGB_COLORS],
+    "band_by": [(is_in_list(frozenset(['row', 'column'])), "must be 'row' or 'column'")]
+})
+def format_table_range(
+    slide_index: int,
+    shape_index: int,
+    rows: Optional[List[int]] = None,
+    cols: Optional[List[int]] = None,
+    first_row: Optional[int] = None,
+    last_row: Optional[int] = None,
+    first_col: Optional[int] = None,
+    last_col: Optional[int] = None,
+    font_size: Optional[int] = None,
+    font_name: Optional[str] = None,
+    bold: Optional[bool] = None,
+    italic: Optional[bool] = None,
+    color: Optional[List[int]] = None,
+    bg_color: Optional[List[int]] = None,
+    alignment: Optional[str] = None,
+    vertical_alignment: Optional[str] = None,
+    band_bg_colors: Optional[List[List[int]]] = None,
+    band_by: str = "row",
+    presentation_id: Optional[str] = None
+) -> Dict:
+    """Format a range of table cells in one call.
+
+    Cells are selected by rows and columns: either explicit index lists (rows, cols)
+    or inclusive ranges (first_row..last_row, first_col..last_col). Omitted selectors
+    select the whole table along that axis, so rows=[0] formats the whole header row.
+    The same formatting options as format_table_cell are applied to every selected
+    cell, and banding rules can alternate background colors across the selection.
+
+    Args:
+        slide_index: Index of the slide containing the table (0-based)
+        shape_index: Index of the table shape on the slide (0-based)
+        rows: Row indices to format (0-based)
+        cols: Column indices to format (0-based)
+        first_row: First row of an inclusive row range (0-based)
+        last_row: Last row of an inclusive row range (0-based)
+        first_col: First column of an inclusive column range (0-based)
+        last_col: Last column of an inclusive column range (0-based)
+        font_size: Font size in points
+        font_name: Font name/family (e.g., 'Arial', 'Calibri')
+        bold: Whether text should be bold (True/False)
+        italic: Whether text should be italic (True/False)
+        color: RGB color list for text [R, G, B] (0-255 for each value)
+        bg_color: RGB color list for cell background [R, G, B] (0-255 for each value)
+        alignment: Text alignment ('left', 'center', 'right', 'justify')
+        vertical_alignment: Vertical text alignment ('top', 'middle', 'bottom')
+        band_bg_colors: List of RGB background colors applied in turn to successive
+            selected rows or columns, e.g. [[255, 255, 255], [242, 242, 242]] for zebra striping
+        band_by: Whether bands alternate by 'row' or 'column'
+        presentation_id: ID of the presentation to use (uses current presentation if not specified)
+
+    Returns:
+        Dict with keys:
+            - message: Success message
+            - cells_formatted: Number of cells that were formatted
+            - error: Error message if operation failed
+
+    Examples:
+        To style a header row and stripe the body of a 30-row table:
+            format_table_range(0, 1, rows=[0], bold=True, bg_color=[68, 114, 196], color=[255, 255, 255])
+            format_table_range(0, 1, first_row=1, last_row=29, band_bg_colors=[[255, 255, 255], [217, 225, 242]])
+    """
+    # Use the specified presentation or the current one
+    pres_id = resolve_presentation_id(presentation_id)
+
+    if pres_id is None or pres_id not in presentations:
+        return {
+            "error": "No presentation is currently loaded or the specified ID is invalid"
+        }
+
+    pres = presentations[pres_id]
+
+    slide = ppt_utils.get_slide(pres, slide_index)
+    ppt_utils.mark_modified(slide.part)
+
+    shape = ppt_utils.get_shapes(pres, slide)[shape_index]
+
+    if not getattr(shape, 'has_table', False):
+        return {
+            "error": f"Shape at index {shape_index} is not a table"
+        }
+
+    table = shape.table
+    row_count = len(table.rows)
+    col_count = len(table.columns)
+
+    # Validate the row and column selection against the table
+    validations = {}
+
+    for name, value, count in (("rows", rows, row_count), ("cols", cols, col_count)):
+        if value is not None:
+            validations[name] = (value, [(lambda x, count=count: all(0 <= i < count for i in x),
+                                          f"indices must be between 0 and {count - 1}")])
+
+    for name, value, count in (("first_row", first_row, row_count), ("last_row", last_row, row_count),
+                               ("first_col", first_col, col_count), ("last_col", last_col, col_count)):
+        if value is not None:
+            validations[name] = (value, [(is_in_range(0, count - 1), f"must be between 0 and {count - 1}")])
+
+    for first_name, first, last_name, last in (("first_row", first_row, "last_row", last_row),
+                                               ("first_col", first_col, "last_col", last_col)):
+        if first is not None and last is not None:
+            validations[last_name][1].append((lambda x, first=first: x >= first,
+                                              f"must not be less than {first_name} ({first})"))
+
+    valid, error = validate_parameters(validations)
+    if not valid:
+        return {"error": error}
+
+    if bg_color is not None and band_bg_colors is not None:
+        return {"error": "Specify either bg_color or band_bg_colors, not both"}
+
+    # Resolve ranges into row and column selections
+    if rows is None and (first_row is not None or last_row is not None):
+        rows = list(range(first_row or 0, (last_row if last_row is not None else row_count - 1) + 1))
+
+    if cols is None and (first_col is not None or last_col is not None):
+        cols = list(range(first_col or 0, (last_col if last_col is not None else col_count - 1) + 1))
+
+    try:
+        cells_formatted = ppt_utils.format_table_range(
+            table,
+            rows=rows,
+            cols=cols,
+            band_bg_colors=[tuple(c) for c in band_bg_colors] if band_bg_colors else None,
+            band_by=band_by,
+            font_size=font_size,
+            font_name=font_name,
+            bold=bold,
+            italic=italic,
+            color=tuple(color) if color else None,
+            bg_color=tuple(bg_color) if bg_color else None,
+            alignment=alignment.lower() if alignment else None,
+            vertical_alignment=vertical_alignment.lower() if vertical_alignment else None
+        )
+
+        return {
+            "message": f"Formatted {cells_formatted} cells in table at shape index {shape_index} on slide {slide_index}",
+            "cells_formatted": cells_formatted
+        }
     except Exception as e:
         return {
-            "error": f"Failed to format table cell: {str(e)}"
+            "error": f"Failed to format table range: {str(e)}"
         }
 
 # ---- Shape Tools ----
 
 @app.tool()
+@run_in_worker
+@validate_arguments({
+    "slide_index": [SLIDE_INDEX],
+    "fill_color": [RGB_COLOR],
+    "line_color": [RGB_COLOR],
+    "line_width": [NON_NEGATIVE]
+})
 def add_shape(
     slide_index: int,
     shape_type: str,
@@ -995,9 +2819,11 @@ def add_shape(
         shape_type: Type of shape to add. Supported types include:
             - Basic shapes: 'rectangle', 'rounded_rectangle', 'oval', 'triangle', 'diamond'
             - Polygons: 'pentagon', 'hexagon', 'heptagon', 'octagon'
-            - Stars and arrows: 'star', 'arrow'
+            - Stars and arrows: 'star', 'arrow', 'left_arrow', 'up_arrow', 'down_arrow'
             - Misc: 'cloud', 'heart', 'lightning_bolt', 'sun', 'moon', 'smiley_face', 'no_symbol'
-            - Flowchart: 'flowchart_process', 'flowchart_decision', 'flowchart_data'
+            - Flowchart: 'flowchart_process', 'flowchart_decision', 'flowchart_data', 'flowchart_document'
+            Aliases such as 'circle' or 'square' and any MSO_SHAPE name (e.g. 'star_24_point')
+            are accepted as well; names are case-insensitive.
         left: Left position in inches
         top: Top position in inches
         width: Width in inches
@@ -1008,7 +2834,7 @@ def add_shape(
         presentation_id: ID of the presentation to use (uses current presentation if not specified)
     """
     # Use the specified presentation or the current one
-    pres_id = presentation_id if presentation_id is not None else current_presentation_id
+    pres_id = resolve_presentation_id(presentation_id)
     
     if pres_id is None or pres_id not in presentations:
         return {
@@ -1017,17 +2843,11 @@ def add_shape(
     
     pres = presentations[pres_id]
     
-    # Check if slide index is valid
-    if slide_index < 0 or slide_index >= len(pres.slides):
-        return {
-            "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-        }
-    
-    slide = pres.slides[slide_index]
+    slide = ppt_utils.get_slide(pres, slide_index)
+    ppt_utils.mark_modified(slide.part)
     
     try:
-        # Use the direct implementation that bypasses the enum issues
-        shape = add_shape_direct(slide, shape_type, left, top, width, height)
+        shape = ppt_utils.add_shape(slide, shape_type, left, top, width, height)
         
         # Format the shape if formatting options are provided
         if any([fill_color, line_color, line_width]):
@@ -1040,7 +2860,7 @@ def add_shape(
         
         return {
             "message": f"Added {shape_type} shape to slide {slide_index}",
-            "shape_index": len(slide.shapes) - 1
+            "shape_index": len(ppt_utils.get_shapes(pres, slide)) - 1
         }
     except ValueError as e:
         # Specific handling for validation errors
@@ -1055,6 +2875,13 @@ def add_shape(
 # ---- Chart Tools ----
 
 @app.tool()
+@run_in_worker
+@validate_arguments({
+    "slide_index": [SLIDE_INDEX],
+    "legend_position": [LEGEND_POSITION],
+    "max_points": [MAX_POINTS],
+    "downsample_method": [DOWNSAMPLE_METHOD]
+})
 def add_chart(
     slide_index: int,
     chart_type: str,
@@ -1069,11 +2896,19 @@ def add_chart(
     legend_position: str = "right",
     has_data_labels: bool = False,
     title: Optional[str] = None,
+    max_points: Optional[int] = None,
+    downsample_method: str = "lttb",
     presentation_id: Optional[str] = None
 ) -> Dict:
-    """Add a chart to a slide with comprehensive error handling."""
+    """
+    Add a chart to a slide with comprehensive error handling.
+
+    Long series can be downsampled before the chart is built by giving max_points;
+    downsample_method is 'lttb' (keeps the visual shape), 'minmax' (keeps peaks)
+    or 'nth' (every n-th point). The result reports the original and emitted point counts.
+    """
     # Use the specified presentation or the current one
-    pres_id = presentation_id if presentation_id is not None else current_presentation_id
+    pres_id = resolve_presentation_id(presentation_id)
     
     if pres_id is None or pres_id not in presentations:
         return {
@@ -1082,23 +2917,13 @@ def add_chart(
     
     pres = presentations[pres_id]
     
-    # Check if slide index is valid
-    if slide_index < 0 or slide_index >= len(pres.slides):
-        return {
-            "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-        }
-    
-    slide = pres.slides[slide_index]
+    slide = ppt_utils.get_slide(pres, slide_index)
+    ppt_utils.mark_modified(slide.part)
     
     # Validate chart type
-    valid_chart_types = [
-        'column', 'stacked_column', 'bar', 'stacked_bar', 'line', 
-        'line_markers', 'pie', 'doughnut', 'area', 'stacked_area', 
-        'scatter', 'radar', 'radar_markers'
-    ]
-    if chart_type.lower() not in valid_chart_types:
+    if chart_type not in ppt_utils.CHART_TYPES:
         return {
-            "error": f"Invalid chart type: '{chart_type}'. Valid types are: {', '.join(valid_chart_types)}"
+            "error": ppt_utils.CHART_TYPES.unknown_message(chart_type)
         }
     
     # Validate series data
@@ -1120,6 +2945,19 @@ def add_chart(
                 "error": f"Series '{series_names[i]}' has {len(values)} values but there are {len(categories)} categories"
             }
     
+    points = None
+    if max_points is not None:
+        try:
+            original_count = len(categories)
+            categories, series_values = ppt_utils.downsample_chart_data(
+                categories, series_values, max_points, downsample_method
+            )
+            points = {"original": original_count, "emitted": len(categories), "method": downsample_method}
+        except (ImportError, ValueError) as e:
+            return {
+                "error": str(e)
+            }
+    
     try:
         # Add the chart
         chart, error = ppt_utils.safe_operation(
@@ -1146,22 +2984,481 @@ def add_chart(
         )
         
         if error:
-            return {
+            result = {
                 "warning": f"Chart created but failed to format: {error}",
-                "shape_index": len(slide.shapes) - 1
+                "shape_index": len(ppt_utils.get_shapes(pres, slide)) - 1
+            }
+        else:
+            result = {
+                "message": f"Added {chart_type} chart to slide {slide_index}",
+                "shape_index": len(ppt_utils.get_shapes(pres, slide)) - 1
             }
         
+        if points is not None:
+            result["points"] = points
+        
+        return result
+    except Exception as e:
         return {
-            "message": f"Added {chart_type} chart to slide {slide_index}",
-            "shape_index": len(slide.shapes) - 1
+            "error": f"Failed to add chart: {str(e)}"
+        }
+
+@app.tool()
+@run_in_worker(inputs={"file_path": "file"})
+@validate_arguments({
+    "slide_index": [SLIDE_INDEX],
+    "legend_position": [LEGEND_POSITION],
+    "missing_values": [(is_in_list(ppt_utils.MISSING_VALUE_POLICIES),
+                        f"must be one of {', '.join(ppt_utils.MISSING_VALUE_POLICIES)}")],
+    "max_points": [MAX_POINTS],
+    "downsample_method": [DOWNSAMPLE_METHOD]
+})
+def add_chart_from_file(
+    slide_index: int,
+    chart_type: str,
+    left: float,
+    top: float,
+    width: float,
+    height: float,
+    file_path: str,
+    category_column: Optional[str] = None,
+    series_columns: Optional[List[str]] = None,
+    file_format: Optional[str] = None,
+    missing_values: str = "gap",
+    has_legend: bool = True,
+    legend_position: str = "right",
+    has_data_labels: bool = False,
+    title: Optional[str] = None,
+    max_points: Optional[int] = None,
+    downsample_method: str = "lttb",
+    presentation_id: Optional[str] = None
+) -> Dict:
+    """
+    Add a chart to a slide with data read from a CSV, TSV, Parquet or NumPy .npy file.
+
+    Large series are read from disk instead of being passed inline as JSON.
+
+    Args:
+        slide_index: Index of the slide to add the chart to
+        chart_type: Type of chart, as for add_chart
+        left, top, width, height: Position and size in inches
+        file_path: Path to the data file
+        category_column: Column holding the categories; the first column by default
+            (row numbers for .npy files)
+        series_columns: Columns to plot as series; all other columns by default.
+            Columns of plain .npy arrays are given by index, e.g. ["1", "2"].
+        file_format: 'csv', 'tsv', 'parquet' or 'npy'; detected from the extension by default
+        missing_values: 'gap', 'zero', 'drop' or 'error' (see load_chart_data)
+        has_legend, legend_position, has_data_labels, title: Formatting, as for add_chart
+        max_points, downsample_method: Downsampling of long series, as for add_chart
+        presentation_id: ID of the presentation, the current one by default
+
+    Returns:
+        The shape index of the chart and the number of series and points plotted
+    """
+    pres_id = resolve_presentation_id(presentation_id)
+    
+    if pres_id is None or pres_id not in presentations:
+        return {
+            "error": "No presentation is currently loaded or the specified ID is invalid"
+        }
+    
+    pres = presentations[pres_id]
+    
+    if chart_type not in ppt_utils.CHART_TYPES:
+        return {
+            "error": ppt_utils.CHART_TYPES.unknown_message(chart_type)
+        }
+    
+    if not os.path.exists(file_path):
+        return {
+            "error": f"File not found: {file_path}"
+        }
+    
+    try:
+        categories, series_names, series_values = ppt_utils.load_chart_data(
+            file_path,
+            category_column=category_column,
+            series_columns=series_columns,
+            file_format=file_format,
+            missing_values=missing_values
+        )
+        original_count = len(categories)
+        if max_points is not None:
+            categories, series_values = ppt_utils.downsample_chart_data(
+                categories, series_values, max_points, downsample_method
+            )
+    except (ImportError, ValueError) as e:
+        return {
+            "error": str(e)
+        }
+    except Exception as e:
+        return {
+            "error": f"Failed to read chart data from {file_path}: {str(e)}"
+        }
+    
+    if not categories:
+        return {
+            "error": f"No data rows found in {file_path}"
+        }
+    
+    slide = ppt_utils.get_slide(pres, slide_index)
+    ppt_utils.mark_modified(slide.part)
+    
+    try:
+        chart, error = ppt_utils.safe_operation(
+            "add_chart",
+            lambda: ppt_utils.add_chart(
+                slide, chart_type, left, top, width, height,
+                categories, series_names, series_values
+            )
+        )
+        
+        if error:
+            return {"error": error}
+        
+        result = {
+            "message": f"Added {chart_type} chart to slide {slide_index} from {file_path}",
+            "shape_index": len(ppt_utils.get_shapes(pres, slide)) - 1,
+            "series": series_names,
+            "point_count": len(categories)
         }
+        
+        if max_points is not None:
+            result["points"] = {"original": original_count, "emitted": len(categories), "method": downsample_method}
+        
+        _, error = ppt_utils.safe_operation(
+            "format_chart",
+            lambda: ppt_utils.format_chart(
+                chart,
+                has_legend=has_legend,
+                legend_position=legend_position,
+                has_data_labels=has_data_labels,
+                title=title
+            )
+        )
+        
+        if error:
+            result["warning"] = f"Chart created but failed to format: {error}"
+        
+        return result
     except Exception as e:
         return {
             "error": f"Failed to add chart: {str(e)}"
         }
 
+# ---- Deck Builder Tools ----
+
+@app.tool()
+@run_in_worker
+def build_presentation(
+    spec: Union[Dict, str],
+    output_path: Optional[str] = None,
+    id: Optional[str] = None
+) -> Dict:
+    """Build a presentation from a declarative deck spec in one pass.
+
+    The spec describes the slides with their layouts, titles, placeholder text,
+    bullet points, tables, charts, images, shapes and notes. See
+    ppt_utils.build_presentation for the format.
+
+    Args:
+        spec: The deck spec, as an object, a JSON or YAML string, or the path to a
+            .json, .yaml or .yml file
+        output_path: File to save the presentation to. The presentation stays open
+            and becomes the current presentation either way.
+        id: ID for the new presentation, generated if not provided
+    """
+    try:
+        pres = ppt_utils.build_presentation(spec, get_image_optimization())
+    except Exception as e:
+        return {
+            "error": f"Failed to build presentation: {str(e)}"
+        }
+
+    id = presentations.add(pres, id)
+    set_current_presentation_id(id)
+    if journal is not None:
+        journal.start(id, pres)
+
+    result = {
+        "presentation_id": id,
+        "message": f"Built presentation with ID: {id}",
+        "slide_count": ppt_utils.get_slide_count(pres)
+    }
+
+    if output_path is not None:
+        try:
+            result["file_path"] = ppt_utils.save_presentation(pres, output_path)
+        except Exception as e:
+            result["error"] = f"Built presentation but failed to save it: {str(e)}"
+
+    return result
+
+@app.tool()
+@run_in_worker
+@validate_arguments({
+    "workers": [POSITIVE_INTEGER]
+})
+def build_presentations(
+    specs: List[Union[Dict, str]],
+    output_paths: List[str],
+    workers: int = 1
+) -> Dict:
+    """Build many presentations from deck specs and save each to a file.
+
+    With more than one worker, the presentations are built in parallel worker
+    processes. The presentations are not kept open.
+
+    Args:
+        specs: Deck specs, see build_presentation
+        output_paths: File to save each presentation to
+        workers: Number of worker processes to build with
+    """
+    try:
+        results = ppt_utils.build_presentations(specs, output_paths, workers, get_image_optimization())
+    except Exception as e:
+        return {
+            "error": f"Failed to build presentations: {str(e)}"
+        }
+
+    failed = sum(1 for result in results if "error" in result)
+    return {
+        "message": f"Built {len(results) - failed} of {len(results)} presentations",
+        "results": results
+    }
+
+@app.tool()
+@run_in_worker
+@validate_arguments({
+    "workers": [POSITIVE_INTEGER],
+    "missing_fields": [(is_in_list(ppt_utils.MISSING_FIELD_POLICIES),
+                        f"must be one of {', '.join(ppt_utils.MISSING_FIELD_POLICIES)}")]
+})
+def merge_presentations(
+    template: str,
+    output_path: str,
+    records_path: Optional[str] = None,
+    records: Optional[List[Dict[str, Any]]] = None,
+    workers: int = 1,
+    missing_fields: str = "error",
+    file_format: Optional[str] = None
+) -> Dict:
+    """Mail merge: write one deck per record, substituting {{field}} tokens in a template.
+
+    Fields are substituted in placeholders, textboxes, table cells, chart titles,
+    notes and document properties. The template is parsed once and records are
+    streamed from the file, so nightly runs over many thousands of records do not
+    need to open, edit and save a presentation per record.
+
+    Args:
+        template: Path to the template .pptx file, or the name of a registered template
+        output_path: Path pattern of the decks, e.g. "decks/{{customer_id}}.pptx";
+            {{_index}} is the number of the record, counting from 0
+        records_path: CSV or JSONL file with one record per row or line
+        records: Records given inline, instead of records_path
+        workers: Number of worker processes to write decks with
+        missing_fields: 'error' skips records missing a field, 'blank' leaves the
+            field empty, 'keep' leaves the {{field}} token
+        file_format: 'csv' or 'jsonl'; detected from the extension of records_path by default
+    """
+    if (records_path is None) == (records is None):
+        return {
+            "error": "Specify exactly one of records_path and records"
+        }
+    if records_path is not None and not os.path.exists(records_path):
+        return {
+            "error": f"File not found: {records_path}"
+        }
+
+    written, failed = 0, []
+    try:
+        for result in ppt_utils.merge_presentations(
+            template, records_path if records_path is not None else records, output_path,
+            workers, missing_fields, file_format
+        ):
+            if "error" in result:
+                failed.append(result)
+            else:
+                written += 1
+    except Exception as e:
+        return {
+            "error": f"Failed to merge presentations: {str(e)}",
+            "written": written
+        }
+
+    return {
+        "message": f"Wrote {written} of {written + len(failed)} presentations",
+        "written": written,
+        "failed_count": len(failed),
+        # Bounded, a misconfigured template can fail every record
+        "failed": failed[:MAX_REPORTED_FAILURES]
+    }
+
+# ---- Export Tools ----
+
+@app.tool()
+@run_in_worker
+@validate_arguments({
+    "workers": [POSITIVE_INTEGER]
+})
+def extract_text(
+    paths: List[str],
+    output_path: str,
+    workers: int = 1
+) -> Dict:
+    """Extract the text of every slide of .pptx files to a JSON Lines file, one record per slide.
+
+    Each record has the file, slide index and id, title, other paragraphs, tables
+    as rows of cell text, notes and the alt text of shapes. The text is read
+    straight from the slide XML of each file, without opening the presentations,
+    and records are written as they are read, so whole corpora can be exported.
+
+    Args:
+        paths: .pptx files, or directories to search for them recursively
+        output_path: Path of the .jsonl file to write
+        workers: Number of worker processes to read files with
+    """
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        return {
+            "error": f"File not found: {', '.join(missing)}"
+        }
+
+    try:
+        result = ppt_utils.extract_text(paths, output_path, workers)
+    except Exception as e:
+        return {
+            "error": f"Failed to extract text: {str(e)}"
+        }
+
+    failed = result.pop("failed")
+    return {
+        "message": f"Extracted {result['slides']} slides from {result['files']} files to {output_path}",
+        "output_path": output_path,
+        **result,
+        "failed_count": len(failed),
+        "failed": failed[:MAX_REPORTED_FAILURES]
+    }
+
+# ---- Batch Tools ----
+
+# Tools that can run as operations of apply_operations: every tool that works on
+# a presentation, except closing it. Built from the tools defined up to here, so
+# apply_operations stays the last tool. The synchronous implementations are used,
+# since the batch already runs in a worker with the presentation locked.
+batch_operations = {
+    name: function
+    for name, function in tool_functions.items()
+    if "presentation_id" in inspect.signature(function).parameters
+    and name not in ("close_presentation", "apply_operations")
+}
+
+@app.tool()
+@run_in_worker(inputs={"operations": "operations"})
+def apply_operations(
+    operations: List[Dict[str, Any]],
+    stop_on_error: bool = True,
+    presentation_id: Optional[str] = None
+) -> Dict:
+    """Apply an ordered list of operations to a presentation in a single call.
+
+    Each operation names one of the existing tools and the arguments it would
+    normally be called with, so a sequence of tool calls can be sent as one request.
+    All operations run against the same presentation; a per-operation
+    'presentation_id' argument is not allowed.
+
+    Args:
+        operations: List of operations, each a dict of the form
+            {"tool": "add_textbox", "arguments": {"slide_index": 0, ...}}
+        stop_on_error: Stop at the first failed operation (True) or continue with
+            the remaining operations (False)
+        presentation_id: ID of the presentation to use (uses current presentation if not specified)
+
+    Returns:
+        Dict with keys:
+            - results: List of per-operation results with index, tool and result
+            - succeeded: Number of operations that succeeded
+            - failed: Number of operations that failed
+            - stopped_at: Index of the failed operation if execution stopped early
+
+    Examples:
+        To add a slide with a textbox:
+            apply_operations([
+                {"tool": "add_slide", "arguments": {"layout_index": 6}},
+                {"tool": "add_textbox", "arguments": {"slide_index": 0, "left": 1, "top": 1,
+                                                      "width": 4, "height": 1, "text": "Hello"}}
+            ])
+    """
+    # Use the specified presentation or the current one
+    pres_id = resolve_presentation_id(presentation_id)
+
+    if pres_id is None or pres_id not in presentations:
+        return {
+            "error": "No presentation is currently loaded or the specified ID is invalid"
+        }
+
+    if not isinstance(operations, list):
+        return {"error": "Operations must be a list of {tool, arguments} objects"}
+
+    results = []
+    failed = 0
+    stopped_at = None
+
+    for index, operation in enumerate(operations):
+        if not isinstance(operation, dict):
+            operation = {}
+        tool_name = operation.get("tool")
+        arguments = operation.get("arguments") or {}
+
+        if tool_name not in batch_operations:
+            result = {
+                "error": f"Unsupported operation: '{tool_name}'. Supported operations: {', '.join(sorted(batch_operations))}"
+            }
+        elif not isinstance(arguments, dict):
+            result = {"error": "Operation arguments must be an object"}
+        elif "presentation_id" in arguments:
+            result = {"error": "Operations cannot specify 'presentation_id'; it is set for the whole batch"}
+        else:
+            try:
+                result = batch_operations[tool_name](**arguments, presentation_id=pres_id)
+            except TypeError as e:
+                result = {"error": f"Invalid arguments for {tool_name}: {str(e)}"}
+            except Exception as e:
+                result = {"error": f"Failed to execute {tool_name}: {str(e)}"}
+
+        results.append({
+            "index": index,
+            "tool": tool_name,
+            "result": result
+        })
+
+        if "error" in result:
+            failed += 1
+            if stop_on_error:
+                stopped_at = index
+                break
+
+    response = {
+        "message": f"Applied {len(results) - failed} of {len(operations)} operations to presentation {pres_id}",
+        "presentation_id": pres_id,
+        "results": results,
+        "succeeded": len(results) - failed,
+        "failed": failed
+    }
+
+    if stopped_at is not None:
+        response["stopped_at"] = stopped_at
+
+    return response
+
 # ---- Main Execution ----
 def main():
+    # Rebuild the presentations of a previous run from the operation journal
+    if journal is not None:
+        journal.recover(tool_functions)
+        journal.start_background_threads()
+
     # Run the FastMCP server
     app.run(transport='stdio')
 
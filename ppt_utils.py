@@ -30,17 +30,78 @@ Usage examples:
     save_presentation(pres, "my_presentation.pptx")
 """
 from pptx import Presentation
-from pptx.chart.data import CategoryChartData, ChartData
-from pptx.enum.chart import XL_CHART_TYPE
-from pptx.enum.shapes import MSO_SHAPE, MSO_SHAPE_TYPE
+from pptx.chart.data import CategoryChartData, ChartData, XyChartData
+from pptx.chart.xlsx import CategoryWorkbookWriter
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION
+from pptx.enum.shapes import MSO_SHAPE, MSO_SHAPE_TYPE, PP_PLACEHOLDER
 from pptx.enum.text import PP_ALIGN, MSO_VERTICAL_ANCHOR
-from pptx.util import Inches, Pt
+from pptx.util import Emu, Inches, Pt, lazyproperty
 from pptx.dml.color import RGBColor
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TARGET_MODE as RTM, RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.package import PartFactory, XmlPart, _Relationship
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
+from pptx.opc.serialized import _ContentTypesItem
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
 from pptx.oxml.xmlchemy import OxmlElement
+from pptx.package import Package
+from pptx.parts.image import Image as PptxImage, ImagePart
+from pptx.parts.media import MediaPart
+from pptx.parts.chart import ChartPart
+from pptx.parts.slide import NotesSlidePart, SlidePart
 from pptx.shapes.graphfrm import GraphicFrame
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from lxml import etree
+import copy
+import difflib
+import hashlib
 import io
-from typing import Dict, List, Tuple, Union, Optional, Any
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import posixpath
+import re
+import shutil
+import struct
+import tempfile
+import threading
+import time
+import weakref
+import zipfile
+from typing import IO, Dict, Iterator, List, Tuple, Union, Optional, Any
+from xml.sax.saxutils import escape, quoteattr
 import base64
+import bisect
+
+# Name of the python-pptx default template in the template registry
+DEFAULT_TEMPLATE_NAME = "default"
+
+# Approximate memory used by one parsed XML element, used for size estimates
+XML_ELEMENT_SIZE_ESTIMATE = 200
+
+# Chunk size used when streaming presentation packages
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Size up to which a package being encoded is kept in memory instead of a temporary file
+SPOOL_MAX_SIZE = 16 * 1024 * 1024
+
+# Content types of media that is already compressed and is stored in the package as is
+_PRECOMPRESSED_CONTENT_TYPES = {'image/jpeg', 'image/png', 'image/gif'}
+
+# Default policy for optimizing images when they are inserted
+DEFAULT_IMAGE_OPTIMIZATION = {
+    'target_dpi': 150,
+    'jpeg_quality': 85,
+    'png_optimize': True,
+    'strip_metadata': True
+}
+
+# Control characters that are not allowed in XML text
+_INVALID_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
 
 def try_multiple_approaches(operation_name, approaches):
     """
@@ -90,43 +151,671 @@ def safe_operation(operation_name, operation_func, error_message=None, *args, **
         error_msg = error_message or f"Failed to execute {operation_name}: {str(e)}"
         return None, error_msg
 
+# ---- Enum Registries ----
+
+class EnumRegistry:
+    """
+    Case-insensitive mapping of names and aliases to python-pptx enum members.
+
+    Names are normalized by lowercasing them and treating spaces and hyphens as
+    underscores, so 'Rounded Rectangle' finds 'rounded_rectangle'. An unknown
+    name raises a ValueError that lists the closest known names. If a fallback
+    enum is given, any of its member names is accepted as well, e.g.
+    'star_24_point' for MSO_SHAPE.STAR_24_POINT.
+    """
+
+    def __init__(self, kind: str, members: Dict[str, Any], aliases: Dict[str, str] = None,
+                 fallback_enum=None):
+        self.kind = kind
+        self.members = dict(members)
+        self.aliases = dict(aliases or {})
+        self._lookup = dict(self.members)
+        self._lookup.update((alias, self.members[name]) for alias, name in self.aliases.items())
+        if fallback_enum is not None:
+            for member in fallback_enum:
+                self._lookup.setdefault(member.name.lower(), member)
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        return str(name).strip().lower().replace('-', '_').replace(' ', '_')
+
+    @property
+    def names(self) -> List[str]:
+        """The documented names, without aliases."""
+        return sorted(self.members)
+
+    def __contains__(self, name) -> bool:
+        return isinstance(name, str) and self.normalize(name) in self._lookup
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Get the member for a name or alias, or default if the name is unknown."""
+        if not isinstance(name, str):
+            return default
+        return self._lookup.get(self.normalize(name), default)
+
+    def lookup(self, name: str) -> Any:
+        """
+        Get the member for a name or alias.
+
+        Raises:
+            ValueError: If the name is unknown, suggesting the closest known names
+        """
+        member = self.get(name)
+        if member is None:
+            raise ValueError(self.unknown_message(name))
+        return member
+
+    def suggestions(self, name: str, count: int = 3) -> List[str]:
+        """Get the known names closest to an unknown name."""
+        candidates = list(self.members) + list(self.aliases)
+        return difflib.get_close_matches(self.normalize(name), candidates, n=count, cutoff=0.6)
+
+    def unknown_message(self, name: str) -> str:
+        suggestions = self.suggestions(name)
+        hint = f" Did you mean {', '.join(repr(s) for s in suggestions)}?" if suggestions else ""
+        return f"Unsupported {self.kind}: '{name}'.{hint} Available {self.kind}s: {', '.join(self.names)}"
+
+SHAPE_TYPES = EnumRegistry('shape type', {
+    'rectangle': MSO_SHAPE.RECTANGLE,
+    'rounded_rectangle': MSO_SHAPE.ROUNDED_RECTANGLE,
+    'oval': MSO_SHAPE.OVAL,
+    'diamond': MSO_SHAPE.DIAMOND,
+    'triangle': MSO_SHAPE.ISOSCELES_TRIANGLE,
+    'right_triangle': MSO_SHAPE.RIGHT_TRIANGLE,
+    'pentagon': MSO_SHAPE.REGULAR_PENTAGON,
+    'hexagon': MSO_SHAPE.HEXAGON,
+    'heptagon': MSO_SHAPE.HEPTAGON,
+    'octagon': MSO_SHAPE.OCTAGON,
+    'star': MSO_SHAPE.STAR_5_POINT,
+    'arrow': MSO_SHAPE.RIGHT_ARROW,
+    'left_arrow': MSO_SHAPE.LEFT_ARROW,
+    'up_arrow': MSO_SHAPE.UP_ARROW,
+    'down_arrow': MSO_SHAPE.DOWN_ARROW,
+    'cloud': MSO_SHAPE.CLOUD,
+    'heart': MSO_SHAPE.HEART,
+    'lightning_bolt': MSO_SHAPE.LIGHTNING_BOLT,
+    'sun': MSO_SHAPE.SUN,
+    'moon': MSO_SHAPE.MOON,
+    'smiley_face': MSO_SHAPE.SMILEY_FACE,
+    'no_symbol': MSO_SHAPE.NO_SYMBOL,
+    'flowchart_process': MSO_SHAPE.FLOWCHART_PROCESS,
+    'flowchart_decision': MSO_SHAPE.FLOWCHART_DECISION,
+    'flowchart_data': MSO_SHAPE.FLOWCHART_DATA,
+    'flowchart_document': MSO_SHAPE.FLOWCHART_DOCUMENT,
+    'flowchart_predefined_process': MSO_SHAPE.FLOWCHART_PREDEFINED_PROCESS,
+    'flowchart_internal_storage': MSO_SHAPE.FLOWCHART_INTERNAL_STORAGE,
+    'flowchart_connector': MSO_SHAPE.FLOWCHART_CONNECTOR
+}, aliases={
+    'rect': 'rectangle',
+    'square': 'rectangle',
+    'rounded_rect': 'rounded_rectangle',
+    'ellipse': 'oval',
+    'circle': 'oval',
+    'isosceles_triangle': 'triangle',
+    'right_arrow': 'arrow',
+    'star_5': 'star',
+    'smiley': 'smiley_face',
+    'lightning': 'lightning_bolt'
+}, fallback_enum=MSO_SHAPE)
+
+CHART_TYPES = EnumRegistry('chart type', {
+    'column': XL_CHART_TYPE.COLUMN_CLUSTERED,
+    'stacked_column': XL_CHART_TYPE.COLUMN_STACKED,
+    'bar': XL_CHART_TYPE.BAR_CLUSTERED,
+    'stacked_bar': XL_CHART_TYPE.BAR_STACKED,
+    'line': XL_CHART_TYPE.LINE,
+    'line_markers': XL_CHART_TYPE.LINE_MARKERS,
+    'pie': XL_CHART_TYPE.PIE,
+    'doughnut': XL_CHART_TYPE.DOUGHNUT,
+    'area': XL_CHART_TYPE.AREA,
+    'stacked_area': XL_CHART_TYPE.AREA_STACKED,
+    'scatter': XL_CHART_TYPE.XY_SCATTER,
+    'radar': XL_CHART_TYPE.RADAR,
+    'radar_markers': XL_CHART_TYPE.RADAR_MARKERS
+}, aliases={
+    'column_clustered': 'column',
+    'column_stacked': 'stacked_column',
+    'bar_clustered': 'bar',
+    'bar_stacked': 'stacked_bar',
+    'line_with_markers': 'line_markers',
+    'donut': 'doughnut',
+    'area_stacked': 'stacked_area',
+    'xy_scatter': 'scatter'
+})
+
+# Chart types that plot x/y pairs instead of values per category
+_XY_CHART_TYPES = frozenset(member for member in XL_CHART_TYPE if member.name.startswith('XY_SCATTER'))
+
+ALIGNMENTS = EnumRegistry('alignment', {
+    'left': PP_ALIGN.LEFT,
+    'center': PP_ALIGN.CENTER,
+    'right': PP_ALIGN.RIGHT,
+    'justify': PP_ALIGN.JUSTIFY
+}, aliases={
+    'centre': 'center',
+    'justified': 'justify'
+})
+
+VERTICAL_ALIGNMENTS = EnumRegistry('vertical alignment', {
+    'top': MSO_VERTICAL_ANCHOR.TOP,
+    'middle': MSO_VERTICAL_ANCHOR.MIDDLE,
+    'bottom': MSO_VERTICAL_ANCHOR.BOTTOM
+}, aliases={
+    'center': 'middle',
+    'centre': 'middle'
+})
+
+LEGEND_POSITIONS = EnumRegistry('legend position', {
+    'right': XL_LEGEND_POSITION.RIGHT,
+    'left': XL_LEGEND_POSITION.LEFT,
+    'top': XL_LEGEND_POSITION.TOP,
+    'bottom': XL_LEGEND_POSITION.BOTTOM,
+    'corner': XL_LEGEND_POSITION.CORNER
+}, aliases={
+    'top_right': 'corner'
+})
+
 # ---- Presentation Functions ----
 
-def open_presentation(file_path: str) -> Presentation:
+class LazyXmlPart:
+    """
+    Mixin for XML parts that are only parsed when their XML is first accessed.
+
+    Until then the part keeps the serialized XML it was loaded from, which is also
+    what gets written back when the presentation is saved.
+    """
+
+    @classmethod
+    def load(cls, partname, content_type, package, blob):
+        part = cls(partname, content_type, package, element=None)
+        part._xml_blob = blob
+        return part
+
+    @property
+    def _element(self):
+        element = self.__dict__.get('_parsed_element')
+        if element is None:
+            # Parts may be read from several threads at once, parse them only once
+            with _lazy_parse_lock:
+                element = self.__dict__.get('_parsed_element')
+                if element is None:
+                    element = self._load_element()
+                    self._parsed_element = element
+                    self._xml_blob = None
+        return element
+
+    @_element.setter
+    def _element(self, element):
+        self._parsed_element = element
+        self._xml_blob = None
+
+    @property
+    def is_parsed(self) -> bool:
+        return self._xml_blob is None
+
+    @property
+    def blob(self) -> bytes:
+        if self._xml_blob is not None:
+            return self._xml_blob
+        return super().blob
+
+    def _load_element(self):
+        return parse_xml(self._xml_blob)
+
+class TemplateXmlPart(LazyXmlPart):
+    """
+    Mixin for XML parts of a presentation created from a template.
+
+    The part shares the parsed XML and serialized bytes of the template, and only
+    copies the XML when it is first accessed, so a new presentation does not copy
+    the masters, layouts and themes it never touches.
+    """
+
+    def _load_element(self):
+        return copy.deepcopy(self._template_element)
+
+# Parts that are parsed on first access when a presentation is opened lazily
+_LAZY_PART_TYPES = {
+    content_type: type(f"Lazy{PartFactory.part_type_for[content_type].__name__}",
+                       (LazyXmlPart, PartFactory.part_type_for[content_type]), {})
+    for content_type in (CT.PML_SLIDE, CT.PML_NOTES_SLIDE, CT.DML_CHART)
+}
+_lazy_parse_lock = threading.Lock()
+_part_factory_lock = threading.Lock()
+
+def open_presentation(file_path: str, lazy: bool = False) -> Presentation:
     """
     Open an existing PowerPoint presentation.
     
+    With lazy=True, slide, notes and chart parts are only parsed when they are
+    first accessed, so opening a large deck to read its info or edit a few slides
+    costs time in proportion to what is touched. Lazy parts behave exactly like
+    regular ones.
+    
     Args:
         file_path: Path to the PowerPoint file
+        lazy: Whether to defer parsing slide content until it is accessed
         
     Returns:
         A Presentation object
     """
-    return Presentation(file_path)
+    if not lazy:
+        presentation = Presentation(file_path)
+    else:
+        # python-pptx picks part classes from a global registry, so the lazy classes are
+        # swapped in while loading. Loads in other threads may pick them up as well,
+        # which is harmless since they are drop-in replacements.
+        with _part_factory_lock:
+            original_types = {content_type: PartFactory.part_type_for[content_type]
+                              for content_type in _LAZY_PART_TYPES}
+            PartFactory.part_type_for.update(_LAZY_PART_TYPES)
+            try:
+                presentation = Presentation(file_path)
+            finally:
+                PartFactory.part_type_for.update(original_types)
+
+    _package_sources[presentation.part.package] = PackageSource(file_path, presentation.part.package)
+    return presentation
+
+# Template part classes, keyed by the part class they are derived from
+_template_part_types = {}
+
+def _template_part_type(part_class):
+    """Return the TemplateXmlPart subclass of an XML part class."""
+    with _part_factory_lock:
+        if part_class not in _template_part_types:
+            _template_part_types[part_class] = type(
+                f"Template{part_class.__name__}", (TemplateXmlPart, part_class), {}
+            )
+        return _template_part_types[part_class]
+
+class PresentationTemplate:
+    """
+    A template that is parsed once and cloned into new presentations.
+
+    Binary parts are shared with the template, which is safe since their bytes are
+    only ever replaced, never modified. XML parts are copied on first access.
+    """
+
+    def __init__(self, file_path: str = None):
+        self.file_path = file_path
+        self.mtime = os.path.getmtime(file_path) if file_path is not None else None
+
+        # Keep lazy part classes out of the template
+        with _part_factory_lock:
+            package = Presentation(file_path).part.package
+
+        self._parts = []
+        self._part_rels = {}
+        for part in package.iter_parts():
+            if isinstance(part, XmlPart):
+                self._parts.append((_template_part_type(type(part)), part.partname, part.content_type,
+                                    part._element, serialize_part_xml(part._element)))
+            else:
+                self._parts.append((type(part), part.partname, part.content_type, None, part.blob))
+            self._part_rels[part.partname] = parse_xml(part.rels.xml)
+        self._package_rels = parse_xml(package._rels.xml)
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the template file changed since it was parsed."""
+        if self.file_path is None:
+            return False
+        return not os.path.exists(self.file_path) or os.path.getmtime(self.file_path) != self.mtime
+
+    def new_presentation(self) -> Presentation:
+        """Create a new presentation from the template."""
+        package = Package(self.file_path)
+
+        parts = {}
+        for part_class, partname, content_type, element, blob in self._parts:
+            if element is None:
+                part = part_class.load(partname, content_type, package, blob)
+            else:
+                part = part_class(partname, content_type, package, element=None)
+                part._xml_blob = blob
+                part._template_element = element
+            parts[partname] = part
+
+        for partname, part in parts.items():
+            part.load_rels_from_xml(self._part_rels[partname], parts)
+        package._rels.load_from_xml(PACKAGE_URI, self._package_rels, parts)
+
+        return package.main_document_part.presentation
+
+class TemplateRegistry:
+    """
+    Registry of parsed presentation templates, keyed by name.
 
-def create_presentation() -> Presentation:
+    Templates can be registered under a name, or referred to by their file path,
+    in which case they are registered on first use. Templates whose file changed
+    are parsed again. The name "default" refers to the python-pptx default
+    template unless registered otherwise.
+    """
+
+    def __init__(self):
+        self._templates = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, file_path: str = None) -> PresentationTemplate:
+        """Parse a template and register it under a name."""
+        if file_path is not None and not os.path.exists(file_path):
+            raise ValueError(f"Template file not found: {file_path}")
+
+        template = PresentationTemplate(file_path)
+        with self._lock:
+            self._templates[name] = template
+        return template
+
+    def get(self, template: str = None) -> PresentationTemplate:
+        """Return a template by name or file path, or the default template if None."""
+        name = template if template is not None else DEFAULT_TEMPLATE_NAME
+
+        with self._lock:
+            registered = self._templates.get(name)
+
+        if registered is not None and not registered.is_stale:
+            return registered
+        if registered is not None:
+            return self.register(name, registered.file_path)
+        if template is None:
+            return self.register(name)
+        if os.path.exists(template):
+            return self.register(name, template)
+        raise ValueError(f"Unknown template: {template}")
+
+    def templates(self) -> Dict[str, Optional[str]]:
+        """Return the registered template names with their file paths."""
+        with self._lock:
+            return {name: template.file_path for name, template in self._templates.items()}
+
+template_registry = TemplateRegistry()
+
+def create_presentation(template: str = None) -> Presentation:
     """
     Create a new PowerPoint presentation.
     
+    Presentations are cloned from a template that is parsed only once, see
+    TemplateRegistry.
+    
+    Args:
+        template: Name of a registered template or path to a .pptx file, or None
+            for the default template
+        
     Returns:
         A new Presentation object
     """
-    return Presentation()
+    return template_registry.get(template).new_presentation()
+
+class PackageSource:
+    """
+    The file a presentation was last opened from or saved to.
+
+    Keeps the zip directory of the file and the parts that are unchanged since,
+    so an incremental save can copy their zip members instead of re-encoding
+    them. Parts are tracked as unchanged until mark_modified() is called for them,
+    and a part's relationships are compared to those in the file when saving.
+    """
+
+    def __init__(self, file_path: str, package, members: List[zipfile.ZipInfo] = None):
+        stat = os.stat(file_path)
+        self.file_path = os.path.abspath(file_path)
+        self.mtime, self.size = stat.st_mtime_ns, stat.st_size
+
+        if members is None:
+            with zipfile.ZipFile(file_path) as zip_file:
+                members = zip_file.infolist()
+        self.members = {info.filename: info for info in members}
+
+        # Unchanged part -> (member name, relationships) in the file
+        self.unchanged = weakref.WeakKeyDictionary()
+        for part in package.iter_parts():
+            if part.partname.membername in self.members:
+                self.unchanged[part] = (part.partname.membername, _rels_signature(part))
+
+    @property
+    def is_current(self) -> bool:
+        """Whether the file still is as it was when it was indexed."""
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return False
+        return (stat.st_mtime_ns, stat.st_size) == (self.mtime, self.size)
+
+    def unchanged_member(self, part) -> Optional[zipfile.ZipInfo]:
+        """Return the zip member holding the current content of a part, if any."""
+        membername, _ = self.unchanged.get(part, (None, None))
+        if membername != part.partname.membername:
+            return None
+        return self.members[membername]
+
+    def unchanged_rels_member(self, part) -> Optional[zipfile.ZipInfo]:
+        """Return the zip member holding the current relationships of a part, if any."""
+        if self.unchanged_member(part) is None or self.unchanged[part][1] != _rels_signature(part):
+            return None
+        return self.members.get(part.partname.rels_uri.membername)
+
+# Source file of each open package, see PackageSource
+_package_sources = weakref.WeakKeyDictionary()
+
+def _rels_signature(part) -> Tuple:
+    return tuple(
+        (rId, rel.reltype, rel.target_ref if rel.is_external else rel.target_part.partname)
+        for rId, rel in sorted(part.rels.items())
+    )
+
+def mark_modified(part) -> None:
+    """
+    Record that a part was changed, so the next incremental save writes it again.
+
+    Must be called for every part of an opened presentation that is modified in
+    place, such as the slide part of a slide that is edited. New parts and parts
+    whose relationships changed are detected automatically. Marking a slide part
+    also refreshes the shape details kept for it by the presentation index.
+
+    Args:
+        part: The modified part, e.g. slide.part
+    """
+    source = _package_sources.get(part.package)
+    if source is not None:
+        source.unchanged.pop(part, None)
+    index = getattr(part.package.presentation_part, '_presentation_index', None)
+    if index is not None:
+        index.modified(part)
 
-def save_presentation(presentation: Presentation, file_path: str) -> str:
+def save_presentation(presentation: Presentation, file_path: str, incremental: bool = True,
+                      update_source: bool = True) -> str:
     """
     Save a PowerPoint presentation to a file.
     
+    If the presentation was opened from or last saved to a file that has not
+    changed since, the save is incremental: the zip members of unchanged parts
+    are copied from that file as they are, and only modified parts are
+    re-encoded. The saved file then becomes the source of the next incremental
+    save, unless update_source is False, e.g. for backup copies.
+
+    Saves of the same presentation run one at a time, since each reads and may
+    replace its source, so they can be started from threads that only hold the
+    presentation for reading.
+    
     Args:
         presentation: The Presentation object
         file_path: Path where the file should be saved
+        incremental: Whether to reuse the members of unchanged parts
+        update_source: Whether the saved file becomes the source of later saves
         
     Returns:
         The file path where the presentation was saved
     """
-    presentation.save(file_path)
+    package = presentation.part.package
+    # Kept on the package rather than in a module level map, so it goes away with it
+    with package.__dict__.setdefault('_save_lock', threading.Lock()):
+        return _save_presentation(presentation, package, file_path, incremental, update_source)
+
+def _save_presentation(presentation: Presentation, package, file_path: str, incremental: bool,
+                       update_source: bool) -> str:
+    source = _package_sources.get(package)
+
+    if not (incremental and source is not None and source.is_current):
+        members = write_presentation(presentation, file_path)
+    elif os.path.abspath(file_path) != source.file_path:
+        with open(source.file_path, 'rb') as source_file:
+            members = write_presentation(presentation, file_path, source=source, source_file=source_file)
+    else:
+        # Overwriting the source, write next to it and swap the file in once complete
+        fd, temp_path = tempfile.mkstemp(suffix='.pptx', dir=os.path.dirname(source.file_path))
+        try:
+            with os.fdopen(fd, 'wb') as temp_file, open(source.file_path, 'rb') as source_file:
+                members = write_presentation(presentation, temp_file, source=source, source_file=source_file)
+            shutil.copymode(source.file_path, temp_path)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+
+    if update_source:
+        _package_sources[package] = PackageSource(file_path, package, members)
     return file_path
 
+def write_presentation(presentation: Presentation, file: Union[str, IO[bytes]],
+                       chunk_size: int = STREAM_CHUNK_SIZE, source: PackageSource = None,
+                       source_file: IO[bytes] = None) -> List[zipfile.ZipInfo]:
+    """
+    Write a presentation package to a file path or writable binary stream.
+
+    Unlike Presentation.save(), which compresses each part into a separate
+    in-memory buffer before adding it to the zip file, every zip member is
+    streamed: XML parts are serialized directly into the compressed member and
+    binary parts are written from their blob in chunks. Media that is already
+    compressed (JPEG, PNG, GIF, audio, video) is stored without deflating.
+
+    With a source, the members of parts that are unchanged since the source
+    file was written are copied from it without being decoded, see PackageSource.
+
+    Args:
+        presentation: The Presentation object
+        file: Path or writable binary stream to write the package to
+        chunk_size: Size in bytes of the chunks binary parts are written in
+        source: Source of the presentation to copy unchanged members from
+        source_file: The source file, opened for binary reading
+
+    Returns:
+        The zip members that were written
+    """
+    package = presentation.part.package
+    parts = tuple(package.iter_parts())
+
+    with zipfile.ZipFile(file, 'w', compression=zipfile.ZIP_DEFLATED, strict_timestamps=False) as zip_file:
+        zip_file.writestr(CONTENT_TYPES_URI.membername,
+                          serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        zip_file.writestr(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+
+        for part in parts:
+            member = source.unchanged_member(part) if source is not None else None
+            if member is not None:
+                _copy_member(zip_file, source_file, member, chunk_size)
+            else:
+                _write_part(zip_file, part, chunk_size)
+
+            if part._rels:
+                rels_member = source.unchanged_rels_member(part) if source is not None else None
+                if rels_member is not None:
+                    _copy_member(zip_file, source_file, rels_member, chunk_size)
+                else:
+                    zip_file.writestr(part.partname.rels_uri.membername, part.rels.xml)
+
+    return zip_file.infolist()
+
+def _copy_member(zip_file: zipfile.ZipFile, source_file: IO[bytes], info: zipfile.ZipInfo,
+                 chunk_size: int) -> None:
+    """Copy the compressed bytes of a zip member verbatim into an open zip file."""
+    # The member data follows its local header, whose name and extra field may
+    # differ in length from those in the central directory
+    source_file.seek(info.header_offset)
+    header = source_file.read(zipfile.sizeFileHeader)
+    name_length, extra_length = struct.unpack('<2H', header[26:30])
+    source_file.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+
+    copied = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    copied.compress_type = info.compress_type
+    copied.CRC = info.CRC
+    copied.compress_size = info.compress_size
+    copied.file_size = info.file_size
+    copied.external_attr = info.external_attr
+    # Sizes are written in the local header, so no data descriptor follows the data
+    copied.flag_bits = info.flag_bits & 0x800
+    copied.header_offset = zip_file.fp.tell()
+
+    # zipfile has no API for adding already compressed data, so the member is
+    # written and registered the way ZipFile.open() does it
+    zip_file.fp.write(copied.FileHeader())
+    remaining = info.compress_size
+    while remaining:
+        chunk = source_file.read(min(chunk_size, remaining))
+        if not chunk:
+            raise ValueError(f"Source file ends inside member {info.filename}")
+        zip_file.fp.write(chunk)
+        remaining -= len(chunk)
+
+    zip_file.filelist.append(copied)
+    zip_file.NameToInfo[copied.filename] = copied
+    zip_file.start_dir = zip_file.fp.tell()
+
+def _write_part(zip_file: zipfile.ZipFile, part, chunk_size: int) -> None:
+    """Stream a single package part into an open zip file."""
+    zip_info = zipfile.ZipInfo(part.partname.membername, date_time=time.localtime()[:6])
+
+    # Lazy parts that were never parsed are written from their original bytes below
+    if isinstance(part, XmlPart) and getattr(part, 'is_parsed', True):
+        zip_info.compress_type = zipfile.ZIP_DEFLATED
+        with zip_file.open(zip_info, 'w') as member:
+            etree.ElementTree(part._element).write(
+                member, encoding='UTF-8', xml_declaration=True, standalone=True
+            )
+        return
+
+    blob = memoryview(part.blob)
+    content_type = part.content_type
+    precompressed = (content_type in _PRECOMPRESSED_CONTENT_TYPES
+                     or content_type.startswith(('audio/', 'video/')))
+    zip_info.compress_type = zipfile.ZIP_STORED if precompressed else zipfile.ZIP_DEFLATED
+    # Lets zipfile decide up front whether the member needs ZIP64 headers
+    zip_info.file_size = len(blob)
+
+    with zip_file.open(zip_info, 'w') as member:
+        for offset in range(0, len(blob), chunk_size):
+            member.write(blob[offset:offset + chunk_size])
+
+def iter_presentation_base64(presentation: Presentation,
+                             chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+    """
+    Generate the base64 encoding of a presentation in chunks.
+
+    The package is written to a temporary file that only stays in memory while it
+    is small, and encoded chunk by chunk, so memory use is bounded by the chunk size
+    rather than the size of the presentation. Concatenating the chunks gives the
+    same string as encoding the whole file at once.
+
+    Args:
+        presentation: The Presentation object
+        chunk_size: Approximate size in bytes of the file data encoded per chunk
+
+    Yields:
+        Base64 encoded chunks of the presentation
+    """
+    # Encoding chunks whose size is a multiple of 3 keeps padding at the very end
+    chunk_size = max(3, chunk_size - chunk_size % 3)
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE) as buffer:
+        write_presentation(presentation, buffer)
+        buffer.seek(0)
+
+        while True:
+            chunk = buffer.read(chunk_size)
+            if not chunk:
+                break
+            yield base64.b64encode(chunk).decode('ascii')
+
 def presentation_to_base64(presentation: Presentation) -> str:
     """
     Convert a presentation to a base64 encoded string.
@@ -137,10 +826,50 @@ def presentation_to_base64(presentation: Presentation) -> str:
     Returns:
         Base64 encoded string of the presentation
     """
-    ppt_bytes = io.BytesIO()
-    presentation.save(ppt_bytes)
-    ppt_bytes.seek(0)
-    return base64.b64encode(ppt_bytes.read()).decode('utf-8')
+    return ''.join(iter_presentation_base64(presentation))
+
+def save_presentation_base64(presentation: Presentation, file_path: str) -> str:
+    """
+    Save a presentation as a base64 encoded text file without holding the encoding in memory.
+
+    Args:
+        presentation: The Presentation object
+        file_path: Path where the base64 text should be saved
+
+    Returns:
+        The file path where the encoded presentation was saved
+    """
+    with open(file_path, 'w', encoding='ascii') as f:
+        for chunk in iter_presentation_base64(presentation):
+            f.write(chunk)
+    return file_path
+
+def estimate_presentation_size(presentation: Presentation) -> int:
+    """
+    Estimate the in-memory size of a presentation.
+
+    Binary parts (images, media, embedded workbooks) and XML parts that have not
+    been parsed yet are counted at their exact size. Parsed XML parts are
+    estimated from their element count, since parsed XML takes considerably more
+    memory than its serialized form.
+
+    Args:
+        presentation: The Presentation object
+
+    Returns:
+        Approximate size in bytes
+    """
+    total = 0
+    for part in presentation.part.package.iter_parts():
+        if isinstance(part, LazyXmlPart) and not part.is_parsed:
+            total += len(part.blob)
+            continue
+        element = getattr(part, '_element', None)
+        if element is not None:
+            total += sum(1 for _ in element.iter()) * XML_ELEMENT_SIZE_ESTIMATE
+        else:
+            total += len(part.blob)
+    return total
 
 def base64_to_presentation(base64_string: str) -> Presentation:
     """
@@ -192,6 +921,896 @@ def get_slide_layouts(presentation: Presentation) -> List[Dict]:
         layouts.append(layout_info)
     return layouts
 
+_TITLE_PLACEHOLDER_TYPES = (PP_PLACEHOLDER.TITLE, PP_PLACEHOLDER.CENTER_TITLE, PP_PLACEHOLDER.VERTICAL_TITLE)
+
+def get_slide_outline(presentation: Presentation, slide_index: int, max_text_length: int = 80) -> Dict:
+    """
+    Get a compact digest of a slide: its layout, title and a preview of its text.
+
+    Args:
+        presentation: The Presentation object
+        slide_index: Index of the slide
+        max_text_length: Maximum length of the text preview
+
+    Returns:
+        A dictionary with the slide index, slide id, layout name, title, shape count and text preview
+    """
+    slide = get_slide(presentation, slide_index)
+    title = None
+    texts = []
+    shapes = get_shapes(presentation, slide)
+    for shape in shapes:
+        if not shape.has_text_frame:
+            continue
+        text = " ".join(shape.text_frame.text.split())
+        if title is None and shape.is_placeholder and shape.placeholder_format.type in _TITLE_PLACEHOLDER_TYPES:
+            title = text
+        elif text:
+            texts.append(text)
+    text = " | ".join(texts)
+    if len(text) > max_text_length:
+        text = text[:max(max_text_length - 3, 0)] + "..."
+    return {
+        "slide_index": slide_index,
+        "slide_id": get_presentation_index(presentation).slide_ids()[slide_index],
+        "layout": slide.slide_layout.name,
+        "title": title,
+        "shape_count": len(shapes),
+        "text": text
+    }
+
+# ---- Index Functions ----
+
+def _shape_record(shape) -> Dict:
+    try:
+        shape_type = shape.shape_type.name if shape.shape_type is not None else None
+    except NotImplementedError:
+        shape_type = None
+    record = {
+        "shape_id": shape.shape_id,
+        "name": shape.name,
+        "shape_type": shape_type
+    }
+    for attribute in ('left', 'top', 'width', 'height'):
+        value = getattr(shape, attribute)
+        record[attribute] = value.inches if value is not None else None
+    return record
+
+class _ShapeEntry:
+    """Cached shapes of one slide, with the spTree state they were read from."""
+
+    def __init__(self, shapes):
+        self.child_count = len(shapes._spTree)
+        self.last_child = shapes._spTree[-1] if self.child_count else None
+        self.shapes = [shapes._shape_factory(elm) for elm in shapes._iter_member_elms()]
+        self._records = None
+
+    @property
+    def records(self) -> List[Dict]:
+        """Id, name, type and position of each shape, read on first use."""
+        if self._records is None:
+            self._records = [_shape_record(shape) for shape in self.shapes]
+        return self._records
+
+    def modified(self) -> None:
+        """Discard the shape records, which may be out of date after an edit."""
+        self._records = None
+
+    def refresh(self, shapes) -> bool:
+        """
+        Bring the entry up to date with the spTree, appending shapes added at its end.
+
+        Returns:
+            False if the spTree changed in another way and the entry must be rebuilt
+        """
+        spTree = shapes._spTree
+        child_count = len(spTree)
+        if child_count == self.child_count and (not child_count or spTree[-1] is self.last_child):
+            return True
+        if child_count < self.child_count or (self.child_count and spTree[self.child_count - 1] is not self.last_child):
+            return False
+        for elm in spTree[self.child_count:]:
+            if elm.tag in spTree._shape_tags and shapes._is_member_elm(elm):
+                shape = shapes._shape_factory(elm)
+                self.shapes.append(shape)
+                if self._records is not None:
+                    self._records.append(_shape_record(shape))
+        self.child_count = child_count
+        self.last_child = spTree[-1]
+        return True
+
+# Values of the type attribute of p:ph for the placeholders reported as 'title' by the text index
+_TITLE_PLACEHOLDER_XML_TYPES = frozenset(member.xml_value for member in _TITLE_PLACEHOLDER_TYPES if member.xml_value)
+_SHAPE_PH_PATH = '/'.join(qn(tag) for tag in ('p:nvSpPr', 'p:nvPr', 'p:ph'))
+_SHAPE_CNVSPPR_PATH = '/'.join(qn(tag) for tag in ('p:nvSpPr', 'p:cNvSpPr'))
+_TABLE_PATH = '/'.join(qn(tag) for tag in ('a:graphic', 'a:graphicData', 'a:tbl'))
+
+class _TextItem:
+    """A continuous piece of text of a slide: the runs of a paragraph up to a line break."""
+
+    __slots__ = ('kind', 'shape_id', 'shape_name', 'row', 'col', 'paragraph', 'part', 'text_nodes', 'text')
+
+    def __init__(self, kind, shape_elm, row, col, paragraph, part, text_nodes):
+        self.kind = kind
+        if shape_elm is not None:
+            # p:cNvPr, the first child of the non-visual properties of every shape element
+            cNvPr = shape_elm[0][0]
+            self.shape_id = int(cNvPr.get('id'))
+            self.shape_name = cNvPr.get('name')
+        else:
+            self.shape_id = self.shape_name = None
+        self.row = row
+        self.col = col
+        self.paragraph = paragraph
+        self.part = part
+        self.text_nodes = text_nodes
+        self.text = ''.join(node.text or '' for node in text_nodes)
+
+def _text_body_items(items: List, txBody, kind: str, shape_elm, part, row=None, col=None) -> None:
+    if txBody is None:
+        return
+    for paragraph_index, paragraph in enumerate(txBody.iterchildren(qn('a:p'))):
+        for text_nodes in _run_text_groups(paragraph):
+            if text_nodes:
+                items.append(_TextItem(kind, shape_elm, row, col, paragraph_index, part, text_nodes))
+
+def _shape_text_items(items: List, shape, part) -> None:
+    # Reads the shape XML directly; the python-pptx properties look up the same elements with XPath
+    elm = shape._element
+    if elm.tag == qn('p:grpSp'):
+        for member in shape.shapes:
+            _shape_text_items(items, member, part)
+    elif elm.tag == qn('p:sp'):
+        ph = elm.find(_SHAPE_PH_PATH)
+        if ph is not None:
+            kind = 'title' if ph.get('type') in _TITLE_PLACEHOLDER_XML_TYPES else 'placeholder'
+        else:
+            cNvSpPr = elm.find(_SHAPE_CNVSPPR_PATH)
+            kind = 'textbox' if cNvSpPr is not None and cNvSpPr.get('txBox') in ('1', 'true') else 'shape'
+        _text_body_items(items, elm.find(qn('p:txBody')), kind, elm, part)
+    elif elm.tag == qn('p:graphicFrame'):
+        tbl = elm.find(_TABLE_PATH)
+        if tbl is not None:
+            for row_index, tr in enumerate(tbl.iterchildren(qn('a:tr'))):
+                for col_index, tc in enumerate(tr.iterchildren(qn('a:tc'))):
+                    _text_body_items(items, tc.find(qn('a:txBody')), 'table', elm, part, row_index, col_index)
+        elif shape.has_chart:
+            chart = shape.chart
+            # Only read: chart_title and text_frame add the elements they return if missing
+            if chart.has_title and chart.chart_title.has_text_frame:
+                _text_body_items(items, chart.chart_title.text_frame._txBody, 'chart_title', elm, chart.part)
+
+class _TextEntry:
+    """Text of one slide, with the trigrams it contains."""
+
+    def __init__(self, slide, slide_id: int, shapes):
+        self.slide_id = slide_id
+        self.items = []
+        for shape in shapes:
+            _shape_text_items(self.items, shape, slide.part)
+        if slide.has_notes_slide:
+            notes = slide.notes_slide
+            placeholder = notes.notes_placeholder
+            if placeholder is not None:
+                _text_body_items(self.items, placeholder.text_frame._txBody, 'notes', None, notes.part)
+        self.trigrams = set()
+        for item in self.items:
+            text = item.text.lower()
+            self.trigrams.update(text[i:i + 3] for i in range(len(text) - 2))
+
+class PresentationIndex:
+    """
+    Index of the slides and shapes of a presentation.
+
+    python-pptx walks the slide list and the shape tree on every indexed access.
+    The index keeps the slide relationships and the shape proxies of each slide,
+    so repeated lookups are constant time. It detects slides and shapes appended
+    to the end of their lists and rebuilds itself after any other change to the
+    slide list or a shape tree; changes that keep the number of elements, such
+    as reordering, must be reported with invalidate(). Shape names, types and
+    positions are read once and kept until mark_modified() is called for the slide.
+
+    The text of each slide (shapes, table cells, chart titles and notes) is read
+    on the first text search and kept in an inverted index from lowercase
+    trigrams to slides, so a search only looks at the slides that contain every
+    trigram of the query. A slide's text is read again after mark_modified().
+
+    Slides are resolved on first access, so indexing a lazily opened presentation
+    does not parse its slides.
+    """
+
+    def __init__(self, presentation: Presentation):
+        self.presentation = presentation
+        self._lock = threading.RLock()
+        self._sldIdLst = None
+        self._rIds = None
+        self._last_sldId = None
+        self._positions = {}
+        self._ids = []
+        self._slides = {}
+        self._shapes = {}
+        self._text = {}
+        self._postings = {}
+        self._text_rIds = None
+
+    def _sldIds(self) -> List:
+        sldIdLst = self.presentation.part._element.sldIdLst
+        return [] if sldIdLst is None else sldIdLst.sldId_lst
+
+    def _refresh_slides(self) -> List[str]:
+        # Looking up p:sldIdLst is slower than the checks below, so the element is kept
+        sldIdLst = self._sldIdLst
+        if sldIdLst is None or sldIdLst.getparent() is None:
+            sldIdLst = self._sldIdLst = self.presentation.part._element.sldIdLst
+        count = 0 if sldIdLst is None else len(sldIdLst)
+        last_sldId = sldIdLst[-1] if count else None
+        if self._rIds is None or count != len(self._rIds) or last_sldId is not self._last_sldId:
+            sldIds = self._sldIds()
+            rIds = [sldId.rId for sldId in sldIds]
+            if self._rIds is not None and rIds[:len(self._rIds)] != self._rIds:
+                self._slides.clear()
+                self._shapes.clear()
+            self._rIds = rIds
+            self._last_sldId = last_sldId
+            self._ids = [sldId.id for sldId in sldIds]
+            self._positions = {slide_id: index for index, slide_id in enumerate(self._ids)}
+        return self._rIds
+
+    @property
+    def slide_count(self) -> int:
+        """Number of slides in the presentation."""
+        with self._lock:
+            return len(self._refresh_slides())
+
+    def slide(self, index: int):
+        """
+        Get a slide by its position.
+
+        Args:
+            index: Index of the slide
+
+        Returns:
+            The slide
+
+        Raises:
+            IndexError: If there is no slide at the index
+        """
+        with self._lock:
+            rIds = self._refresh_slides()
+            if index < 0:
+                index += len(rIds)
+            if not 0 <= index < len(rIds):
+                raise IndexError("slide index out of range")
+            rId = rIds[index]
+            slide = self._slides.get(rId)
+            if slide is None:
+                slide = self._slides[rId] = self.presentation.part.related_slide(rId)
+            return slide
+
+    def slide_ids(self) -> List[int]:
+        """
+        Get the slide ids of the presentation in slide order.
+
+        Returns:
+            A list of slide ids
+        """
+        with self._lock:
+            self._refresh_slides()
+            return list(self._ids)
+
+    def slide_by_id(self, slide_id: int):
+        """
+        Get a slide by its slide id.
+
+        Args:
+            slide_id: The slide id, as in slide.slide_id
+
+        Returns:
+            The slide, or None if there is no such slide
+        """
+        with self._lock:
+            self._refresh_slides()
+            index = self._positions.get(slide_id)
+            return self.slide(index) if index is not None else None
+
+    def slide_index(self, slide) -> Optional[int]:
+        """
+        Get the position of a slide.
+
+        Args:
+            slide: The slide
+
+        Returns:
+            Index of the slide, or None if it is not in the presentation
+        """
+        with self._lock:
+            self._refresh_slides()
+            index = self._positions.get(slide.slide_id)
+            if index is None or self.slide(index).part is not slide.part:
+                return None
+            return index
+
+    def _shape_entry(self, slide) -> _ShapeEntry:
+        entry = self._shapes.get(slide.part)
+        if entry is None or not entry.refresh(slide.shapes):
+            entry = self._shapes[slide.part] = _ShapeEntry(slide.shapes)
+        return entry
+
+    def shapes(self, slide) -> List:
+        """
+        Get the shapes of a slide, in z-order.
+
+        Args:
+            slide: The slide
+
+        Returns:
+            A list of shapes; must not be modified
+        """
+        with self._lock:
+            return self._shape_entry(slide).shapes
+
+    def shape_records(self, slide) -> List[Dict]:
+        """
+        Get the id, name, type and position of each shape of a slide.
+
+        Args:
+            slide: The slide
+
+        Returns:
+            A list of dictionaries in z-order; must not be modified
+        """
+        with self._lock:
+            return self._shape_entry(slide).records
+
+    def shape_by_id(self, slide, shape_id: int):
+        """
+        Get a shape of a slide by its shape id.
+
+        Args:
+            slide: The slide
+            shape_id: The shape id, as in shape.shape_id
+
+        Returns:
+            The shape, or None if there is no such shape
+        """
+        with self._lock:
+            entry = self._shape_entry(slide)
+            for shape, record in zip(entry.shapes, entry.records):
+                if record["shape_id"] == shape_id:
+                    return shape
+            return None
+
+    def shapes_by_name(self, slide, name: str) -> List:
+        """
+        Get the shapes of a slide that have a name.
+
+        Args:
+            slide: The slide
+            name: The shape name
+
+        Returns:
+            A list of shapes in z-order
+        """
+        with self._lock:
+            entry = self._shape_entry(slide)
+            return [shape for shape, record in zip(entry.shapes, entry.records) if record["name"] == name]
+
+    def invalidate(self, slide=None) -> None:
+        """
+        Discard cached entries after a change the index cannot detect.
+
+        Args:
+            slide: The slide whose shapes changed, or None to discard the whole index
+        """
+        with self._lock:
+            if slide is None:
+                self._sldIdLst = None
+                self._rIds = None
+                self._slides.clear()
+                self._shapes.clear()
+                self._text.clear()
+                self._postings.clear()
+                self._text_rIds = None
+            else:
+                self._shapes.pop(slide.part, None)
+                self._discard_text(slide.part)
+
+    def modified(self, part) -> None:
+        """
+        Discard the cached shape ids, names, types, positions and text of a slide that is being edited.
+
+        Args:
+            part: The slide part, or a notes or chart part, whose text is indexed with its slide
+        """
+        with self._lock:
+            entry = self._shapes.get(part)
+            if entry is not None:
+                entry.modified()
+            self._discard_text(part)
+            if isinstance(part, (NotesSlidePart, ChartPart)):
+                for slide_part, text_entry in list(self._text.items()):
+                    if any(item.part is part for item in text_entry.items):
+                        self._discard_text(slide_part)
+
+    def _discard_text(self, part) -> None:
+        entry = self._text.pop(part, None)
+        if entry is None:
+            return
+        for trigram in entry.trigrams:
+            parts = self._postings[trigram]
+            parts.discard(part)
+            if not parts:
+                del self._postings[trigram]
+        self._text_rIds = None
+
+    def _index_text(self) -> None:
+        """Read the text of every slide that is not in the text index yet."""
+        rIds = self._refresh_slides()
+        # _refresh_slides() replaces the list whenever the slides change
+        if self._text_rIds is rIds:
+            return
+        parts = set()
+        for index in range(len(rIds)):
+            slide = self.slide(index)
+            parts.add(slide.part)
+            if slide.part not in self._text:
+                entry = self._text[slide.part] = _TextEntry(slide, self._ids[index], self._shape_entry(slide).shapes)
+                for trigram in entry.trigrams:
+                    self._postings.setdefault(trigram, set()).add(slide.part)
+        # Slides that were deleted
+        for part in [part for part in self._text if part not in parts]:
+            self._discard_text(part)
+        self._text_rIds = rIds
+
+    def search_text(self, query: str, match_case: bool = False, whole_word: bool = False,
+                    slide_indices: List[int] = None) -> List[Tuple[int, _TextItem, List]]:
+        """
+        Find text in the slides, shapes, table cells, chart titles and notes of the presentation.
+
+        Matches are found within a paragraph, also across runs, but not across line breaks.
+
+        Args:
+            query: The text to find
+            match_case: Whether the case of letters must match
+            whole_word: Whether the query must not be part of a longer word
+            slide_indices: Slides to search, all slides if not given
+
+        Returns:
+            A list of (slide index, text item, regex matches) tuples, in slide order
+        """
+        pattern = re.escape(query)
+        if whole_word:
+            pattern = r'(?<!\w)' + pattern + r'(?!\w)'
+        regex = re.compile(pattern, 0 if match_case else re.IGNORECASE)
+        needle = query.lower()
+        trigrams = sorted({needle[i:i + 3] for i in range(len(needle) - 2)},
+                          key=lambda trigram: len(self._postings.get(trigram, ())))
+
+        with self._lock:
+            self._index_text()
+            if trigrams:
+                candidates = set(self._postings.get(trigrams[0], ()))
+                for trigram in trigrams[1:]:
+                    if not candidates:
+                        break
+                    candidates &= self._postings.get(trigram, set())
+            else:
+                candidates = set(self._text)
+
+            wanted = set(slide_indices) if slide_indices is not None else None
+            found = []
+            for part in candidates:
+                entry = self._text[part]
+                index = self._positions.get(entry.slide_id)
+                if index is None or (wanted is not None and index not in wanted):
+                    continue
+                for item in entry.items:
+                    matches = list(regex.finditer(item.text))
+                    if matches:
+                        found.append((index, item, matches))
+        found.sort(key=lambda result: result[0])
+        return found
+
+    def find_shapes(self, name: str = None, shape_type: str = None, bbox: Tuple[float, float, float, float] = None,
+                    mode: str = 'intersects', slide_indices: List[int] = None) -> List[Dict]:
+        """
+        Find shapes by name, type or position.
+
+        Args:
+            name: Case-insensitive substring of the shape name
+            shape_type: Shape type name, e.g. 'PICTURE', 'TABLE' or 'AUTO_SHAPE'
+            bbox: Bounding box (left, top, width, height) in inches
+            mode: 'intersects' to match shapes overlapping the box, 'within' to match shapes inside it
+            slide_indices: Slides to search, all slides if not given
+
+        Returns:
+            A list of dictionaries describing the matching shapes
+        """
+        if name is not None:
+            name = name.lower()
+        if shape_type is not None:
+            shape_type = shape_type.upper()
+        if bbox is not None:
+            box_left, box_top = bbox[0], bbox[1]
+            box_right, box_bottom = box_left + bbox[2], box_top + bbox[3]
+
+        matches = []
+        with self._lock:
+            if slide_indices is None:
+                slide_indices = range(self.slide_count)
+            for slide_index in slide_indices:
+                entry = self._shape_entry(self.slide(slide_index))
+                for shape_index, record in enumerate(entry.records):
+                    if name is not None and name not in record["name"].lower():
+                        continue
+                    if shape_type is not None and record["shape_type"] != shape_type:
+                        continue
+                    if bbox is not None:
+                        left, top, width, height = (record[key] for key in ('left', 'top', 'width', 'height'))
+                        if None in (left, top, width, height):
+                            continue
+                        right, bottom = left + width, top + height
+                        if mode == 'within':
+                            if left < box_left or top < box_top or right > box_right or bottom > box_bottom:
+                                continue
+                        elif right <= box_left or left >= box_right or bottom <= box_top or top >= box_bottom:
+                            continue
+                    matches.append({"slide_index": slide_index, "shape_index": shape_index, **record})
+        return matches
+
+_presentation_indexes_lock = threading.Lock()
+
+def get_presentation_index(presentation: Presentation) -> PresentationIndex:
+    """
+    Get the slide and shape index of a presentation, creating it on first use.
+
+    The index is kept on the presentation part, so it lives exactly as long as
+    the presentation; a registry keyed by the part would keep it alive through
+    the index's reference to the presentation.
+
+    Args:
+        presentation: The Presentation object
+
+    Returns:
+        The PresentationIndex of the presentation
+    """
+    part = presentation.part
+    with _presentation_indexes_lock:
+        index = getattr(part, '_presentation_index', None)
+        if index is None:
+            index = part._presentation_index = PresentationIndex(presentation)
+        return index
+
+def release_presentation(presentation: Presentation) -> None:
+    """
+    Drop the caches kept for a presentation that is being closed or unloaded.
+
+    They are freed with the presentation in any case; dropping them early frees
+    their memory without waiting for the cyclic garbage collector.
+
+    Args:
+        presentation: The Presentation object
+    """
+    with _presentation_indexes_lock:
+        presentation.part.__dict__.pop('_presentation_index', None)
+    image_cache.release(presentation.part.package)
+
+def get_slide(presentation: Presentation, slide_index: int):
+    """
+    Get a slide by its position, using the presentation index.
+
+    Args:
+        presentation: The Presentation object
+        slide_index: Index of the slide
+
+    Returns:
+        The slide
+    """
+    return get_presentation_index(presentation).slide(slide_index)
+
+def get_slide_count(presentation: Presentation) -> int:
+    """
+    Get the number of slides in a presentation.
+
+    Args:
+        presentation: The Presentation object
+
+    Returns:
+        The number of slides
+    """
+    return get_presentation_index(presentation).slide_count
+
+def get_shapes(presentation: Presentation, slide) -> List:
+    """
+    Get the shapes of a slide, using the presentation index.
+
+    Args:
+        presentation: The Presentation object
+        slide: The slide
+
+    Returns:
+        A list of shapes in z-order; must not be modified
+    """
+    return get_presentation_index(presentation).shapes(slide)
+
+# ---- Slide Copy Functions ----
+
+# Relationships of a slide that are not copied with it: comments refer to authors
+# of the source presentation
+_UNCOPIED_SLIDE_RELS = frozenset([RT.COMMENTS])
+
+# SHA-1 digests of binary parts, with the blob they were computed from
+_part_digests = weakref.WeakKeyDictionary()
+
+def _part_digest(part) -> str:
+    blob = part.blob
+    cached = _part_digests.get(part)
+    if cached is None or cached[0] is not blob:
+        cached = _part_digests[part] = (blob, hashlib.sha1(blob).hexdigest())
+    return cached[1]
+
+def _is_shared_media(part) -> bool:
+    """Whether a part is media that slides can share; its bytes are only ever replaced, never modified."""
+    return isinstance(part, (ImagePart, MediaPart)) or part.content_type.startswith(('image/', 'audio/', 'video/'))
+
+class SlideCopier:
+    """
+    Copies slides within a presentation or from another one.
+
+    A copied slide gets a deep copy of the slide XML and of every part it relates
+    to, such as its notes slide, charts and their embedded workbooks, with the
+    same relationship ids, so the slide XML needs no rewriting. Images and other media are not
+    copied: copies in the same presentation share the source's media parts, and
+    copies from another presentation reuse an identical media part of the target
+    if there is one (by SHA-1), or get a new part holding the same bytes, which
+    are written as they are when saved. Slide layouts are matched by name in
+    another presentation, ignoring case; the names of layouts without a match
+    are collected in unmatched_layouts, and slides using them get the layout at
+    the same position in the target.
+
+    A copier keeps the target's partnames and media for the operation it is used
+    for, so one copier must not be used across other changes to the target.
+    """
+
+    def __init__(self, source: Presentation, target: Presentation):
+        self.source = source
+        self.target = target
+        self.package = target.part.package
+        self.same_package = source.part.package is self.package
+        self.stats = {"parts_cloned": 0, "media_reused": 0, "media_added": 0}
+        self._partnames = {part.partname for part in self.package.iter_parts()}
+        self._partname_numbers = {}
+        self._cloned = {}
+        self._slide_copies = {}
+        self._layouts = {}
+        self.unmatched_layouts = set()
+        self._media = None
+        sldIdLst = target.part._element.get_or_add_sldIdLst()
+        self._next_slide_id = max([255] + [sldId.id for sldId in sldIdLst.sldId_lst]) + 1
+
+    def copy_slides(self, slides: List, position: int = None) -> List:
+        """
+        Copy slides to the target presentation.
+
+        Links between the copied slides point to the copies.
+
+        Args:
+            slides: The slides to copy, from the source presentation
+            position: Index to insert the copies at, or None to append them
+
+        Returns:
+            The new slides
+        """
+        copies = []
+        for slide in slides:
+            element = copy.deepcopy(slide.part._element)
+            slide_part = SlidePart(self._next_partname('/ppt/slides/slide%d.xml'), CT.PML_SLIDE, self.package, element)
+            self._slide_copies[slide.part] = slide_part
+            copies.append((slide, slide_part, element))
+
+        sldIdLst = self.target.part._element.get_or_add_sldIdLst()
+        new_slides = []
+        for offset, (slide, slide_part, element) in enumerate(copies):
+            self._copy_rels(slide.part, slide_part, element)
+            rId = self.target.part.relate_to(slide_part, RT.SLIDE)
+            sldId = sldIdLst._add_sldId(id=self._next_slide_id, rId=rId)
+            self._next_slide_id += 1
+            if position is not None:
+                sldIdLst.insert(position + offset, sldId)
+
+            new_slides.append(slide_part.slide)
+        return new_slides
+
+    def _next_partname(self, template: str) -> PackURI:
+        number = self._partname_numbers.get(template, 1)
+        while PackURI(template % number) in self._partnames:
+            number += 1
+        self._partname_numbers[template] = number + 1
+        partname = PackURI(template % number)
+        self._partnames.add(partname)
+        return partname
+
+    def _copy_rels(self, source_part, part, element=None) -> None:
+        rels = part.rels
+        for rId, rel in source_part.rels.items():
+            if rel.reltype in _UNCOPIED_SLIDE_RELS:
+                continue
+            if rel.is_external:
+                rels._rels[rId] = _Relationship(rels._base_uri, rId, rel.reltype, RTM.EXTERNAL, rel.target_ref)
+                continue
+            target_part = self._target_part(rel)
+            if target_part is None:
+                # A link to a slide of another presentation that is not copied; the link is removed
+                if element is not None:
+                    for referencing in element.xpath(f'.//*[@r:id="{rId}"]'):
+                        referencing.getparent().remove(referencing)
+                continue
+            rels._rels[rId] = _Relationship(rels._base_uri, rId, rel.reltype, RTM.INTERNAL, target_part)
+
+    def _target_part(self, rel):
+        part = rel.target_part
+        if rel.reltype == RT.SLIDE_LAYOUT:
+            return self._layout_part(part)
+        if rel.reltype == RT.SLIDE:
+            # Also the link from a notes slide back to its slide
+            return self._slide_copies.get(part, part if self.same_package else None)
+        if rel.reltype == RT.NOTES_MASTER:
+            return part if self.same_package else self.target.part.notes_master_part
+        if _is_shared_media(part):
+            return self._media_part(part)
+        return self._clone_part(part)
+
+    def _layout_part(self, layout_part):
+        if self.same_package:
+            return layout_part
+        if layout_part not in self._layouts:
+            layouts = list(self.target.slide_layouts)
+            name = layout_part.slide_layout.name
+            key = (name or '').strip().casefold()
+            matches = [layout for layout in layouts if (layout.name or '').strip().casefold() == key]
+            if not matches:
+                # Fall back to the layout at the same position, or the first one
+                self.unmatched_layouts.add(name)
+                source_layouts = list(self.source.slide_layouts)
+                position = next((i for i, layout in enumerate(source_layouts) if layout.part is layout_part), 0)
+                matches = [layouts[position if position < len(layouts) else 0]]
+            self._layouts[layout_part] = matches[0].part
+        return self._layouts[layout_part]
+
+    def _media_part(self, part):
+        if self.same_package:
+            self.stats["media_reused"] += 1
+            return part
+        if self._media is None:
+            self._media = {(media.content_type, _part_digest(media)): media
+                           for media in self.package.iter_parts() if _is_shared_media(media)}
+        key = (part.content_type, _part_digest(part))
+        media = self._media.get(key)
+        if media is not None:
+            self.stats["media_reused"] += 1
+            return media
+        media = type(part).load(self._next_partname(_partname_template(part.partname)), part.content_type,
+                                self.package, part.blob)
+        self._media[key] = media
+        self.stats["media_added"] += 1
+        return media
+
+    def _clone_part(self, part):
+        clone = self._cloned.get(part)
+        if clone is not None:
+            return clone
+        partname = self._next_partname(_partname_template(part.partname))
+        if isinstance(part, XmlPart):
+            element = copy.deepcopy(part._element)
+            clone = type(part)(partname, part.content_type, self.package, element)
+        else:
+            element = None
+            clone = type(part).load(partname, part.content_type, self.package, part.blob)
+        self._cloned[part] = clone
+        self.stats["parts_cloned"] += 1
+        self._copy_rels(part, clone, element)
+        return clone
+
+def _partname_template(partname: str) -> str:
+    """Turn a partname like /ppt/charts/chart3.xml into the template /ppt/charts/chart%d.xml."""
+    return re.sub(r'\d*(\.[^./]+)$', r'%d\1', partname.replace('%', '%%'))
+
+def _finish_slide_changes(presentation: Presentation) -> None:
+    mark_modified(presentation.part)
+    get_presentation_index(presentation).invalidate()
+
+def copy_slides(source: Presentation, target: Presentation, slide_indices: List[int],
+                insert_index: int = None) -> Dict:
+    """
+    Copy slides from one presentation to another, or within a presentation.
+
+    See SlideCopier for what is copied and what is shared.
+
+    Args:
+        source: The presentation to copy from
+        target: The presentation to copy to, which may be the source
+        slide_indices: Indices of the slides to copy, in the order to insert them
+        insert_index: Index in the target to insert the copies at, or None to append them
+
+    Returns:
+        A dict with the indices of the new slides and the number of parts cloned,
+        media parts reused and media parts added
+    """
+    source_index = get_presentation_index(source)
+    slides = [source_index.slide(i) for i in slide_indices]
+    slide_count = get_slide_count(target)
+    if insert_index is None:
+        insert_index = slide_count
+    if not 0 <= insert_index <= slide_count:
+        raise IndexError(f"insert index {insert_index} out of range 0-{slide_count}")
+
+    copier = SlideCopier(source, target)
+    copier.copy_slides(slides, insert_index)
+    _finish_slide_changes(target)
+
+    return dict(slide_indices=list(range(insert_index, insert_index + len(slides))), **copier.stats)
+
+def duplicate_slide(presentation: Presentation, slide_index: int, insert_index: int = None) -> Dict:
+    """
+    Duplicate a slide of a presentation.
+
+    Args:
+        presentation: The Presentation object
+        slide_index: Index of the slide to duplicate
+        insert_index: Index to insert the copy at, by default right after the slide
+
+    Returns:
+        A dict as returned by copy_slides
+    """
+    if insert_index is None:
+        insert_index = slide_index + 1
+    return copy_slides(presentation, presentation, [slide_index], insert_index)
+
+def merge_decks(target: Presentation, file_paths: List[str]) -> List[Dict]:
+    """
+    Append every slide of a list of deck files to a presentation.
+
+    Slides are copied as by copy_slides, so source layouts are mapped onto the
+    target's slide master by name, and media that is identical across the decks
+    (such as a logo on every slide of every deck) is stored only once.
+    The decks are opened lazily and one at a time.
+
+    Args:
+        target: The presentation to append to
+        file_paths: Paths of the .pptx files to append, in order
+
+    Returns:
+        A report per file with its slide count, the number of parts cloned, media
+        parts reused and added, and the names of layouts without a match in the target
+    """
+    reports = []
+    for file_path in file_paths:
+        source = open_presentation(file_path, lazy=True)
+        index = get_presentation_index(source)
+        copier = SlideCopier(source, target)
+        copier.copy_slides([index.slide(i) for i in range(index.slide_count)])
+        reports.append(dict(file_path=file_path, slide_count=index.slide_count,
+                            unmatched_layouts=sorted(copier.unmatched_layouts), **copier.stats))
+    _finish_slide_changes(target)
+    return reports
+
+def reorder_slides(presentation: Presentation, order: List[int]) -> None:
+    """
+    Reorder the slides of a presentation.
+
+    Args:
+        presentation: The Presentation object
+        order: The current indices of the slides, in their new order; must list every slide once
+    """
+    sldIdLst = presentation.part._element.get_or_add_sldIdLst()
+    sldIds = sldIdLst.sldId_lst
+    if sorted(order) != list(range(len(sldIds))):
+        raise ValueError(f"order must list each slide index from 0 to {len(sldIds) - 1} exactly once")
+    for index in order:
+        # Appending an element that is already in the list moves it
+        sldIdLst.append(sldIds[index])
+    _finish_slide_changes(presentation)
+
 # ---- Placeholder Functions ----
 
 def get_placeholders(slide) -> List[Dict]:
@@ -296,16 +1915,11 @@ def format_text(text_frame, font_size: int = None, font_name: str = None,
         color: RGB color tuple (r, g, b)
         alignment: Text alignment ('left', 'center', 'right', 'justify')
     """
-    alignment_map = {
-        'left': PP_ALIGN.LEFT,
-        'center': PP_ALIGN.CENTER,
-        'right': PP_ALIGN.RIGHT,
-        'justify': PP_ALIGN.JUSTIFY
-    }
+    alignment = ALIGNMENTS.get(alignment)
     
     for paragraph in text_frame.paragraphs:
-        if alignment and alignment in alignment_map:
-            paragraph.alignment = alignment_map[alignment]
+        if alignment is not None:
+            paragraph.alignment = alignment
             
         for run in paragraph.runs:
             font = run.font
@@ -326,12 +1940,382 @@ def format_text(text_frame, font_size: int = None, font_name: str = None,
                 r, g, b = color
                 font.color.rgb = RGBColor(r, g, b)
 
+def _text_match_run(item, position: int) -> Tuple[int, int]:
+    # Run (a:r index within the paragraph) and offset within that run of a text position
+    for text_node in item.text_nodes:
+        length = len(text_node.text or '')
+        if position < length or text_node is item.text_nodes[-1]:
+            run = text_node.getparent()
+            return list(run.getparent().iterchildren(qn('a:r'))).index(run), position
+        position -= length
+
+def search_text(presentation: Presentation, query: str, match_case: bool = False, whole_word: bool = False,
+                slide_indices: List[int] = None, context: int = 30) -> List[Dict]:
+    """
+    Find text in the titles, placeholders, textboxes, table cells, chart titles and notes of a presentation.
+
+    Matches are found within a paragraph, also when the text is split across
+    runs with different formatting, but not across line breaks.
+
+    Args:
+        presentation: The Presentation object
+        query: The text to find
+        match_case: Whether the case of letters must match
+        whole_word: Whether the query must not be part of a longer word
+        slide_indices: Slides to search, all slides if not given
+        context: Number of characters around each match to include in its text
+
+    Returns:
+        A list of matches in slide order, each with the slide, the shape, the
+        paragraph, the run and offset within it where the match starts, and the
+        surrounding text; table cells also have their row and column
+    """
+    index = get_presentation_index(presentation)
+    slide_ids = index.slide_ids()
+    matches = []
+    for slide_index, item, found in index.search_text(query, match_case, whole_word, slide_indices):
+        for match in found:
+            run, offset = _text_match_run(item, match.start())
+            start = max(match.start() - context, 0)
+            end = match.end() + context
+            result = {
+                "slide_index": slide_index,
+                "slide_id": slide_ids[slide_index],
+                "kind": item.kind,
+                "shape_id": item.shape_id,
+                "shape_name": item.shape_name,
+                "paragraph": item.paragraph,
+                "run": run,
+                "offset": offset,
+                "text": ('...' if start > 0 else '') + item.text[start:end] + ('...' if end < len(item.text) else ''),
+            }
+            if item.row is not None:
+                result["row"] = item.row
+                result["col"] = item.col
+            matches.append(result)
+    return matches
+
+def replace_text(presentation: Presentation, query: str, replacement: str, match_case: bool = False,
+                 whole_word: bool = False, slide_indices: List[int] = None) -> Dict:
+    """
+    Replace text in the titles, placeholders, textboxes, table cells, chart titles and notes of a presentation.
+
+    Text is matched as by search_text(). The replacement takes the formatting of
+    the run the match starts in; the runs around the match keep their formatting.
+
+    Args:
+        presentation: The Presentation object
+        query: The text to replace
+        replacement: The new text
+        match_case: Whether the case of letters must match
+        whole_word: Whether the query must not be part of a longer word
+        slide_indices: Slides to replace in, all slides if not given
+
+    Returns:
+        A dict with the number of replacements and the indices of the changed slides
+    """
+    index = get_presentation_index(presentation)
+    replacements = 0
+    changed = {}
+    for slide_index, item, found in index.search_text(query, match_case, whole_word, slide_indices):
+        spans = [(match.start(), match.end(), replacement) for match in found]
+        texts = _replace_across_runs([text_node.text or '' for text_node in item.text_nodes], spans)
+        for text_node, text in zip(item.text_nodes, texts):
+            if text != (text_node.text or ''):
+                text_node.text = text
+        replacements += len(spans)
+        changed.setdefault(slide_index, set()).add(item.part)
+
+    for parts in changed.values():
+        for part in parts:
+            mark_modified(part)
+    return {"replacements": replacements, "slide_indices": sorted(changed)}
+
 # ---- Image Functions ----
 
-def add_image(slide, image_path: str, left: float, top: float, width: float = None, height: float = None) -> Any:
+class CachedImage(PptxImage):
+    """python-pptx Image whose content hash is computed only once."""
+
+    @lazyproperty
+    def sha1(self) -> str:
+        return hashlib.sha1(self._blob).hexdigest()
+
+class ImageCache:
+    """
+    Process-wide cache of images keyed by content hash, with size-bounded LRU eviction.
+
+    Each entry is a python-pptx Image holding the image bytes; its pixel size, DPI
+    and format are probed with PIL once and then kept with the entry. File paths
+    (with their modification time and size) and base64 strings are mapped to the
+    content hash, so a repeat insertion skips reading the file or decoding the
+    base64 payload. The image part created for each image is remembered on its
+    package, so repeat insertions into the same presentation reuse it without
+    searching the package's image parts; the cache itself holds no reference to
+    a package, whose image parts would keep it alive.
+    """
+
+    def __init__(self, max_bytes: int = 256 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._images = OrderedDict()
+        self._size = 0
+        self._aliases = {}
+        self._lock = threading.RLock()
+
+    def load_file(self, image_path: str) -> CachedImage:
+        """Return the cached image for a file, reading it only if it is not cached."""
+        stat = os.stat(image_path)
+        alias = ('file', os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size)
+        image = self._lookup_alias(alias)
+        if image is None:
+            with open(image_path, 'rb') as f:
+                image = self._add(alias, f.read(), os.path.basename(image_path))
+        return image
+
+    def load_base64(self, base64_string: str) -> CachedImage:
+        """Return the cached image for a base64 string, decoding it only if it is not cached."""
+        alias = ('base64', hashlib.sha1(base64_string.encode('ascii')).hexdigest())
+        image = self._lookup_alias(alias)
+        if image is None:
+            image = self._add(alias, base64.b64decode(base64_string), None)
+        return image
+
+    def load_blob(self, blob: bytes, filename: str = None) -> CachedImage:
+        """Return the cached image for image bytes."""
+        sha1 = hashlib.sha1(blob).hexdigest()
+        with self._lock:
+            if sha1 in self._images:
+                self.hits += 1
+                self._images.move_to_end(sha1)
+                return self._images[sha1]
+        return self._add(None, blob, filename)
+
+    def load_derived(self, key, make_blob, filename: str = None) -> CachedImage:
+        """
+        Return the cached image derived from another one, e.g. a resampled copy.
+
+        Args:
+            key: Hashable key identifying the source image and the transformation
+            make_blob: Function returning the derived image bytes, called on a miss
+            filename: Filename to associate with the derived image
+        """
+        alias = ('derived', key)
+        image = self._lookup_alias(alias)
+        if image is None:
+            image = self._add(alias, make_blob(), filename)
+        return image
+
+    def image_part_for(self, package, image: CachedImage):
+        """Return the image part containing `image` in `package`, creating it if needed."""
+        with self._lock:
+            parts = package.__dict__.setdefault('_cached_image_parts', {})
+            image_part = parts.get(image.sha1)
+            if image_part is None:
+                # Reuse an identical image already in the package, e.g. from an opened file
+                image_part = (package._image_parts._find_by_sha1(image.sha1)
+                              or ImagePart.new(package, image))
+                parts[image.sha1] = image_part
+            return image_part
+
+    def release(self, package) -> None:
+        """Forget the image parts remembered for a package that is being closed."""
+        with self._lock:
+            package.__dict__.pop('_cached_image_parts', None)
+
+    def stats(self) -> Dict:
+        """Return hit/miss counters and current size of the cache."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'entries': len(self._images),
+                'size_bytes': self._size,
+                'max_bytes': self.max_bytes
+            }
+
+    def clear(self) -> None:
+        """Remove all cached images and reset the counters."""
+        with self._lock:
+            self._images.clear()
+            self._aliases.clear()
+            self._size = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def _lookup_alias(self, alias) -> Optional[CachedImage]:
+        with self._lock:
+            sha1 = self._aliases.get(alias)
+            if sha1 is not None and sha1 in self._images:
+                self.hits += 1
+                self._images.move_to_end(sha1)
+                return self._images[sha1]
+            return None
+
+    def _add(self, alias, blob: bytes, filename: Optional[str]) -> CachedImage:
+        image = CachedImage.from_blob(blob, filename)
+        # Probe the image with PIL now, so unreadable images are not cached and
+        # later insertions can use the stored pixel size and DPI
+        image.size, image.dpi
+
+        with self._lock:
+            self.misses += 1
+            sha1 = image.sha1
+            if sha1 in self._images:
+                image = self._images[sha1]
+                self._images.move_to_end(sha1)
+            else:
+                self._images[sha1] = image
+                self._size += len(blob)
+                self._evict()
+            if alias is not None:
+                self._aliases[alias] = sha1
+        return image
+
+    def _evict(self) -> None:
+        # The most recently added image is always kept
+        while self._size > self.max_bytes and len(self._images) > 1:
+            sha1, image = self._images.popitem(last=False)
+            self._size -= len(image.blob)
+            self.evictions += 1
+            self._aliases = {a: s for a, s in self._aliases.items() if s != sha1}
+
+# Shared image cache used by add_image and add_image_from_base64
+image_cache = ImageCache()
+
+def add_cached_image(slide, image: CachedImage, left: float, top: float,
+                     width: float = None, height: float = None) -> Any:
+    """
+    Add an image from the image cache to a slide.
+
+    This follows SlideShapes.add_picture(), but uses the cached image part and the
+    cached pixel size and DPI instead of hashing the image again, searching the
+    package's image parts and probing the image with PIL.
+
+    Args:
+        slide: The slide object
+        image: Image returned by image_cache
+        left: Left position in inches
+        top: Top position in inches
+        width: Width in inches (optional)
+        height: Height in inches (optional)
+
+    Returns:
+        The created picture shape
+    """
+    image_part = image_cache.image_part_for(slide.part.package, image)
+    rId = slide.part.relate_to(image_part, RT.IMAGE)
+
+    # Native size in EMU, as computed by ImagePart._native_size
+    horz_dpi, vert_dpi = image.dpi
+    width_px, height_px = image.size
+    native_cx = int(914400 * width_px / horz_dpi)
+    native_cy = int(914400 * height_px / vert_dpi)
+
+    cx = Inches(width) if width else None
+    cy = Inches(height) if height else None
+    if cx is None and cy is None:
+        cx, cy = native_cx, native_cy
+    elif cy is None:
+        cy = int(native_cy * cx / native_cx)
+    elif cx is None:
+        cx = int(native_cx * cy / native_cy)
+
+    shapes = slide.shapes
+    shape_id = shapes._next_shape_id
+    pic = shapes._spTree.add_pic(
+        shape_id, f"Picture {shape_id - 1}", image_part.desc, rId,
+        Inches(left), Inches(top), Emu(cx), Emu(cy)
+    )
+    return shapes._shape_factory(pic)
+
+def optimize_image(image: CachedImage, width: float = None, height: float = None,
+                   target_dpi: int = DEFAULT_IMAGE_OPTIMIZATION['target_dpi'],
+                   jpeg_quality: int = DEFAULT_IMAGE_OPTIMIZATION['jpeg_quality'],
+                   png_optimize: bool = DEFAULT_IMAGE_OPTIMIZATION['png_optimize'],
+                   strip_metadata: bool = DEFAULT_IMAGE_OPTIMIZATION['strip_metadata']) -> Tuple[CachedImage, float, float]:
+    """
+    Downscale and recompress an image for the size it is placed at.
+
+    The image is resampled so it has no more than `target_dpi` pixels per inch at
+    its placed size, then re-encoded (JPEG at `jpeg_quality`, PNG with the optimize
+    flag) without EXIF and text metadata. Only JPEG and PNG images are optimized.
+    If re-encoding at the same size does not make the image smaller, the original
+    is kept. Results are cached, so placing the same image at the same size again
+    does not repeat the work.
+
+    Args:
+        image: Image returned by image_cache
+        width: Placed width in inches (optional)
+        height: Placed height in inches (optional)
+        target_dpi: Maximum resolution of the placed image
+        jpeg_quality: JPEG quality (1-95) used when re-encoding JPEG images
+        png_optimize: Whether to use PIL's optimize flag when re-encoding PNG images
+        strip_metadata: Whether to drop EXIF and other metadata (the ICC profile is kept)
+
+    Returns:
+        A tuple (image, width, height) of the image to insert and its placed size in
+        inches, with any missing dimension calculated from the original aspect ratio
+    """
+    width_px, height_px = image.size
+    horz_dpi, vert_dpi = image.dpi
+    native_width = width_px / horz_dpi
+    native_height = height_px / vert_dpi
+
+    if width and height:
+        placed = (width, height)
+    elif width:
+        placed = (width, width * native_height / native_width)
+    elif height:
+        placed = (height * native_width / native_height, height)
+    else:
+        placed = (native_width, native_height)
+
+    if image.content_type not in ('image/jpeg', 'image/png'):
+        return image, placed[0], placed[1]
+
+    target_px = (
+        max(1, min(width_px, round(placed[0] * target_dpi))),
+        max(1, min(height_px, round(placed[1] * target_dpi)))
+    )
+
+    def make_blob():
+        from PIL import Image
+
+        with Image.open(io.BytesIO(image.blob)) as pil_image:
+            save_options = {'dpi': (target_dpi, target_dpi)}
+            if pil_image.info.get('icc_profile'):
+                save_options['icc_profile'] = pil_image.info['icc_profile']
+            if not strip_metadata and pil_image.info.get('exif'):
+                save_options['exif'] = pil_image.info['exif']
+
+            resized = pil_image
+            if target_px != (width_px, height_px):
+                resized = pil_image.resize(target_px, Image.LANCZOS)
+
+            output = io.BytesIO()
+            if image.content_type == 'image/jpeg':
+                resized.save(output, 'JPEG', quality=jpeg_quality, optimize=True, **save_options)
+            else:
+                resized.save(output, 'PNG', optimize=png_optimize, **save_options)
+
+        if resized is pil_image and output.tell() >= len(image.blob):
+            return image.blob
+        return output.getvalue()
+
+    key = (image.sha1, target_px, target_dpi, jpeg_quality, png_optimize, strip_metadata)
+    optimized = image_cache.load_derived(key, make_blob, image.filename)
+    return optimized, placed[0], placed[1]
+
+def add_image(slide, image_path: str, left: float, top: float, width: float = None, height: float = None,
+              optimization: Dict = None) -> Any:
     """
     Add an image to a slide.
     
+    The image is read through the shared image cache, so inserting the same file
+    again does not re-read or re-probe it.
+
     Args:
         slide: The slide object
         image_path: Path to the image file
@@ -339,25 +2323,27 @@ def add_image(slide, image_path: str, left: float, top: float, width: float = No
         top: Top position in inches
         width: Width in inches (optional)
         height: Height in inches (optional)
+        optimization: Optional image optimization policy, as accepted by optimize_image
+            (target_dpi, jpeg_quality, png_optimize, strip_metadata); the image is
+            downscaled and recompressed for its placed size before it is embedded
         
     Returns:
         The created picture shape
     """
-    if width and height:
-        picture = slide.shapes.add_picture(
-            image_path, Inches(left), Inches(top), Inches(width), Inches(height)
-        )
-    else:
-        picture = slide.shapes.add_picture(
-            image_path, Inches(left), Inches(top)
-        )
-    return picture
+    image = image_cache.load_file(image_path)
+    if optimization is not None:
+        image, width, height = optimize_image(image, width, height, **optimization)
+    return add_cached_image(slide, image, left, top, width, height)
 
 def add_image_from_base64(slide, base64_string: str, left: float, top: float, 
-                          width: float = None, height: float = None) -> Any:
+                          width: float = None, height: float = None,
+                          optimization: Dict = None) -> Any:
     """
     Add an image from a base64 encoded string to a slide.
     
+    The image is read through the shared image cache, so inserting the same
+    payload again does not re-decode or re-probe it.
+
     Args:
         slide: The slide object
         base64_string: Base64 encoded image string
@@ -365,22 +2351,15 @@ def add_image_from_base64(slide, base64_string: str, left: float, top: float,
         top: Top position in inches
         width: Width in inches (optional)
         height: Height in inches (optional)
+        optimization: Optional image optimization policy, as accepted by optimize_image
         
     Returns:
         The created picture shape
     """
-    image_data = base64.b64decode(base64_string)
-    image_stream = io.BytesIO(image_data)
-    
-    if width and height:
-        picture = slide.shapes.add_picture(
-            image_stream, Inches(left), Inches(top), Inches(width), Inches(height)
-        )
-    else:
-        picture = slide.shapes.add_picture(
-            image_stream, Inches(left), Inches(top)
-        )
-    return picture
+    image = image_cache.load_base64(base64_string)
+    if optimization is not None:
+        image, width, height = optimize_image(image, width, height, **optimization)
+    return add_cached_image(slide, image, left, top, width, height)
 
 # ---- Table Functions ----
 
@@ -418,6 +2397,211 @@ def set_cell_text(table, row: int, col: int, text: str) -> None:
     cell = table.cell(row, col)
     cell.text = text
 
+def format_cell_value(value: Any, number_format: str = None) -> str:
+    """
+    Convert a table cell value to text, applying a number format to numeric values.
+
+    Args:
+        value: Cell value (number, numeric string or text)
+        number_format: Python format specification for numbers (e.g., ',.2f', '.1%')
+
+    Returns:
+        The cell text. Values that are not numeric, or that the format does not
+        apply to, are returned unchanged as text.
+    """
+    if value is None:
+        return ""
+
+    if number_format is not None and not isinstance(value, bool):
+        number = value
+        if isinstance(value, str):
+            try:
+                number = int(value)
+            except ValueError:
+                try:
+                    number = float(value)
+                except ValueError:
+                    number = None
+
+        if isinstance(number, (int, float)):
+            try:
+                return format(number, number_format)
+            except ValueError:
+                pass
+
+    return str(value)
+
+def _run_properties_xml(font_size: int = None, font_name: str = None, bold: bool = None,
+                        italic: bool = None, color: Tuple[int, int, int] = None) -> str:
+    """Build an a:rPr element for the given font settings, or '' if there are none."""
+    if all(v is None for v in (font_size, font_name, bold, italic, color)):
+        return ""
+
+    attributes = ""
+    if font_size is not None:
+        attributes += f' sz="{int(font_size * 100)}"'
+    if bold is not None:
+        attributes += f' b="{int(bool(bold))}"'
+    if italic is not None:
+        attributes += f' i="{int(bool(italic))}"'
+
+    children = ""
+    if color is not None:
+        r, g, b = color
+        children += f'<a:solidFill><a:srgbClr val="{r:02X}{g:02X}{b:02X}"/></a:solidFill>'
+    if font_name is not None:
+        children += f'<a:latin typeface={quoteattr(font_name)}/>'
+
+    return f'<a:rPr lang="en-US"{attributes} dirty="0">{children}</a:rPr>'
+
+def _escape_xml_text(text: str) -> str:
+    """Escape text for an a:t element, encoding characters XML cannot contain."""
+    text = _INVALID_XML_CHARS.sub(lambda m: "_x%04X_" % ord(m.group()), text)
+    return escape(text)
+
+def _run_text_groups(paragraph, tags: Tuple[str, ...] = ('a:r',)) -> List[List]:
+    """
+    Split the a:t elements of a paragraph into groups of runs that form continuous text.
+
+    Line breaks end a group. Only runs whose tag is in tags are included.
+    """
+    run_tags = {qn(tag) for tag in tags}
+    br_tag = qn('a:br')
+    groups, group = [], []
+    for child in paragraph:
+        if child.tag == br_tag:
+            groups.append(group)
+            group = []
+        elif child.tag in run_tags:
+            text_node = child.find(qn('a:t'))
+            if text_node is not None:
+                group.append(text_node)
+    groups.append(group)
+    return groups
+
+def _replace_across_runs(texts: List[str], spans: List[Tuple[int, int, str]]) -> List[str]:
+    """
+    Replace spans of the text formed by a sequence of runs, keeping the runs' formatting.
+
+    Each replacement goes into the run its span starts in; the rest of the span is
+    cut from the following runs, so formatting changes within the span are lost but
+    the text around it keeps its runs.
+
+    Args:
+        texts: Text of each run
+        spans: Non-overlapping (start, end, replacement) offsets into the joined text, in order
+
+    Returns:
+        The new text of each run
+    """
+    texts = list(texts)
+    starts = list(itertools.accumulate([0] + [len(text) for text in texts[:-1]]))
+    # From the end, so the offsets of the spans still to be replaced stay valid
+    for start, end, replacement in reversed(spans):
+        first = bisect.bisect_right(starts, start) - 1
+        last = bisect.bisect_right(starts, max(end - 1, start)) - 1
+        for i in range(last, first - 1, -1):
+            cut_start = max(start - starts[i], 0)
+            cut_end = min(end - starts[i], len(texts[i]))
+            texts[i] = texts[i][:cut_start] + (replacement if i == first else '') + texts[i][cut_end:]
+    return texts
+
+def _text_body_xml(text: str, run_properties: str = "", paragraph_properties: str = "") -> str:
+    """Build an a:txBody element with one paragraph per line of text."""
+    paragraphs = []
+    for line in text.split("\n"):
+        if line:
+            paragraphs.append(
+                f'<a:p>{paragraph_properties}<a:r>{run_properties}'
+                f'<a:t>{_escape_xml_text(line)}</a:t></a:r></a:p>'
+            )
+        else:
+            paragraphs.append(f'<a:p>{paragraph_properties}</a:p>')
+    return f'<a:txBody><a:bodyPr/><a:lstStyle/>{"".join(paragraphs)}</a:txBody>'
+
+def fill_table(table, data: List[List[Any]], column_formats: List[Optional[str]] = None,
+               header_format: Dict = None) -> List[str]:
+    """
+    Populate a table with data in a single pass.
+
+    The text bodies of all cells are built as one XML fragment, parsed once and
+    swapped into the table, instead of setting each cell's text through
+    table.cell(row, col).text. Cell properties such as fills and merges are kept.
+
+    Args:
+        table: The table object
+        data: List of rows, each a list of cell values
+        column_formats: Python number format specification per column (e.g., ',.2f'),
+            applied to numeric values. None entries leave the column unformatted.
+        header_format: Formatting for the first row, treated as a header row that is
+            not number formatted. Supported keys: font_size, font_name, bold, italic,
+            color, bg_color and alignment, as in format_table_cell.
+
+    Returns:
+        A list of warnings for data that did not fit in the table
+    """
+    tr_lst = table._tbl.tr_lst
+    row_count = len(tr_lst)
+    col_count = len(table.columns)
+    warnings = []
+
+    if len(data) > row_count:
+        warnings.append(f"Ignored excess data: table has only {row_count} rows but data has {len(data)} rows")
+
+    column_formats = list(column_formats or [])
+    column_formats += [None] * (col_count - len(column_formats))
+
+    header_run_properties = ""
+    header_paragraph_properties = ""
+    if header_format is not None:
+        header_run_properties = _run_properties_xml(
+            font_size=header_format.get('font_size'),
+            font_name=header_format.get('font_name'),
+            bold=header_format.get('bold'),
+            italic=header_format.get('italic'),
+            color=header_format.get('color')
+        )
+        alignment = ALIGNMENTS.get(header_format.get('alignment'))
+        if alignment is not None:
+            header_paragraph_properties = f'<a:pPr algn="{alignment.xml_value}"/>'
+
+    rows_xml = []
+    for row_idx, row_data in enumerate(data[:row_count]):
+        if len(row_data) > col_count:
+            warnings.append(f"Ignored excess data in row {row_idx}: table has only {col_count} columns")
+
+        is_header = row_idx == 0 and header_format is not None
+        cells_xml = []
+        for col_idx, value in enumerate(row_data[:col_count]):
+            if is_header:
+                cells_xml.append(_text_body_xml(
+                    format_cell_value(value), header_run_properties, header_paragraph_properties
+                ))
+            else:
+                cells_xml.append(_text_body_xml(format_cell_value(value, column_formats[col_idx])))
+        rows_xml.append(f'<a:tr>{"".join(f"<a:tc>{c}</a:tc>" for c in cells_xml)}</a:tr>')
+
+    new_tbl = parse_xml(f'<a:tbl {nsdecls("a")}>{"".join(rows_xml)}</a:tbl>')
+
+    # Move the new text bodies into the existing cells
+    for tr, new_tr in zip(tr_lst, new_tbl.findall(qn('a:tr'))):
+        for tc, new_tc in zip(tr.tc_lst, new_tr.findall(qn('a:tc'))):
+            new_txBody = new_tc.find(qn('a:txBody'))
+            txBody = tc.find(qn('a:txBody'))
+            if txBody is not None:
+                tc.replace(txBody, new_txBody)
+            else:
+                tc.insert(0, new_txBody)
+
+    if header_format is not None and header_format.get('bg_color') is not None and data:
+        r, g, b = header_format['bg_color']
+        for col_idx in range(min(len(data[0]), col_count)):
+            cell = table.cell(0, col_idx)
+            cell.fill.solid()
+            cell.fill.fore_color.rgb = RGBColor(r, g, b)
+
+    return warnings
+
 def format_table_cell(cell, font_size: int = None, font_name: str = None, 
                      bold: bool = None, italic: bool = None, 
                      color: Tuple[int, int, int] = None,
@@ -438,28 +2622,18 @@ def format_table_cell(cell, font_size: int = None, font_name: str = None,
         alignment: Text alignment ('left', 'center', 'right', 'justify')
         vertical_alignment: Vertical alignment ('top', 'middle', 'bottom')
     """
-    alignment_map = {
-        'left': PP_ALIGN.LEFT,
-        'center': PP_ALIGN.CENTER,
-        'right': PP_ALIGN.RIGHT,
-        'justify': PP_ALIGN.JUSTIFY
-    }
-    
-    vertical_alignment_map = {
-        'top': MSO_VERTICAL_ANCHOR.TOP,
-        'middle': MSO_VERTICAL_ANCHOR.MIDDLE,
-        'bottom': MSO_VERTICAL_ANCHOR.BOTTOM
-    }
+    alignment = ALIGNMENTS.get(alignment)
+    vertical_alignment = VERTICAL_ALIGNMENTS.get(vertical_alignment)
     
     # Format text
     text_frame = cell.text_frame
     
-    if vertical_alignment and vertical_alignment in vertical_alignment_map:
-        text_frame.vertical_anchor = vertical_alignment_map[vertical_alignment]
+    if vertical_alignment is not None:
+        text_frame.vertical_anchor = vertical_alignment
     
     for paragraph in text_frame.paragraphs:
-        if alignment and alignment in alignment_map:
-            paragraph.alignment = alignment_map[alignment]
+        if alignment is not None:
+            paragraph.alignment = alignment
             
         for run in paragraph.runs:
             font = run.font
@@ -486,6 +2660,52 @@ def format_table_cell(cell, font_size: int = None, font_name: str = None,
         cell.fill.solid()
         cell.fill.fore_color.rgb = RGBColor(r, g, b)
 
+def format_table_range(table, rows: List[int] = None, cols: List[int] = None,
+                       band_bg_colors: List[Tuple[int, int, int]] = None,
+                       band_by: str = 'row', **format_options) -> int:
+    """
+    Format a range of table cells in a single traversal of the table.
+
+    Args:
+        table: The table object
+        rows: Row indices to format (all rows if None)
+        cols: Column indices to format (all columns if None)
+        band_bg_colors: Background colors applied in turn to successive selected
+            rows (or columns), e.g. two colors for alternate-row striping
+        band_by: Whether bands alternate by 'row' or 'column'
+        **format_options: Formatting applied to every selected cell, as accepted by
+            format_table_cell (font_size, font_name, bold, italic, color, bg_color,
+            alignment, vertical_alignment)
+
+    Returns:
+        The number of cells formatted
+    """
+    row_set = set(rows) if rows is not None else None
+    col_set = set(cols) if cols is not None else None
+    cells_formatted = 0
+    band_row = -1
+
+    for row_idx, row in enumerate(table.rows):
+        if row_set is not None and row_idx not in row_set:
+            continue
+        band_row += 1
+        band_col = -1
+
+        for col_idx, cell in enumerate(row.cells):
+            if col_set is not None and col_idx not in col_set:
+                continue
+            band_col += 1
+
+            options = format_options
+            if band_bg_colors:
+                band = band_row if band_by == 'row' else band_col
+                options = dict(format_options, bg_color=band_bg_colors[band % len(band_bg_colors)])
+
+            format_table_cell(cell, **options)
+            cells_formatted += 1
+
+    return cells_formatted
+
 # ---- Shape Functions ----
 
 def add_shape(slide, shape_type: str, left: float, top: float, width: float, height: float) -> Any:
@@ -503,48 +2723,7 @@ def add_shape(slide, shape_type: str, left: float, top: float, width: float, hei
     Returns:
         The created shape
     """
-    # Ensure shape_type is a string
-    shape_type_str = str(shape_type)
-    shape_type_lower = shape_type_str.lower()
-    
-    # Define shape type mapping with correct enum values
-    shape_type_map = {
-        'rectangle': MSO_SHAPE.RECTANGLE,
-        'rounded_rectangle': MSO_SHAPE.ROUNDED_RECTANGLE,
-        'oval': MSO_SHAPE.OVAL,
-        'diamond': MSO_SHAPE.DIAMOND,
-        'triangle': MSO_SHAPE.ISOSCELES_TRIANGLE,  # Changed from TRIANGLE to ISOSCELES_TRIANGLE
-        'isosceles_triangle': MSO_SHAPE.ISOSCELES_TRIANGLE,
-        'right_triangle': MSO_SHAPE.RIGHT_TRIANGLE,
-        'pentagon': MSO_SHAPE.PENTAGON,
-        'hexagon': MSO_SHAPE.HEXAGON,
-        'heptagon': MSO_SHAPE.HEPTAGON,
-        'octagon': MSO_SHAPE.OCTAGON,
-        'star': MSO_SHAPE.STAR_5_POINTS,
-        'arrow': MSO_SHAPE.ARROW,
-        'cloud': MSO_SHAPE.CLOUD,
-        'heart': MSO_SHAPE.HEART,
-        'lightning_bolt': MSO_SHAPE.LIGHTNING_BOLT,
-        'sun': MSO_SHAPE.SUN,
-        'moon': MSO_SHAPE.MOON,
-        'smiley_face': MSO_SHAPE.SMILEY_FACE,
-        'no_symbol': MSO_SHAPE.NO_SYMBOL,
-        'flowchart_process': MSO_SHAPE.FLOWCHART_PROCESS,
-        'flowchart_decision': MSO_SHAPE.FLOWCHART_DECISION,
-        'flowchart_data': MSO_SHAPE.FLOWCHART_DATA,
-        'flowchart_document': MSO_SHAPE.FLOWCHART_DOCUMENT,
-        'flowchart_predefined_process': MSO_SHAPE.FLOWCHART_PREDEFINED_PROCESS,
-        'flowchart_internal_storage': MSO_SHAPE.FLOWCHART_INTERNAL_STORAGE,
-        'flowchart_connector': MSO_SHAPE.FLOWCHART_CONNECTOR
-    }
-    
-    # Check if shape type is valid before trying to use it
-    if shape_type_lower not in shape_type_map:
-        available_shapes = ', '.join(sorted(shape_type_map.keys()))
-        raise ValueError(f"Unsupported shape type: '{shape_type}'. Available shape types: {available_shapes}")
-    
-    # Get the shape enum value
-    shape_enum = shape_type_map[shape_type_lower]
+    shape_enum = SHAPE_TYPES.lookup(shape_type)
     
     # Create the shape with better error handling
     try:
@@ -600,30 +2779,26 @@ def add_chart(slide, chart_type: str, left: float, top: float, width: float, hei
     Returns:
         The created chart
     """
-    chart_type_map = {
-        'column': XL_CHART_TYPE.COLUMN_CLUSTERED,
-        'stacked_column': XL_CHART_TYPE.COLUMN_STACKED,
-        'bar': XL_CHART_TYPE.BAR_CLUSTERED,
-        'stacked_bar': XL_CHART_TYPE.BAR_STACKED,
-        'line': XL_CHART_TYPE.LINE,
-        'line_markers': XL_CHART_TYPE.LINE_MARKERS,
-        'pie': XL_CHART_TYPE.PIE,
-        'doughnut': XL_CHART_TYPE.DOUGHNUT,
-        'area': XL_CHART_TYPE.AREA,
-        'stacked_area': XL_CHART_TYPE.AREA_STACKED,
-        'scatter': XL_CHART_TYPE.XY_SCATTER,
-        'radar': XL_CHART_TYPE.RADAR,
-        'radar_markers': XL_CHART_TYPE.RADAR_MARKERS
-    }
-    
-    chart_type_enum = chart_type_map.get(chart_type.lower(), XL_CHART_TYPE.COLUMN_CLUSTERED)
+    chart_type_enum = CHART_TYPES.get(chart_type, XL_CHART_TYPE.COLUMN_CLUSTERED)
     
     # Create chart data
-    chart_data = CategoryChartData()
-    chart_data.categories = categories
-    
-    for i, series_name in enumerate(series_names):
-        chart_data.add_series(series_name, series_values[i])
+    if chart_type_enum in _XY_CHART_TYPES:
+        # XY charts need numeric x values; categories that are not numbers are plotted at 1, 2, 3...
+        try:
+            x_values = [float(category) for category in categories]
+        except (TypeError, ValueError):
+            x_values = list(range(1, len(categories) + 1))
+        chart_data = XyChartData()
+        for i, series_name in enumerate(series_names):
+            series = chart_data.add_series(series_name)
+            for x, y in zip(x_values, series_values[i]):
+                series.add_data_point(x, y)
+    else:
+        chart_data = FastCategoryChartData()
+        chart_data.categories = categories
+        
+        for i, series_name in enumerate(series_names):
+            chart_data.add_series(series_name, series_values[i])
     
     # Add chart to slide
     graphic_frame = slide.shapes.add_chart(
@@ -654,18 +2829,431 @@ def format_chart(chart, has_legend: bool = True, legend_position: str = 'right',
     # Configure legend
     chart.has_legend = has_legend
     if has_legend:
-        position_map = {
-            'right': 2,  # XL_LEGEND_POSITION.RIGHT
-            'left': 3,   # XL_LEGEND_POSITION.LEFT
-            'top': 1,    # XL_LEGEND_POSITION.TOP
-            'bottom': 4  # XL_LEGEND_POSITION.BOTTOM
-        }
-        chart.legend.position = position_map.get(legend_position.lower(), 2)
+        chart.legend.position = LEGEND_POSITIONS.get(legend_position, XL_LEGEND_POSITION.RIGHT)
     
     # Configure data labels
     for series in chart.series:
         series.has_data_labels = has_data_labels
 
+# ---- Chart Data Functions ----
+
+# Namespaces and fixed parts of the minimal workbook embedded in charts
+_SPREADSHEETML_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_OFFICE_RELS_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_WORKBOOK_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="' + _OFFICE_RELS_NS + '/officeDocument" Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/workbook.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="' + _SPREADSHEETML_NS + '" xmlns:r="' + _OFFICE_RELS_NS + '">'
+        '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Type="' + _OFFICE_RELS_NS + '/worksheet" Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    )
+}
+
+# Formats accepted by load_chart_data, by file extension
+CHART_DATA_FORMATS = {
+    '.csv': 'csv',
+    '.tsv': 'tsv',
+    '.txt': 'csv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.npy': 'npy'
+}
+
+# Ways load_chart_data handles missing and non-finite values
+MISSING_VALUE_POLICIES = ('gap', 'zero', 'drop', 'error')
+
+# Strings read as missing values from CSV files when pyarrow is not installed
+_CSV_MISSING_VALUES = frozenset(['', 'na', 'n/a', 'nan', 'null', 'none', '-nan', '#n/a'])
+
+def _sheet_cell_xml(ref: str, value: Any) -> str:
+    value_type = type(value)
+    if value_type is float or value_type is int:
+        return f'<c r="{ref}"><v>{value!r}</v></c>'
+    if value is None:
+        return ''
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f'<c r="{ref}"><v>{value!r}</v></c>'
+    return f'<c r="{ref}" t="inlineStr"><is><t>{escape(_INVALID_XML_CHARS.sub("", str(value)))}</t></is></c>'
+
+class _SheetXmlWorkbookWriter(CategoryWorkbookWriter):
+    """
+    Workbook writer that produces the worksheet XML in one pass over the rows.
+
+    python-pptx writes the workbook embedded in a chart through xlsxwriter, one
+    call per cell. For charts with single-level categories this writer builds
+    the same worksheet layout directly as XML, which is several times faster
+    for large charts. Multi-level categories are written by python-pptx.
+    """
+
+    @property
+    def xlsx_blob(self) -> bytes:
+        chart_data = self._chart_data
+        categories = chart_data.categories
+        if categories.depth > 1:
+            return super().xlsx_blob
+
+        series_list = list(chart_data)
+        columns = [self._column_reference(2 + i) for i in range(len(series_list))]
+        rows = ['<row r="1">' + ''.join(
+            _sheet_cell_xml(f'{column}1', series.name) for column, series in zip(columns, series_list)
+        ) + '</row>']
+        labels = [category.label for category in categories]
+        values = [series.values for series in series_list]
+        row_count = max([len(labels)] + [len(v) for v in values])
+        for row in range(row_count):
+            number = row + 2
+            cells = [_sheet_cell_xml(f'A{number}', labels[row] if row < len(labels) else None)]
+            for column, series_values in zip(columns, values):
+                if row < len(series_values):
+                    cells.append(_sheet_cell_xml(f'{column}{number}', series_values[row]))
+            rows.append(f'<row r="{number}">' + ''.join(cells) + '</row>')
+
+        sheet = (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<worksheet xmlns="{_SPREADSHEETML_NS}"><sheetData>' + ''.join(rows) + '</sheetData></worksheet>'
+        )
+        buffer = io.BytesIO()
+        # The workbook is only read back when the chart data is edited, so it is compressed quickly
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as xlsx:
+            for name, xml in _WORKBOOK_PARTS.items():
+                xlsx.writestr(name, xml)
+            xlsx.writestr('xl/worksheets/sheet1.xml', sheet)
+        return buffer.getvalue()
+
+class FastCategoryChartData(CategoryChartData):
+    """CategoryChartData that writes its embedded workbook with _SheetXmlWorkbookWriter."""
+
+    @lazyproperty
+    def _workbook_writer(self):
+        return _SheetXmlWorkbookWriter(self)
+
+def _category_label(value: Any) -> Any:
+    if value is None:
+        return ''
+    if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+        return value
+    return value.isoformat() if hasattr(value, 'isoformat') else str(value)
+
+def _select_columns(available: List, category_column, series_columns) -> Tuple[Any, List]:
+    """Resolve the category and series column selection against the available columns."""
+    def resolve(column):
+        if column in available:
+            return column
+        if isinstance(column, str) and column.isdigit() and int(column) in available:
+            return int(column)
+        raise ValueError(f"Column {column!r} not found. Available columns: {', '.join(str(c) for c in available)}")
+
+    category = resolve(category_column) if category_column is not None else None
+    if series_columns is not None:
+        series = [resolve(column) for column in series_columns]
+    else:
+        series = [column for column in available if column != category]
+    if not series:
+        raise ValueError("No series columns selected")
+    return category, series
+
+def _read_csv_columns(file_path: str, delimiter: str, category_column, series_columns) -> Tuple:
+    try:
+        import pyarrow
+        import pyarrow.csv
+    except ImportError:
+        pyarrow = None
+
+    if pyarrow is not None:
+        table = pyarrow.csv.read_csv(file_path, parse_options=pyarrow.csv.ParseOptions(delimiter=delimiter))
+        if category_column is None and series_columns is None:
+            category_column = table.column_names[0]
+        return _arrow_columns(table, category_column, series_columns)
+
+    # Without pyarrow, the file is parsed with the csv module
+    import csv
+    with open(file_path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            raise ValueError(f"CSV file is empty: {file_path}")
+        records = list(reader)
+    if category_column is None and series_columns is None:
+        category_column = header[0]
+    category, series = _select_columns(header, category_column, series_columns)
+    positions = {name: i for i, name in enumerate(header)}
+
+    def cell(record, position):
+        return record[position] if position < len(record) else ''
+
+    categories = None
+    if category is not None:
+        categories = [cell(record, positions[category]) for record in records]
+    series_values = []
+    for name in series:
+        position = positions[name]
+        values = []
+        for row, record in enumerate(records):
+            text = cell(record, position).strip()
+            if text.lower() in _CSV_MISSING_VALUES:
+                values.append(None)
+                continue
+            try:
+                value = float(text)
+            except ValueError:
+                raise ValueError(f"Column {name!r} has a non-numeric value {text!r} in row {row + 2}")
+            values.append(value if math.isfinite(value) else None)
+        series_values.append(values)
+    return categories, [str(name) for name in series], series_values
+
+def _arrow_columns(table, category_column, series_columns) -> Tuple:
+    import pyarrow
+    import pyarrow.compute as pc
+
+    category, series = _select_columns(table.column_names, category_column, series_columns)
+    categories = table.column(category).to_pylist() if category is not None else None
+    missing = pyarrow.scalar(None, pyarrow.float64())
+    series_values = []
+    for name in series:
+        try:
+            column = pc.cast(table.column(name), pyarrow.float64())
+        except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError):
+            raise ValueError(f"Column {name!r} is not numeric")
+        # NaN and infinite values become nulls, which are read back as None
+        series_values.append(pc.if_else(pc.is_finite(column), column, missing).to_pylist())
+    return categories, [str(name) for name in series], series_values
+
+def _read_parquet_columns(file_path: str, category_column, series_columns) -> Tuple:
+    try:
+        import pyarrow.parquet
+    except ImportError:
+        raise ImportError("pyarrow is required to read Parquet files, install it with 'pip install pyarrow'")
+    schema_names = pyarrow.parquet.read_schema(file_path).names
+    if category_column is None and series_columns is None:
+        category_column = schema_names[0]
+    category, series = _select_columns(schema_names, category_column, series_columns)
+    # Only the selected columns are read from the file
+    columns = ([category] if category is not None else []) + [name for name in series if name != category]
+    table = pyarrow.parquet.read_table(file_path, columns=columns)
+    return _arrow_columns(table, category, series)
+
+def _read_npy_columns(file_path: str, category_column, series_columns) -> Tuple:
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("numpy is required to read .npy files, install it with 'pip install numpy'")
+    array = numpy.load(file_path, mmap_mode='r', allow_pickle=False)
+
+    if array.dtype.names:
+        # Structured arrays are addressed by field name
+        available = list(array.dtype.names)
+        get_column = lambda name: array[name]
+    else:
+        if array.ndim == 1:
+            array = array.reshape(-1, 1)
+        elif array.ndim != 2:
+            raise ValueError(f"Expected a 1 or 2 dimensional array, got {array.ndim} dimensions")
+        available = list(range(array.shape[1]))
+        get_column = lambda index: array[:, index]
+
+    category, series = _select_columns(available, category_column, series_columns)
+    categories = get_column(category).tolist() if category is not None else None
+    series_values = []
+    for name in series:
+        try:
+            column = numpy.asarray(get_column(name), dtype=numpy.float64)
+        except (TypeError, ValueError):
+            raise ValueError(f"Column {name!r} is not numeric")
+        values = column.tolist()
+        for index in numpy.flatnonzero(~numpy.isfinite(column)).tolist():
+            values[index] = None
+        series_values.append(values)
+    names = [str(name) if array.dtype.names else f"Series {name + 1}" for name in series]
+    return categories, names, series_values
+
+def load_chart_data(file_path: str, category_column: Union[str, int] = None, series_columns: List[Union[str, int]] = None,
+                    file_format: str = None, missing_values: str = 'gap') -> Tuple[List, List[str], List[List[float]]]:
+    """
+    Load chart categories and series from a CSV, TSV, Parquet or NumPy .npy file.
+
+    Columns are converted to floats column by column (vectorized when pyarrow or
+    numpy is used); NaN and infinite values are treated as missing. CSV files
+    are read with pyarrow if it is installed, Parquet requires pyarrow and .npy
+    files require numpy.
+
+    Args:
+        file_path: Path to the data file
+        category_column: Column holding the categories; defaults to the first column
+            of CSV and Parquet files, and to row numbers for .npy files
+        series_columns: Columns to plot as series, all other columns if not given.
+            Columns of plain .npy arrays are selected by index.
+        file_format: 'csv', 'tsv', 'parquet' or 'npy'; detected from the extension if not given
+        missing_values: How missing values are handled: 'gap' leaves a gap in the chart,
+            'zero' plots them as 0, 'drop' removes the rows that have any, 'error' rejects the data
+
+    Returns:
+        A tuple (categories, series_names, series_values)
+    """
+    if missing_values not in MISSING_VALUE_POLICIES:
+        raise ValueError(f"missing_values must be one of {', '.join(MISSING_VALUE_POLICIES)}")
+    if file_format is None:
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension not in CHART_DATA_FORMATS:
+            raise ValueError(f"Cannot detect the format of {file_path}; specify one of csv, tsv, parquet, npy")
+        file_format = CHART_DATA_FORMATS[extension]
+    file_format = file_format.lower()
+
+    if file_format in ('csv', 'tsv'):
+        categories, series_names, series_values = _read_csv_columns(
+            file_path, '\t' if file_format == 'tsv' else ',', category_column, series_columns
+        )
+    elif file_format == 'parquet':
+        categories, series_names, series_values = _read_parquet_columns(file_path, category_column, series_columns)
+    elif file_format == 'npy':
+        categories, series_names, series_values = _read_npy_columns(file_path, category_column, series_columns)
+    else:
+        raise ValueError(f"Unsupported file format: '{file_format}'. Supported formats: csv, tsv, parquet, npy")
+
+    row_count = len(series_values[0])
+    if categories is None:
+        categories = list(range(1, row_count + 1))
+    else:
+        categories = [_category_label(category) for category in categories]
+
+    if missing_values == 'zero':
+        series_values = [[0.0 if v is None else v for v in values] for values in series_values]
+    elif missing_values in ('drop', 'error'):
+        missing_rows = set()
+        for values in series_values:
+            missing_rows.update(i for i, v in enumerate(values) if v is None)
+        if missing_rows and missing_values == 'error':
+            raise ValueError(f"Data has missing values in {len(missing_rows)} rows, first in row {min(missing_rows) + 1}")
+        if missing_rows:
+            keep = [i for i in range(row_count) if i not in missing_rows]
+            categories = [categories[i] for i in keep]
+            series_values = [[values[i] for i in keep] for values in series_values]
+
+    return categories, series_names, series_values
+
+# Methods accepted by downsample_chart_data
+DOWNSAMPLE_METHODS = ('lttb', 'minmax', 'nth')
+
+def _lttb_indices(numpy, x, y, threshold: int):
+    """Indices of the points kept by Largest-Triangle-Three-Buckets for one series."""
+    n = len(y)
+    # Bucket i covers points edges[i]..edges[i + 1] - 1; the first and last points are always kept
+    edges = numpy.floor(numpy.arange(threshold - 1) * ((n - 2) / (threshold - 2))).astype(numpy.intp) + 1
+    edges[-1] = n - 1
+    # Average point of every bucket, computed once for all buckets
+    counts = numpy.diff(numpy.append(edges, n))
+    avg_x = numpy.add.reduceat(x, edges) / counts
+    avg_y = numpy.add.reduceat(y, edges) / counts
+
+    indices = numpy.empty(threshold, dtype=numpy.intp)
+    indices[0], indices[-1] = 0, n - 1
+    selected = 0
+    for i in range(threshold - 2):
+        start, stop = edges[i], edges[i + 1]
+        xa, ya = x[selected], y[selected]
+        areas = numpy.abs((xa - avg_x[i + 1]) * (y[start:stop] - ya) - (xa - x[start:stop]) * (avg_y[i + 1] - ya))
+        selected = start + int(areas.argmax())
+        indices[i + 1] = selected
+    return indices
+
+def _minmax_indices(numpy, y, threshold: int):
+    """Indices of the smallest and largest point of each bucket for one series."""
+    n = len(y)
+    # Two points per bucket besides the first and last point
+    bucket_count = (threshold - 2) // 2
+    if bucket_count < 1:
+        return numpy.array([0, n - 1])
+    buckets = numpy.arange(n) * bucket_count // n
+    starts = numpy.searchsorted(buckets, numpy.arange(bucket_count))
+    # Sorting by bucket, then by value, puts each bucket's minimum (or maximum) first
+    minimums = numpy.lexsort((y, buckets))[starts]
+    maximums = numpy.lexsort((-y, buckets))[starts]
+    return numpy.concatenate([[0, n - 1], minimums, maximums])
+
+def downsample_chart_data(categories: List, series_values: List[List[float]], max_points: int,
+                          method: str = 'lttb') -> Tuple[List, List[List[float]]]:
+    """
+    Reduce chart data to about max_points points, keeping the shape of the series.
+
+    All series keep the same rows, so categories stay aligned: each series selects
+    max_points divided by the number of series (at least 3) and the union of the
+    selected rows is kept. Numeric
+    categories are used as x values, other categories are spaced evenly. Missing
+    values are interpolated when choosing points and emitted unchanged.
+
+    Args:
+        categories: List of categories (or x values)
+        series_values: List of lists containing values for each series
+        max_points: Maximum number of points to keep per series
+        method: 'lttb' (Largest-Triangle-Three-Buckets), 'minmax' (smallest and
+            largest value of each bucket) or 'nth' (every n-th point); 'lttb' and
+            'minmax' require numpy
+
+    Returns:
+        A tuple (categories, series_values) with the selected rows
+    """
+    if method not in DOWNSAMPLE_METHODS:
+        raise ValueError(f"Unsupported downsampling method: '{method}'. Supported methods: {', '.join(DOWNSAMPLE_METHODS)}")
+    n = len(categories)
+    if n <= max_points or max_points < 3:
+        return categories, series_values
+
+    if method == 'nth':
+        step = math.ceil((n - 1) / (max_points - 1))
+        indices = list(range(0, n, step))
+        if indices[-1] != n - 1:
+            indices.append(n - 1)
+    else:
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(f"numpy is required for '{method}' downsampling, install it with 'pip install numpy'")
+        try:
+            x = numpy.array(categories, dtype=numpy.float64)
+            if not numpy.isfinite(x).all():
+                raise ValueError
+        except (TypeError, ValueError):
+            x = numpy.arange(n, dtype=numpy.float64)
+        threshold = max(max_points // max(len(series_values), 1), 3)
+        selected = [numpy.array([0, n - 1])]
+        for values in series_values:
+            # None becomes NaN; missing values are interpolated so that they do not win every bucket
+            y = numpy.array(values, dtype=numpy.float64)
+            finite = numpy.isfinite(y)
+            if not finite.any():
+                continue
+            if not finite.all():
+                positions = numpy.arange(n)
+                y = numpy.interp(positions, positions[finite], y[finite])
+            if method == 'lttb':
+                selected.append(_lttb_indices(numpy, x, y, threshold))
+            else:
+                selected.append(_minmax_indices(numpy, y, threshold))
+        indices = numpy.unique(numpy.concatenate(selected)).tolist()
+
+    return [categories[i] for i in indices], [[values[i] for i in indices] for values in series_values]
+
 # ---- Document Properties Functions ----
 
 def set_core_properties(presentation: Presentation, title: str = None, subject: str = None,
@@ -721,3 +3309,775 @@ def get_core_properties(presentation: Presentation) -> Dict:
         'modified': core_props.modified,
         'last_modified_by': core_props.last_modified_by
     }
+
+# ---- Deck Builder Functions ----
+
+def load_deck_spec(spec: Union[Dict, str]) -> Dict:
+    """
+    Load a deck spec from a dict, a JSON or YAML string, or a .json/.yaml/.yml file.
+
+    Relative image paths in a spec loaded from a file are resolved against the
+    directory of the file. YAML support requires PyYAML.
+
+    A string is taken as a file path if it ends in .json, .yaml or .yml, or if
+    it is a single line that does not start with '{', so a mistyped path is
+    reported as missing rather than parsed as a YAML string.
+
+    Args:
+        spec: The deck spec, a string containing it, or the path to a spec file
+
+    Returns:
+        The deck spec as a dict
+
+    Raises:
+        FileNotFoundError: If spec is a path to a file that does not exist
+    """
+    if isinstance(spec, dict):
+        return spec
+
+    base_dir = None
+    text = spec.strip()
+    is_path = text.lower().endswith(('.json', '.yaml', '.yml')) or ('\n' not in text and not text.startswith('{'))
+    if os.path.exists(spec) or is_path:
+        if not os.path.isfile(spec):
+            raise FileNotFoundError(f"Deck spec file not found: {spec}")
+        base_dir = os.path.dirname(os.path.abspath(spec))
+        is_yaml = spec.lower().endswith(('.yaml', '.yml'))
+        with open(spec, encoding='utf-8') as f:
+            spec = f.read()
+    else:
+        is_yaml = not text.startswith('{')
+
+    if is_yaml:
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("PyYAML is required for YAML deck specs, install it with 'pip install pyyaml'")
+        loaded = yaml.safe_load(spec)
+    else:
+        loaded = json.loads(spec)
+
+    if not isinstance(loaded, dict):
+        raise ValueError("A deck spec must be a mapping with a 'slides' list")
+    if base_dir is not None:
+        loaded.setdefault('base_dir', base_dir)
+    return loaded
+
+def _layout_for(presentation: Presentation, layout: Union[int, str]):
+    """Return a slide layout by index or name."""
+    if isinstance(layout, int):
+        if not 0 <= layout < len(presentation.slide_layouts):
+            raise ValueError(f"invalid layout index {layout}, available layouts: "
+                             f"0-{len(presentation.slide_layouts) - 1}")
+        return presentation.slide_layouts[layout]
+
+    for slide_layout in presentation.slide_layouts:
+        if slide_layout.name == layout:
+            return slide_layout
+    raise ValueError(f"unknown layout '{layout}', available layouts: "
+                     f"{', '.join(l.name for l in presentation.slide_layouts)}")
+
+def _build_shape(slide, shape_spec: Dict, base_dir: str = None, image_optimization: Dict = None) -> None:
+    """Add a shape described by a deck spec entry to a slide."""
+    shape_type = shape_spec.get('type')
+    left, top = shape_spec.get('left', 1.0), shape_spec.get('top', 1.0)
+    width, height = shape_spec.get('width'), shape_spec.get('height')
+    text_format = {key: shape_spec[key] for key in ('font_size', 'font_name', 'bold', 'italic', 'color', 'alignment')
+                   if key in shape_spec}
+
+    if shape_type == 'textbox':
+        textbox = add_textbox(slide, left, top, width or 4.0, height or 1.0, shape_spec.get('text', ''))
+        if text_format:
+            format_text(textbox.text_frame, **text_format)
+
+    elif shape_type == 'table':
+        data = shape_spec.get('data') or []
+        if not data:
+            raise ValueError("table needs a non-empty 'data' list")
+        cols = max(len(row) for row in data)
+        table = add_table(slide, len(data), cols, left, top, width or 8.0, height or 0.4 * len(data))
+        fill_table(table, data, shape_spec.get('column_formats'), shape_spec.get('header_format'))
+
+    elif shape_type == 'chart':
+        series = shape_spec.get('series') or []
+        chart = add_chart(slide, shape_spec.get('chart_type', 'column'), left, top, width or 6.0, height or 4.0,
+                          shape_spec.get('categories', []), [s['name'] for s in series],
+                          [s['values'] for s in series])
+        format_chart(chart, shape_spec.get('has_legend', True), shape_spec.get('legend_position', 'right'),
+                     shape_spec.get('has_data_labels', False), shape_spec.get('title'))
+
+    elif shape_type == 'image':
+        if 'base64' in shape_spec:
+            add_image_from_base64(slide, shape_spec['base64'], left, top, width, height, image_optimization)
+        else:
+            path = shape_spec.get('path')
+            if not path:
+                raise ValueError("image needs a 'path' or 'base64'")
+            if base_dir is not None and not os.path.isabs(path):
+                path = os.path.join(base_dir, path)
+            add_image(slide, path, left, top, width, height, image_optimization)
+
+    elif shape_type == 'shape':
+        shape = add_shape(slide, shape_spec.get('shape_type', 'rectangle'), left, top, width or 2.0, height or 1.0)
+        format_shape(shape, shape_spec.get('fill_color'), shape_spec.get('line_color'), shape_spec.get('line_width'))
+        if 'text' in shape_spec:
+            shape.text_frame.text = shape_spec['text']
+            if text_format:
+                format_text(shape.text_frame, **text_format)
+
+    else:
+        raise ValueError(f"unknown shape type '{shape_type}', expected one of: textbox, table, chart, image, shape")
+
+def build_presentation(spec: Union[Dict, str], image_optimization: Dict = None) -> Presentation:
+    """
+    Build a presentation from a declarative deck spec in one pass.
+
+    A spec is a mapping like:
+
+        {
+            "template": "corporate",
+            "properties": {"title": "Q3 Report", "author": "Finance"},
+            "slides": [
+                {
+                    "layout": 1,
+                    "title": "Highlights",
+                    "placeholders": {"1": ["Revenue up 12%", "Costs flat"]},
+                    "shapes": [
+                        {"type": "chart", "chart_type": "column", "left": 1, "top": 2,
+                         "width": 8, "height": 4, "categories": ["Q1", "Q2", "Q3"],
+                         "series": [{"name": "Revenue", "values": [10, 12, 14]}]}
+                    ],
+                    "notes": "Speaker notes"
+                }
+            ]
+        }
+
+    "template" is passed to create_presentation and "properties" to
+    set_core_properties. A slide "layout" is a layout index or name (default 1).
+    Placeholder values are either text or a list of bullet points. Shape types
+    are textbox, table, chart, image and shape, taking the arguments of the
+    corresponding functions in this module; positions and sizes are in inches.
+
+    Args:
+        spec: The deck spec, or a string or file path accepted by load_deck_spec
+        image_optimization: Options passed to add_image, or None to embed images as is
+
+    Returns:
+        The built Presentation object
+    """
+    spec = load_deck_spec(spec)
+    base_dir = spec.get('base_dir')
+
+    presentation = create_presentation(spec.get('template'))
+    if spec.get('properties'):
+        set_core_properties(presentation, **spec['properties'])
+
+    for slide_number, slide_spec in enumerate(spec.get('slides', [])):
+        location = f"slides[{slide_number}]"
+        try:
+            slide = presentation.slides.add_slide(_layout_for(presentation, slide_spec.get('layout', 1)))
+
+            if 'title' in slide_spec:
+                set_title(slide, slide_spec['title'])
+
+            for idx, value in (slide_spec.get('placeholders') or {}).items():
+                location = f"slides[{slide_number}].placeholders[{idx}]"
+                if isinstance(value, list):
+                    add_bullet_points(slide.placeholders[int(idx)], [str(item) for item in value])
+                else:
+                    populate_placeholder(slide, int(idx), str(value))
+
+            for shape_number, shape_spec in enumerate(slide_spec.get('shapes') or []):
+                location = f"slides[{slide_number}].shapes[{shape_number}]"
+                _build_shape(slide, shape_spec, base_dir, image_optimization)
+
+            if 'notes' in slide_spec:
+                location = f"slides[{slide_number}].notes"
+                slide.notes_slide.notes_text_frame.text = slide_spec['notes']
+        except Exception as e:
+            raise ValueError(f"{location}: {str(e)}")
+
+    return presentation
+
+def _build_presentation_file(spec: Union[Dict, str], output_path: str, image_optimization: Dict = None) -> Dict:
+    """Build a presentation and save it, reporting errors in the result."""
+    try:
+        presentation = build_presentation(spec, image_optimization)
+        save_presentation(presentation, output_path)
+        return {"file_path": output_path, "slide_count": len(presentation.slides)}
+    except Exception as e:
+        return {"file_path": output_path, "error": str(e)}
+
+def build_presentations(specs: List[Union[Dict, str]], output_paths: List[str], workers: int = 1,
+                        image_optimization: Dict = None) -> List[Dict]:
+    """
+    Build presentations from deck specs and save them, optionally in parallel.
+
+    With more than one worker, the specs are built in a pool of worker
+    processes, using at most one process per CPU core. Registered template names are passed to the workers as the
+    template's file path, since templates are registered per process.
+
+    Args:
+        specs: Deck specs, see build_presentation
+        output_paths: File path to save each presentation to
+        workers: Number of worker processes, 1 builds in the calling process
+        image_optimization: Options passed to add_image, or None to embed images as is
+
+    Returns:
+        A result per spec, in order, with the file path and slide count or an error
+    """
+    if len(specs) != len(output_paths):
+        raise ValueError(f"Number of specs ({len(specs)}) must match number of output paths ({len(output_paths)})")
+
+    # The work is CPU bound, more processes than cores only add startup cost
+    workers = min(workers, len(specs), os.cpu_count() or 1)
+    if workers <= 1:
+        return [_build_presentation_file(spec, output_path, image_optimization)
+                for spec, output_path in zip(specs, output_paths)]
+
+    template_paths = template_registry.templates()
+    worker_specs = []
+    for spec in specs:
+        try:
+            spec = load_deck_spec(spec)
+        except Exception:
+            # Reported by the worker
+            worker_specs.append(spec)
+            continue
+        if spec.get('template') in template_paths:
+            spec = dict(spec, template=template_paths[spec['template']])
+        worker_specs.append(spec)
+
+    # Spawned rather than forked workers, so they do not inherit locks held by other threads
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        return list(pool.map(_build_presentation_file, worker_specs, output_paths,
+                             itertools.repeat(image_optimization)))
+
+# ---- Mail Merge Functions ----
+
+# A merge field, e.g. {{customer_name}}
+MERGE_FIELD_PATTERN = re.compile(r'\{\{\s*([^{}]+?)\s*\}\}')
+
+# Ways merge_presentations handles fields that a record has no value for
+MISSING_FIELD_POLICIES = ('error', 'blank', 'keep')
+
+# Number of records sent to a worker process at a time
+MERGE_CHUNK_SIZE = 64
+
+def _normalize_merge_fields(element) -> None:
+    """
+    Move every merge field split over several runs of a paragraph into its first run.
+
+    PowerPoint often splits text into runs where it was edited or spell checked,
+    e.g. "{{cust" and "omer}}". Each field is joined into the run it starts in,
+    keeping that run's formatting, so that fields only ever span a single text node.
+    """
+    for paragraph in element.iter(qn('a:p')):
+        for text_nodes in _run_text_groups(paragraph, ('a:r', 'a:fld')):
+            if len(text_nodes) < 2:
+                continue
+            texts = [node.text or '' for node in text_nodes]
+            joined = ''.join(texts)
+            if '{{' not in joined:
+                continue
+            spans = [(match.start(), match.end(), match.group(0)) for match in MERGE_FIELD_PATTERN.finditer(joined)]
+            for node, text in zip(text_nodes, _replace_across_runs(texts, spans)):
+                node.text = text
+
+class MergeTemplate:
+    """
+    A presentation template for mail merge, parsed once and rendered per record.
+
+    Only the XML parts containing {{field}} tokens are kept as text, split at the
+    fields. Rendering a record writes those parts with the field values substituted
+    and copies every other zip member from the template file as it is, without
+    decompressing it, so a rendered deck costs a few string joins and the deflating
+    of the parts that actually change.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = os.path.abspath(file_path)
+        self.fields = set()
+        # Zip members in order, each either a ZipInfo to copy or (name, segments) to render
+        self._members = []
+
+        with zipfile.ZipFile(self.file_path) as zip_file:
+            for info in zip_file.infolist():
+                if not info.filename.endswith(('.xml', '.rels')):
+                    self._members.append(info)
+                    continue
+                data = zip_file.read(info)
+                if b'{{' not in data:
+                    self._members.append(info)
+                    continue
+
+                element = etree.fromstring(data)
+                _normalize_merge_fields(element)
+                xml = etree.tostring(element, encoding='UTF-8', xml_declaration=True, standalone=True).decode('utf-8')
+                # Segments alternate between literal XML and field names
+                segments = MERGE_FIELD_PATTERN.split(xml)
+                if len(segments) == 1:
+                    self._members.append(info)
+                    continue
+                self.fields.update(segments[1::2])
+                self._members.append((info.filename, segments))
+
+    @property
+    def templated_parts(self) -> List[str]:
+        """Names of the zip members that contain merge fields."""
+        return [member[0] for member in self._members if isinstance(member, tuple)]
+
+    def render(self, record: Dict, output_path: str, missing_fields: str = 'error') -> str:
+        """
+        Write the deck for one record.
+
+        Args:
+            record: Field values by field name
+            output_path: Path of the deck to write
+            missing_fields: 'error' rejects records without a value for a field,
+                'blank' replaces such fields with nothing, 'keep' leaves them as they are
+
+        Returns:
+            The path of the written deck
+        """
+        values = {}
+        for field in self.fields:
+            value = record.get(field)
+            if value is None:
+                if missing_fields == 'error':
+                    raise ValueError(f"Record has no value for field '{field}'")
+                values[field] = '{{' + field + '}}' if missing_fields == 'keep' else ''
+            else:
+                values[field] = escape(_INVALID_XML_CHARS.sub('', str(value)), {'"': '&quot;'})
+
+        directory = os.path.dirname(output_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(self.file_path, 'rb') as source_file, \
+                zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_DEFLATED, strict_timestamps=False) as zip_file:
+            for member in self._members:
+                if isinstance(member, zipfile.ZipInfo):
+                    _copy_member(zip_file, source_file, member, STREAM_CHUNK_SIZE)
+                    continue
+                name, segments = member
+                parts = segments[:]
+                parts[1::2] = [values[field] for field in segments[1::2]]
+                zip_file.writestr(name, ''.join(parts).encode('utf-8'))
+        return output_path
+
+def iter_merge_records(source: Union[str, List[Dict]], file_format: str = None) -> Iterator[Dict]:
+    """
+    Iterate over mail merge records from a CSV or JSONL file, or a list of dicts.
+
+    Files are read one record at a time, so any number of records can be merged.
+
+    Args:
+        source: Path to a .csv or .jsonl file, or a list of records
+        file_format: 'csv' or 'jsonl'; detected from the extension if not given
+
+    Returns:
+        An iterator over the records as dicts
+    """
+    if not isinstance(source, str):
+        yield from source
+        return
+
+    if file_format is None:
+        extension = os.path.splitext(source)[1].lower()
+        file_format = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}.get(extension)
+        if file_format is None:
+            raise ValueError(f"Cannot detect the format of {source}; specify one of csv, jsonl")
+
+    with open(source, newline='', encoding='utf-8-sig') as f:
+        if file_format == 'csv':
+            import csv
+            yield from csv.DictReader(f)
+        elif file_format == 'jsonl':
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError(f"Line {line_number} of {source} is not a JSON object")
+                yield record
+        else:
+            raise ValueError(f"Unsupported record format: '{file_format}'. Supported formats: csv, jsonl")
+
+def _merge_output_path(output_path: str, record: Dict, index: int) -> str:
+    """Substitute record fields into an output path pattern, keeping them to a single path component."""
+    def value(match):
+        field = match.group(1)
+        text = str(index) if field == '_index' else str(record.get(field, '') or '')
+        return re.sub(r'[\\/:*?"<>|\x00-\x1f]', '_', text)
+    return MERGE_FIELD_PATTERN.sub(value, output_path)
+
+# Template of a merge worker process, see _merge_worker_init
+_merge_worker_template = None
+
+def _merge_worker_init(template_path: str) -> None:
+    global _merge_worker_template
+    _merge_worker_template = MergeTemplate(template_path)
+
+def _merge_records(template: MergeTemplate, chunk: List[Tuple[int, Dict]], output_path: str,
+                   missing_fields: str) -> List[Dict]:
+    """Render a chunk of records, reporting errors in the results."""
+    results = []
+    for index, record in chunk:
+        result = {"index": index}
+        try:
+            result["file_path"] = template.render(record, _merge_output_path(output_path, record, index),
+                                                  missing_fields)
+        except Exception as e:
+            result["error"] = str(e)
+        results.append(result)
+    return results
+
+def _merge_worker_chunk(chunk: List[Tuple[int, Dict]], output_path: str, missing_fields: str) -> List[Dict]:
+    return _merge_records(_merge_worker_template, chunk, output_path, missing_fields)
+
+def merge_presentations(template: str, records: Union[str, List[Dict]], output_path: str, workers: int = 1,
+                        missing_fields: str = 'error', file_format: str = None) -> Iterator[Dict]:
+    """
+    Write one deck per record, substituting {{field}} tokens in a template.
+
+    Fields are substituted in all text of the template: placeholders, textboxes,
+    table cells, chart titles, notes and document properties. A field split over
+    several differently formatted runs takes the formatting of its first run.
+    The template is parsed once; see MergeTemplate for how decks are written.
+
+    Args:
+        template: Path to the template .pptx file, or the name of a registered template
+        records: Path to a CSV or JSONL file of records, or a list of dicts
+        output_path: Path pattern of the decks, with {{field}} tokens taken from each
+            record (with path separators replaced), e.g. "decks/{{customer_id}}.pptx";
+            {{_index}} is the number of the record, counting from 0
+        workers: Number of worker processes, 1 renders in the calling process
+        missing_fields: 'error', 'blank' or 'keep', see MergeTemplate.render
+        file_format: Format of the records file, see iter_merge_records
+
+    Returns:
+        An iterator over a result per record, in order, with the file path or an error
+    """
+    if missing_fields not in MISSING_FIELD_POLICIES:
+        raise ValueError(f"missing_fields must be one of {', '.join(MISSING_FIELD_POLICIES)}")
+    if not MERGE_FIELD_PATTERN.search(output_path):
+        raise ValueError("output_path must contain a {{field}} token, e.g. {{_index}}, to name each deck")
+
+    template_paths = template_registry.templates()
+    template_path = template_paths.get(template, template)
+    if template_path is None or not os.path.exists(template_path):
+        raise ValueError(f"Template not found: {template}")
+
+    # Checked before any record is merged
+    merge_template = MergeTemplate(template_path)
+    chunks = _chunked(enumerate(iter_merge_records(records, file_format)), MERGE_CHUNK_SIZE)
+    workers = min(workers, os.cpu_count() or 1)
+    return _iter_merge_results(merge_template, chunks, output_path, workers, missing_fields)
+
+def _iter_merge_results(merge_template: MergeTemplate, chunks: Iterator[List], output_path: str, workers: int,
+                        missing_fields: str) -> Iterator[Dict]:
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _merge_records(merge_template, chunk, output_path, missing_fields)
+        return
+
+    # Spawned rather than forked workers, so they do not inherit locks held by other threads
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                             initializer=_merge_worker_init, initargs=(merge_template.file_path,)) as pool:
+        # Records are read as the workers need them, with a few chunks in flight per worker
+        pending = []
+        for chunk in chunks:
+            pending.append(pool.submit(_merge_worker_chunk, chunk, output_path, missing_fields))
+            if len(pending) >= 2 * workers:
+                yield from pending.pop(0).result()
+        for future in pending:
+            yield from future.result()
+
+def _chunked(iterable, size: int) -> Iterator[List]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+# ---- Text Extraction Functions ----
+
+_MARKUP_COMPATIBILITY_NS = 'http://schemas.openxmlformats.org/markup-compatibility/2006'
+_PACKAGE_RELS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+# Plain lxml parser: the python-pptx parser creates its element classes for every element
+_extraction_parser = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=True)
+
+# Number of files a worker process extracts per task
+EXTRACT_CHUNK_SIZE = 16
+
+# Clark names of the elements read during extraction, qn() is slow in this loop
+_A_P, _A_R, _A_FLD, _A_BR, _A_T, _A_TBL, _A_TR, _A_TC, _A_TXBODY = (
+    qn(tag) for tag in ('a:p', 'a:r', 'a:fld', 'a:br', 'a:t', 'a:tbl', 'a:tr', 'a:tc', 'a:txBody'))
+_P_SP, _P_PIC, _P_GRAPHICFRAME, _P_CXNSP, _P_GRPSP, _P_TXBODY, _P_PH = (
+    qn(tag) for tag in ('p:sp', 'p:pic', 'p:graphicFrame', 'p:cxnSp', 'p:grpSp', 'p:txBody', 'p:ph'))
+_MC_ALTERNATE_CONTENT = '{%s}AlternateContent' % _MARKUP_COMPATIBILITY_NS
+_MC_FALLBACK = '{%s}Fallback' % _MARKUP_COMPATIBILITY_NS
+
+def _part_rels(zip_file: zipfile.ZipFile, partname: str) -> Dict[str, Tuple[str, str]]:
+    # Relationship id -> (type, member name) of the internal relationships of a part
+    directory, filename = posixpath.split(partname)
+    rels_name = posixpath.join(directory, '_rels', filename + '.rels')
+    try:
+        rels = etree.fromstring(zip_file.read(rels_name), _extraction_parser)
+    except KeyError:
+        return {}
+    targets = {}
+    for rel in rels.iterchildren('{%s}Relationship' % _PACKAGE_RELS_NS):
+        if rel.get('TargetMode') == 'External':
+            continue
+        target = rel.get('Target')
+        if target.startswith('/'):
+            name = target[1:]
+        else:
+            name = posixpath.normpath(posixpath.join(directory, target))
+        targets[rel.get('Id')] = (rel.get('Type'), name)
+    return targets
+
+def _child(elm, tag):
+    # lxml's find() goes through ElementPath, iterchildren() does not
+    return next(elm.iterchildren(tag), None)
+
+def _placeholder_type(sp) -> Optional[str]:
+    # p:ph is in p:nvPr, the last child of the non-visual properties of the shape
+    ph = _child(sp[0][-1], _P_PH)
+    if ph is None:
+        return None
+    return ph.get('type', 'obj')
+
+def _paragraph_texts(txBody) -> List[str]:
+    # Text of each paragraph of a text body, with line breaks as newlines
+    paragraphs = []
+    if txBody is None:
+        return paragraphs
+    for paragraph in txBody.iterchildren(_A_P):
+        parts = []
+        for child in paragraph:
+            tag = child.tag
+            if tag == _A_R or tag == _A_FLD:
+                # a:t is the last child of a:r and a:fld
+                if len(child) and child[-1].tag == _A_T and child[-1].text:
+                    parts.append(child[-1].text)
+            elif tag == _A_BR:
+                parts.append('\n')
+        paragraphs.append(''.join(parts))
+    return paragraphs
+
+def _extract_shape_text(container, record: Dict) -> None:
+    for elm in container:
+        tag = elm.tag
+        if tag == _P_GRPSP:
+            _extract_shape_text(elm, record)
+            continue
+        if tag == _MC_ALTERNATE_CONTENT:
+            # The fallback holds the shapes all readers understand
+            fallback = elm.find(_MC_FALLBACK)
+            _extract_shape_text(fallback if fallback is not None else elm[0], record)
+            continue
+        if tag != _P_SP and tag != _P_PIC and tag != _P_GRAPHICFRAME and tag != _P_CXNSP:
+            continue
+
+        # p:cNvPr, the first child of the non-visual properties of every shape element
+        description = elm[0][0].get('descr')
+        if description:
+            record["alt_text"].append(description)
+        if tag == _P_SP:
+            paragraphs = _paragraph_texts(_child(elm, _P_TXBODY))
+            title = '\n'.join(paragraphs) if _placeholder_type(elm) in _TITLE_PLACEHOLDER_XML_TYPES else ''
+            if title and record["title"] is None:
+                record["title"] = title
+            else:
+                record["paragraphs"].extend(paragraph for paragraph in paragraphs if paragraph)
+        elif tag == _P_GRAPHICFRAME:
+            tbl = next(elm.iter(_A_TBL), None)
+            if tbl is not None:
+                record["tables"].append([
+                    ['\n'.join(_paragraph_texts(_child(tc, _A_TXBODY))) for tc in tr.iterchildren(_A_TC)]
+                    for tr in tbl.iterchildren(_A_TR)
+                ])
+
+def _extract_notes_text(zip_file: zipfile.ZipFile, partname: str) -> List[str]:
+    notes = etree.fromstring(zip_file.read(partname), _extraction_parser)
+    for sp in notes.iter(_P_SP):
+        if _placeholder_type(sp) == 'body':
+            return [paragraph for paragraph in _paragraph_texts(_child(sp, _P_TXBODY)) if paragraph]
+    return []
+
+def iter_slide_text(file_path: str) -> Iterator[Dict]:
+    """
+    Read the text of each slide of a .pptx file, in slide order.
+
+    The slide and notes XML is read straight from the zip file, without
+    opening the presentation with python-pptx, so only the parts holding text
+    are parsed and nothing else is loaded.
+
+    Args:
+        file_path: Path to the .pptx file
+
+    Returns:
+        An iterator over a record per slide with the file, slide index and id,
+        title, other paragraphs, tables as lists of rows of cell text, notes
+        paragraphs and the alt text of shapes
+    """
+    with zipfile.ZipFile(file_path) as zip_file:
+        presentation_name = 'ppt/presentation.xml'
+        for rel_type, name in _part_rels(zip_file, '').values():
+            if rel_type == RT.OFFICE_DOCUMENT:
+                presentation_name = name
+        presentation = etree.fromstring(zip_file.read(presentation_name), _extraction_parser)
+        slide_rels = _part_rels(zip_file, presentation_name)
+        sldIdLst = presentation.find(qn('p:sldIdLst'))
+        sldIds = [] if sldIdLst is None else sldIdLst.iterchildren(qn('p:sldId'))
+
+        for slide_index, sldId in enumerate(sldIds):
+            slide_name = slide_rels[sldId.get(qn('r:id'))][1]
+            slide = etree.fromstring(zip_file.read(slide_name), _extraction_parser)
+            record = {
+                "file": file_path,
+                "slide_index": slide_index,
+                "slide_id": int(sldId.get('id')),
+                "title": None,
+                "paragraphs": [],
+                "tables": [],
+                "notes": [],
+                "alt_text": []
+            }
+            spTree = slide.find('%s/%s' % (qn('p:cSld'), qn('p:spTree')))
+            if spTree is not None:
+                _extract_shape_text(spTree, record)
+            for rel_type, name in _part_rels(zip_file, slide_name).values():
+                if rel_type == RT.NOTES_SLIDE:
+                    record["notes"] = _extract_notes_text(zip_file, name)
+            yield record
+
+def iter_presentation_files(paths: List[str]) -> Iterator[str]:
+    """
+    Iterate over the .pptx files among paths, searching directories recursively.
+
+    Args:
+        paths: Paths of .pptx files and directories
+
+    Returns:
+        An iterator over file paths, in sorted order within each directory
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for directory, subdirectories, filenames in os.walk(path):
+            subdirectories.sort()
+            for filename in sorted(filenames):
+                # Skips the lock files PowerPoint leaves next to open decks
+                if filename.lower().endswith('.pptx') and not filename.startswith('~$'):
+                    yield os.path.join(directory, filename)
+
+def _extract_files(file_paths: List[str]) -> List[Dict]:
+    records = []
+    for file_path in file_paths:
+        # Read a whole file before adding its records, so a file that fails
+        # halfway gives its error record only, not some of its slides as well
+        try:
+            file_records = list(iter_slide_text(file_path))
+        except Exception as e:
+            file_records = [{"file": file_path, "error": str(e)}]
+        records.extend(file_records)
+    return records
+
+def iter_extracted_text(paths: List[str], workers: int = 1) -> Iterator[Dict]:
+    """
+    Read the text of every slide of a set of .pptx files, see iter_slide_text.
+
+    Args:
+        paths: Paths of .pptx files and directories to search for them
+        workers: Number of worker processes, 1 reads in the calling process
+
+    Returns:
+        An iterator over the slide records of each file in order; a file that
+        cannot be read completely gives one record with the file and an error
+        instead of any of its slides
+    """
+    chunks = _chunked(iter_presentation_files(paths), EXTRACT_CHUNK_SIZE)
+    workers = min(workers, os.cpu_count() or 1)
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _extract_files(chunk)
+        return
+
+    # Spawned rather than forked workers, so they do not inherit locks held by other threads
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        pending = []
+        for chunk in chunks:
+            pending.append(pool.submit(_extract_files, chunk))
+            if len(pending) >= 2 * workers:
+                yield from pending.pop(0).result()
+        for future in pending:
+            yield from future.result()
+
+def extract_text(paths: List[str], output: Union[str, IO[str]], workers: int = 1) -> Dict:
+    """
+    Write the text of every slide of a set of .pptx files as JSON Lines.
+
+    Each line is one record of iter_extracted_text. Records are written as
+    they are read, so the memory used does not grow with the number of files.
+
+    Args:
+        paths: Paths of .pptx files and directories to search for them
+        output: Path of the .jsonl file to write, or a text file object
+        workers: Number of worker processes
+
+    Returns:
+        A dict with the number of files and slides, the failed files with their
+        errors, the elapsed seconds and the throughput in slides per second
+    """
+    start = time.perf_counter()
+    files, slides, failed = set(), 0, []
+    output_file = open(output, 'w', encoding='utf-8') if isinstance(output, str) else output
+    try:
+        for record in iter_extracted_text(paths, workers):
+            files.add(record["file"])
+            if "error" in record:
+                failed.append(record)
+            else:
+                slides += 1
+            output_file.write(json.dumps(record, ensure_ascii=False))
+            output_file.write('\n')
+    finally:
+        if output_file is not output:
+            output_file.close()
+    seconds = time.perf_counter() - start
+    return {
+        "files": len(files),
+        "slides": slides,
+        "failed": failed,
+        "seconds": round(seconds, 3),
+        "slides_per_second": round(slides / seconds, 1) if seconds > 0 else None
+    }
+
+def extract_text_main(argv: List[str] = None) -> int:
+    """Command line entry point of extract_text."""
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(
+        description="Extract the text of every slide of .pptx files as JSON Lines, one record per slide."
+    )
+    parser.add_argument('paths', nargs='+', help=".pptx files, or directories to search for them")
+    parser.add_argument('-o', '--output', default='-', help="Output .jsonl file; standard output by default")
+    parser.add_argument('-j', '--workers', type=int, default=1, help="Number of worker processes")
+    args = parser.parse_args(argv)
+    if args.workers < 1:
+        parser.error("--workers must be a positive integer")
+
+    result = extract_text(args.paths, sys.stdout if args.output == '-' else args.output, args.workers)
+    for failure in result["failed"]:
+        print(f"{failure['file']}: {failure['error']}", file=sys.stderr)
+    print(f"Extracted {result['slides']} slides from {result['files']} files in {result['seconds']}s "
+          f"({result['slides_per_second']} slides/s, {len(result['failed'])} failed)", file=sys.stderr)
+    return 1 if result["failed"] else 0
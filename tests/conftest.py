@@ -0,0 +1,14 @@
+import asyncio
+
+import pytest
+
+
+def call(tool, **arguments):
+    """Call an MCP tool the way the server does, through its worker pool."""
+    return asyncio.run(tool(**arguments))
+
+
+@pytest.fixture
+def server():
+    import ppt_mcp_server
+    return ppt_mcp_server
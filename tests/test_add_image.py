@@ -0,0 +1,30 @@
+from PIL import Image
+
+from conftest import call
+
+
+def test_fallback_approach_optimizes_the_image(server, tmp_path, monkeypatch):
+    image_path = tmp_path / "large.png"
+    Image.effect_noise((2000, 1000), 64).convert("RGB").save(image_path)
+    call(server.create_presentation, id="image_fallback")
+    call(server.add_slide, layout_index=6, presentation_id="image_fallback")
+
+    # Make the first two approaches fail, so the image is added by the PIL fallback
+    add_image, calls = server.ppt_utils.add_image, []
+
+    def failing_add_image(*args, **kwargs):
+        calls.append(args)
+        if len(calls) <= 2:
+            raise ValueError("unsupported")
+        return add_image(*args, **kwargs)
+
+    monkeypatch.setattr(server.ppt_utils, "add_image", failing_add_image)
+    result = call(server.add_image, slide_index=0, image_path=str(image_path), left=1, top=1, width=2,
+                  optimize=True, presentation_id="image_fallback")
+
+    assert len(calls) == 3
+    assert result["height"] == 1
+    assert result["image_optimization"]["bytes_saved"] > 0
+    picture = server.presentations["image_fallback"].slides[0].shapes[0]
+    assert picture.image.size[0] < 2000
+    call(server.close_presentation, presentation_id="image_fallback")
@@ -0,0 +1,38 @@
+from conftest import call
+
+
+def test_every_presentation_tool_can_be_batched(server):
+    batchable = {name for name in server.tool_functions
+                 if "presentation_id" in server.inspect.signature(server.tool_functions[name]).parameters}
+    assert set(server.batch_operations) == batchable - {"close_presentation", "apply_operations"}
+
+
+def test_batch_copies_slides_and_reads_files(server, tmp_path):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("month,sales\njan,1\nfeb,2\n")
+    call(server.create_presentation, id="batch_source")
+    call(server.add_slide, layout_index=1, title="Copied", presentation_id="batch_source")
+    call(server.create_presentation, id="batch_target")
+
+    result = call(server.apply_operations, presentation_id="batch_target", operations=[
+        {"tool": "copy_slides", "arguments": {"source_presentation_id": "batch_source", "slide_indices": [0]}},
+        {"tool": "add_chart_from_file", "arguments": {"slide_index": 0, "chart_type": "line", "left": 1, "top": 1,
+                                                      "width": 4, "height": 3, "file_path": str(csv_path)}},
+        {"tool": "close_presentation", "arguments": {}}
+    ], stop_on_error=False)
+
+    assert [entry["tool"] for entry in result["results"]] == ["copy_slides", "add_chart_from_file",
+                                                             "close_presentation"]
+    assert result["succeeded"] == 2
+    assert "Unsupported operation" in result["results"][2]["result"]["error"]
+    slide = server.presentations["batch_target"].slides[0]
+    assert slide.shapes.title.text == "Copied"
+    assert any(shape.has_chart for shape in slide.shapes)
+    call(server.close_presentation, presentation_id="batch_source")
+    call(server.close_presentation, presentation_id="batch_target")
+
+
+def test_batch_locks_the_presentations_it_reads(server):
+    operations = [{"tool": "copy_slides", "arguments": {"source_presentation_id": "other", "slide_indices": [0]}},
+                  {"tool": "add_slide", "arguments": {}}]
+    assert server.presentations_read("apply_operations", {"operations": operations}) == {"other"}
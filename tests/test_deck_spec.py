@@ -0,0 +1,22 @@
+import pytest
+
+import ppt_utils
+
+
+@pytest.mark.parametrize("spec", ["deck.yaml", "specs/deck.JSON", "deck.yml\n", "my_deck"])
+def test_missing_spec_files_are_reported(tmp_path, monkeypatch, spec):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(FileNotFoundError, match="Deck spec file not found"):
+        ppt_utils.load_deck_spec(spec)
+
+
+def test_inline_specs_are_parsed():
+    assert ppt_utils.load_deck_spec('{"slides": [{"title": "One"}]}') == {"slides": [{"title": "One"}]}
+    pytest.importorskip("yaml")
+    assert ppt_utils.load_deck_spec("slides:\n  - title: One\n") == {"slides": [{"title": "One"}]}
+
+
+def test_spec_files_are_loaded(tmp_path):
+    path = tmp_path / "deck.json"
+    path.write_text('{"slides": []}')
+    assert ppt_utils.load_deck_spec(str(path)) == {"slides": [], "base_dir": str(tmp_path)}
@@ -0,0 +1,19 @@
+import math
+
+import pytest
+
+import ppt_utils
+
+
+@pytest.mark.parametrize("max_points", [3, 4, 5, 10, 101])
+@pytest.mark.parametrize("method", ppt_utils.DOWNSAMPLE_METHODS)
+def test_downsampling_keeps_at_most_max_points(method, max_points):
+    categories = list(range(1000))
+    series_values = [[math.sin(x / 7) for x in categories], [math.cos(x / 3) for x in categories]]
+
+    # Below three points per series each series still keeps three, see downsample_chart_data
+    for values in (series_values[:1], series_values) if max_points >= 6 else (series_values[:1],):
+        kept, kept_values = ppt_utils.downsample_chart_data(categories, values, max_points, method)
+        assert len(kept) <= max_points
+        assert all(len(series) == len(kept) for series in kept_values)
+        assert kept[0] == 0 and kept[-1] == 999
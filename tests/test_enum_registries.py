@@ -0,0 +1,63 @@
+import pytest
+from pptx import Presentation
+
+import ppt_utils
+from conftest import call
+
+SHAPE_NAMES = ppt_utils.SHAPE_TYPES.names + sorted(ppt_utils.SHAPE_TYPES.aliases)
+CHART_NAMES = ppt_utils.CHART_TYPES.names + sorted(ppt_utils.CHART_TYPES.aliases)
+
+
+def _reopen(server, pres_id, tmp_path):
+    path = str(tmp_path / f"{pres_id}.pptx")
+    assert "error" not in call(server.save_presentation, file_path=path, presentation_id=pres_id)
+    call(server.close_presentation, presentation_id=pres_id)
+    return Presentation(path)
+
+
+def test_every_shape_type_renders(server, tmp_path):
+    call(server.create_presentation, id="registry_shapes")
+    call(server.add_slide, layout_index=6, presentation_id="registry_shapes")
+    for name in SHAPE_NAMES:
+        result = call(server.add_shape, slide_index=0, shape_type=name, left=1, top=1, width=1, height=1,
+                      presentation_id="registry_shapes")
+        assert "error" not in result, (name, result)
+
+    shapes = list(_reopen(server, "registry_shapes", tmp_path).slides[0].shapes)
+    assert len(shapes) == len(SHAPE_NAMES)
+    for name, shape in zip(SHAPE_NAMES, shapes):
+        assert shape.auto_shape_type == ppt_utils.SHAPE_TYPES.lookup(name), name
+
+
+def test_shape_type_names_map_to_their_members():
+    # Catches mappings to a different member, e.g. 'star' drawing a pentagon
+    for name, member in ppt_utils.SHAPE_TYPES.members.items():
+        if name not in ('triangle', 'pentagon', 'star', 'arrow'):
+            assert member.name.lower() == name, name
+    assert ppt_utils.SHAPE_TYPES.lookup('Rounded Rectangle').name == 'ROUNDED_RECTANGLE'
+    assert ppt_utils.SHAPE_TYPES.lookup('star').name == 'STAR_5_POINT'
+    assert ppt_utils.SHAPE_TYPES.lookup('star_24_point').name == 'STAR_24_POINT'
+
+
+@pytest.mark.parametrize("legend_position", ppt_utils.LEGEND_POSITIONS.names)
+def test_every_chart_type_renders(server, tmp_path, legend_position):
+    pres_id = f"registry_charts_{legend_position}"
+    call(server.create_presentation, id=pres_id)
+    for slide_index, name in enumerate(CHART_NAMES):
+        call(server.add_slide, layout_index=6, presentation_id=pres_id)
+        result = call(server.add_chart, slide_index=slide_index, chart_type=name, left=1, top=1, width=4, height=3,
+                      categories=["1", "2", "3"], series_names=["a", "b"],
+                      series_values=[[1, 2, 3], [3, 2, 1]], legend_position=legend_position,
+                      presentation_id=pres_id)
+        assert "error" not in result, (name, result)
+
+    presentation = _reopen(server, pres_id, tmp_path)
+    for name, slide in zip(CHART_NAMES, presentation.slides):
+        chart = slide.shapes[0].chart
+        assert chart.chart_type == ppt_utils.CHART_TYPES.lookup(name), name
+        assert chart.legend.position == ppt_utils.LEGEND_POSITIONS.lookup(legend_position), name
+
+
+def test_unknown_name_suggests_close_names():
+    with pytest.raises(ValueError, match="rounded_rectangle"):
+        ppt_utils.SHAPE_TYPES.lookup("rounded_rectangel")
@@ -0,0 +1,35 @@
+import zipfile
+
+from pptx import Presentation
+
+import ppt_utils
+
+
+def _deck(path, titles):
+    presentation = Presentation()
+    for title in titles:
+        presentation.slides.add_slide(presentation.slide_layouts[1]).shapes.title.text = title
+    presentation.save(str(path))
+
+
+def _break_slide(path, slide_number):
+    """Rewrite a deck with invalid XML in one of its slides."""
+    with zipfile.ZipFile(path) as source:
+        members = [(info, source.read(info)) for info in source.infolist()]
+    with zipfile.ZipFile(path, "w") as target:
+        for info, data in members:
+            if info.filename == f"ppt/slides/slide{slide_number}.xml":
+                data = b"<p:sld"
+            target.writestr(info, data)
+
+
+def test_a_file_failing_halfway_gives_only_its_error(tmp_path):
+    _deck(tmp_path / "a.pptx", ["one", "two"])
+    _deck(tmp_path / "b.pptx", ["three", "four", "five"])
+    _break_slide(tmp_path / "b.pptx", 2)
+    _deck(tmp_path / "c.pptx", ["six"])
+
+    records = list(ppt_utils.iter_extracted_text([str(tmp_path)]))
+
+    assert [(record["file"].rsplit("/", 1)[-1], record.get("title", "error" in record)) for record in records] == [
+        ("a.pptx", "one"), ("a.pptx", "two"), ("b.pptx", True), ("c.pptx", "six")]
@@ -0,0 +1,22 @@
+from conftest import call
+
+
+def test_inverted_ranges_are_rejected(server):
+    call(server.create_presentation, id="table_range")
+    call(server.add_slide, layout_index=6, presentation_id="table_range")
+    call(server.add_table, slide_index=0, rows=4, cols=3, left=1, top=1, width=6, height=3,
+         presentation_id="table_range")
+
+    try:
+        result = call(server.format_table_range, slide_index=0, shape_index=0, first_row=3, last_row=1, bold=True,
+                      presentation_id="table_range")
+        assert result == {"error": "Parameter 'last_row': must not be less than first_row (3)"}
+        result = call(server.format_table_range, slide_index=0, shape_index=0, first_col=2, last_col=0, bold=True,
+                      presentation_id="table_range")
+        assert result == {"error": "Parameter 'last_col': must not be less than first_col (2)"}
+
+        result = call(server.format_table_range, slide_index=0, shape_index=0, first_row=2, last_row=2,
+                      first_col=1, last_col=2, bold=True, presentation_id="table_range")
+        assert result["cells_formatted"] == 2
+    finally:
+        call(server.close_presentation, presentation_id="table_range")
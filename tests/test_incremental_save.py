@@ -0,0 +1,181 @@
+import base64
+import inspect
+import io
+import shutil
+
+import pytest
+from PIL import Image
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.util import Inches
+
+import ppt_utils
+from conftest import call
+
+# Shapes of the first slide of the deck, see deck()
+TABLE = 3
+
+
+def _png() -> bytes:
+    image = io.BytesIO()
+    Image.new('RGB', (32, 32), (200, 20, 20)).save(image, 'PNG')
+    return image.getvalue()
+
+
+@pytest.fixture(scope="module")
+def deck(tmp_path_factory):
+    """A saved three slide deck; the first slide also has a textbox and a 2x2 table."""
+    directory = tmp_path_factory.mktemp("incremental")
+    presentation = Presentation()
+    for index in range(3):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {index}"
+    slide = presentation.slides[0]
+    slide.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1)).text_frame.text = "hello"
+    ppt_utils.fill_table(slide.shapes.add_table(2, 2, Inches(1), Inches(3), Inches(4), Inches(2)).table,
+                         [["a", "b"], ["c", "d"]])
+    path = directory / "deck.pptx"
+    ppt_utils.save_presentation(presentation, str(path))
+
+    (directory / "image.png").write_bytes(_png())
+    (directory / "data.csv").write_text("month,sales\njan,1\nfeb,2\nmar,3\n")
+    return directory
+
+
+def _titles(presentation):
+    return [slide.shapes.title.text for slide in presentation.slides]
+
+
+def _texts(slide):
+    return [shape.text_frame.text for shape in slide.shapes if shape.has_text_frame]
+
+
+# Tool name -> (arguments, check of the reopened deck). The arguments are a function
+# of the fixture directory where they refer to files.
+EDITS = {
+    "set_core_properties": (
+        dict(title="Changed"),
+        lambda p: p.core_properties.title == "Changed"),
+    "add_slide": (
+        dict(layout_index=1, title="Added"),
+        lambda p: _titles(p) == ["Slide 0", "Slide 1", "Slide 2", "Added"]),
+    "populate_placeholder": (
+        dict(slide_index=1, placeholder_idx=1, text="filled"),
+        lambda p: "filled" in _texts(p.slides[1])),
+    "add_bullet_points": (
+        dict(slide_index=1, placeholder_idx=1, bullet_points=["first", "second"]),
+        lambda p: any(text.endswith("first\nsecond") for text in _texts(p.slides[1]))),
+    "duplicate_slide": (
+        dict(slide_index=0),
+        lambda p: _titles(p) == ["Slide 0", "Slide 0", "Slide 1", "Slide 2"] and "hello" in _texts(p.slides[1])),
+    "copy_slides": (
+        dict(source_presentation_id="incremental_source", slide_indices=[0]),
+        lambda p: _titles(p)[-1] == "Copied"),
+    "reorder_slides": (
+        dict(order=[2, 1, 0]),
+        lambda p: _titles(p) == ["Slide 2", "Slide 1", "Slide 0"]),
+    "add_textbox": (
+        dict(slide_index=1, left=1, top=1, width=2, height=1, text="boxed"),
+        lambda p: "boxed" in _texts(p.slides[1])),
+    "replace_text": (
+        dict(query="hello", replacement="goodbye"),
+        lambda p: "goodbye" in _texts(p.slides[0])),
+    "add_image": (
+        lambda directory: dict(slide_index=1, image_path=str(directory / "image.png"), left=1, top=1),
+        lambda p: any(shape.shape_type == MSO_SHAPE_TYPE.PICTURE for shape in p.slides[1].shapes)),
+    "add_image_from_base64": (
+        dict(slide_index=1, base64_string=base64.b64encode(_png()).decode(), left=1, top=1),
+        lambda p: any(shape.shape_type == MSO_SHAPE_TYPE.PICTURE for shape in p.slides[1].shapes)),
+    "add_table": (
+        dict(slide_index=1, rows=2, cols=2, left=1, top=1, width=4, height=2, data=[["w", "x"], ["y", "z"]]),
+        lambda p: any(shape.has_table and shape.table.cell(1, 1).text == "z" for shape in p.slides[1].shapes)),
+    "format_table_cell": (
+        dict(slide_index=0, shape_index=TABLE, row=0, col=0, bold=True),
+        lambda p: p.slides[0].shapes[TABLE].table.cell(0, 0).text_frame.paragraphs[0].runs[0].font.bold),
+    "format_table_range": (
+        dict(slide_index=0, shape_index=TABLE, first_row=1, last_row=1, bg_color=[0, 128, 0]),
+        lambda p: str(p.slides[0].shapes[TABLE].table.cell(1, 0).fill.fore_color.rgb) == "008000"),
+    "add_shape": (
+        dict(slide_index=1, shape_type="oval", left=1, top=1, width=1, height=1),
+        lambda p: any(shape.shape_type == MSO_SHAPE_TYPE.AUTO_SHAPE for shape in p.slides[1].shapes)),
+    "add_chart": (
+        dict(slide_index=1, chart_type="column", left=1, top=1, width=4, height=3, categories=["a", "b"],
+             series_names=["s"], series_values=[[1, 2]]),
+        lambda p: any(shape.has_chart for shape in p.slides[1].shapes)),
+    "add_chart_from_file": (
+        lambda directory: dict(slide_index=1, chart_type="line", left=1, top=1, width=4, height=3,
+                               file_path=str(directory / "data.csv")),
+        lambda p: any(shape.has_chart for shape in p.slides[1].shapes)),
+    "apply_operations": (
+        dict(operations=[{"tool": "add_textbox", "arguments": dict(slide_index=2, left=1, top=1, width=2,
+                                                                   height=1, text="batched")}]),
+        lambda p: "batched" in _texts(p.slides[2])),
+}
+
+
+def test_every_mutating_tool_has_an_edit(server):
+    mutating = {name for name, function in server.tool_functions.items()
+                if name not in server.read_only_tools and "presentation_id" in inspect.signature(function).parameters
+                and name != "close_presentation"}
+    assert mutating == set(EDITS)
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+@pytest.mark.parametrize("tool", sorted(EDITS))
+def test_edit_survives_incremental_save(server, deck, tmp_path, tool, lazy):
+    arguments, check = EDITS[tool]
+    if callable(arguments):
+        arguments = arguments(deck)
+    path = tmp_path / "deck.pptx"
+    shutil.copy(deck / "deck.pptx", path)
+
+    if tool == "copy_slides":
+        call(server.create_presentation, id="incremental_source")
+        call(server.add_slide, layout_index=1, title="Copied", presentation_id="incremental_source")
+    pres_id = call(server.open_presentation, file_path=str(path), lazy=lazy)["presentation_id"]
+    try:
+        result = call(getattr(server, tool), **arguments, presentation_id=pres_id)
+        assert "error" not in result, result
+        assert not result.get("errors"), result
+        call(server.save_presentation, file_path=str(path), presentation_id=pres_id)
+    finally:
+        call(server.close_presentation, presentation_id=pres_id)
+        if tool == "copy_slides":
+            call(server.close_presentation, presentation_id="incremental_source")
+
+    assert check(Presentation(str(path))), tool
+
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+def test_replaced_notes_and_chart_titles_survive_incremental_save(server, tmp_path, lazy):
+    presentation = Presentation()
+    slide = presentation.slides.add_slide(presentation.slide_layouts[6])
+    slide.notes_slide.notes_text_frame.text = "speaker draft"
+    chart_data = CategoryChartData()
+    chart_data.categories = ["a", "b"]
+    chart_data.add_series("s", [1, 2])
+    chart = slide.shapes.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, 0, 0, Inches(4), Inches(3),
+                                   chart_data).chart
+    chart.has_title = True
+    chart.chart_title.text_frame.text = "draft revenue"
+    path = str(tmp_path / "deck.pptx")
+    ppt_utils.save_presentation(presentation, path)
+
+    def kinds(pres_id, query):
+        return sorted(match["kind"] for match in
+                      call(server.search_text, query=query, presentation_id=pres_id)["matches"])
+
+    pres_id = call(server.open_presentation, file_path=path, lazy=lazy)["presentation_id"]
+    assert kinds(pres_id, "draft") == ["chart_title", "notes"]
+    assert call(server.replace_text, query="draft", replacement="final", presentation_id=pres_id)["replacements"] == 2
+    assert kinds(pres_id, "draft") == []
+    assert kinds(pres_id, "final") == ["chart_title", "notes"]
+    call(server.save_presentation, file_path=path, presentation_id=pres_id)
+    call(server.close_presentation, presentation_id=pres_id)
+
+    pres_id = call(server.open_presentation, file_path=path, lazy=lazy)["presentation_id"]
+    assert kinds(pres_id, "draft") == []
+    assert kinds(pres_id, "final") == ["chart_title", "notes"]
+    call(server.close_presentation, presentation_id=pres_id)
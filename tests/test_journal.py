@@ -0,0 +1,191 @@
+import base64
+import io
+import json
+import os
+
+import pytest
+from PIL import Image
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+
+from conftest import call
+
+
+def _png(color) -> bytes:
+    image = io.BytesIO()
+    Image.new('RGB', (16, 16), color).save(image, 'PNG')
+    return image.getvalue()
+
+
+def _records(server, pres_id):
+    path = server.journal.status()[pres_id]["path"]
+    server.journal._journals[pres_id]["segment"].flush()
+    records = []
+    for kind, _, file_path in server.OperationJournal._files(path):
+        if kind == "journal":
+            with open(file_path, encoding="utf-8") as segment:
+                records.extend(json.loads(line) for line in segment)
+    return path, records
+
+
+def _pictures(presentation, slide_index):
+    return sum(shape.shape_type == MSO_SHAPE_TYPE.PICTURE for shape in presentation.slides[slide_index].shapes)
+
+
+@pytest.fixture
+def journaled(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "journal", server.OperationJournal(str(tmp_path / "journal")))
+    return server
+
+
+def test_recovery_replays_successful_operations_from_copied_inputs(journaled, tmp_path):
+    server = journaled
+    image_path = tmp_path / "logo.png"
+    image_path.write_bytes(_png((255, 0, 0)))
+    payload = base64.b64encode(_png((0, 0, 255))).decode()
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("month,sales\njan,1\nfeb,2\n")
+
+    call(server.create_presentation, id="journaled")
+    call(server.add_slide, layout_index=6, presentation_id="journaled")
+    call(server.add_image, slide_index=0, image_path=str(image_path), left=1, top=1, presentation_id="journaled")
+    call(server.add_image, slide_index=0, image_path=str(image_path), left=3, top=1, presentation_id="journaled")
+    call(server.add_image_from_base64, slide_index=0, base64_string=payload, left=5, top=1,
+         presentation_id="journaled")
+    call(server.add_chart_from_file, slide_index=0, chart_type="line", left=1, top=4, width=4, height=3,
+         file_path=str(csv_path), presentation_id="journaled")
+    # Failed calls, which change nothing
+    assert "error" in call(server.add_slide, layout_index=99, presentation_id="journaled")
+    assert "error" in call(server.add_image, slide_index=7, image_path=str(image_path), left=1, top=1,
+                           presentation_id="journaled")
+    result = call(server.apply_operations, stop_on_error=False, presentation_id="journaled", operations=[
+        {"tool": "add_textbox", "arguments": {"slide_index": 9, "left": 1, "top": 1, "width": 1, "height": 1,
+                                              "text": "missing slide"}},
+        {"tool": "add_image", "arguments": {"slide_index": 0, "image_path": str(image_path), "left": 7, "top": 1}}
+    ])
+    assert result["succeeded"] == 1
+
+    path, records = _records(server, "journaled")
+    assert [record["tool"] for record in records] == [
+        "add_slide", "add_image", "add_image", "add_image_from_base64", "add_chart_from_file", "apply_operations"]
+    assert len(records[-1]["args"]["operations"]) == 1
+    assert all(payload not in json.dumps(record) for record in records)
+    # The same image is stored once
+    assert len([name for name in os.listdir(path) if name.startswith("input-")]) == 3
+
+    # Restart without the original inputs
+    os.remove(image_path)
+    os.remove(csv_path)
+    del server.presentations["journaled"]
+    report = server.OperationJournal(server.journal.directory).recover(server.tool_functions)["journaled"]
+    assert report == {"checkpoint_seq": 0, "replayed": 6, "failed": []}
+
+    presentation = server.presentations["journaled"]
+    assert _pictures(presentation, 0) == 4
+    assert any(shape.has_chart for shape in presentation.slides[0].shapes)
+    call(server.close_presentation, presentation_id="journaled")
+
+
+def test_checkpoint_removes_inputs_it_covers(journaled, tmp_path):
+    server = journaled
+    image_path = tmp_path / "logo.png"
+    image_path.write_bytes(_png((0, 255, 0)))
+    call(server.create_presentation, id="checkpointed")
+    call(server.add_slide, layout_index=6, presentation_id="checkpointed")
+    call(server.add_image, slide_index=0, image_path=str(image_path), left=1, top=1, presentation_id="checkpointed")
+    path = server.journal.status()["checkpointed"]["path"]
+    assert any(name.startswith("input-") for name in os.listdir(path))
+
+    server.journal.checkpoint("checkpointed")
+    assert not any(name.startswith("input-") for name in os.listdir(path))
+    call(server.close_presentation, presentation_id="checkpointed")
+
+
+def _restart(server, *pres_ids):
+    """Drop presentations from memory, keeping their journals, and recover them."""
+    for journal in server.journal._journals.values():
+        journal["segment"].flush()
+    for pres_id in pres_ids:
+        del server.presentations[pres_id]
+    return server.OperationJournal(server.journal.directory).recover(server.tool_functions)
+
+
+def test_copied_slides_are_recovered_without_their_source(journaled):
+    server = journaled
+    call(server.create_presentation, id="copy_source")
+    call(server.add_slide, layout_index=1, title="Copied", presentation_id="copy_source")
+    call(server.create_presentation, id="copy_target")
+    call(server.add_slide, layout_index=1, title="Own", presentation_id="copy_target")
+    call(server.copy_slides, source_presentation_id="copy_source", slide_indices=[0], presentation_id="copy_target")
+    call(server.apply_operations, presentation_id="copy_target", operations=[
+        {"tool": "copy_slides", "arguments": {"source_presentation_id": "copy_source", "slide_indices": [0]}}])
+    call(server.add_slide, layout_index=1, title="After", presentation_id="copy_target")
+    call(server.close_presentation, presentation_id="copy_source")
+
+    report = _restart(server, "copy_target")["copy_target"]
+    assert report["failed"] == [] and report["replayed"] == 1
+    titles = [slide.shapes.title.text for slide in server.presentations["copy_target"].slides]
+    assert titles == ["Own", "Copied", "Copied", "After"]
+    call(server.close_presentation, presentation_id="copy_target")
+
+
+def test_merged_decks_are_recovered_without_their_files(journaled, tmp_path):
+    server = journaled
+    paths = []
+    for title in ("First", "Second"):
+        call(server.create_presentation, id="merge_part")
+        call(server.add_slide, layout_index=1, title=title, presentation_id="merge_part")
+        paths.append(str(tmp_path / f"{title}.pptx"))
+        call(server.save_presentation, file_path=paths[-1], presentation_id="merge_part")
+        call(server.close_presentation, presentation_id="merge_part")
+    call(server.merge_decks, file_paths=paths, id="merged")
+    for path in paths:
+        os.remove(path)
+
+    assert _restart(server, "merged")["merged"]["failed"] == []
+    titles = [slide.shapes.title.text for slide in server.presentations["merged"].slides]
+    assert titles == ["First", "Second"]
+    call(server.close_presentation, presentation_id="merged")
+
+
+def test_batches_are_journaled_without_read_only_operations(journaled, tmp_path):
+    server = journaled
+    output_path = tmp_path / "out.pptx"
+    call(server.create_presentation, id="batch_save")
+    result = call(server.apply_operations, presentation_id="batch_save", operations=[
+        {"tool": "add_slide", "arguments": {"layout_index": 1, "title": "Saved"}},
+        {"tool": "save_presentation", "arguments": {"file_path": str(output_path)}},
+        {"tool": "get_presentation_info", "arguments": {}}])
+    assert result["succeeded"] == 3
+    _, records = _records(server, "batch_save")
+    assert [operation["tool"] for operation in records[-1]["args"]["operations"]] == ["add_slide"]
+
+    # A file the user wrote since is not saved over by the replay
+    output_path.write_bytes(b"replaced")
+    assert _restart(server, "batch_save")["batch_save"]["failed"] == []
+    assert output_path.read_bytes() == b"replaced"
+    assert len(server.presentations["batch_save"].slides) == 1
+    call(server.close_presentation, presentation_id="batch_save")
+
+
+def test_images_are_replayed_with_the_optimization_they_were_added_with(journaled, tmp_path, monkeypatch):
+    server = journaled
+    image_path = tmp_path / "large.png"
+    Image.effect_noise((1600, 800), 64).convert("RGB").save(image_path)
+    monkeypatch.setitem(server.image_optimization, "enabled", True)
+    call(server.create_presentation, id="optimized")
+    call(server.add_slide, layout_index=6, presentation_id="optimized")
+    call(server.add_image, slide_index=0, image_path=str(image_path), left=1, top=1, width=1,
+         presentation_id="optimized")
+    call(server.apply_operations, presentation_id="optimized", operations=[
+        {"tool": "add_image", "arguments": {"slide_index": 0, "image_path": str(image_path), "left": 3, "top": 1,
+                                            "width": 1}}])
+    _, records = _records(server, "optimized")
+    assert records[1]["args"]["optimize"] is True
+    assert records[2]["args"]["operations"][0]["arguments"]["optimize"] is True
+
+    # Recovered after the server setting changed
+    monkeypatch.setitem(server.image_optimization, "enabled", False)
+    assert _restart(server, "optimized")["optimized"]["failed"] == []
+    pictures = server.presentations["optimized"].slides[0].shapes
+    assert [picture.image.size[0] < 1600 for picture in pictures] == [True, True]
+    call(server.close_presentation, presentation_id="optimized")
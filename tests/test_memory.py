@@ -0,0 +1,61 @@
+import base64
+import gc
+import io
+import weakref
+
+from PIL import Image
+
+from conftest import call
+
+
+def _png_base64() -> str:
+    buffer = io.BytesIO()
+    Image.new("RGB", (16, 16), "red").save(buffer, "PNG")
+    return base64.b64encode(buffer.getvalue()).decode()
+
+
+def _package_ref(server, pres_id):
+    return weakref.ref(server.presentations[pres_id].part.package)
+
+
+def test_closed_presentation_is_freed(server):
+    call(server.create_presentation, id="memory_closed")
+    call(server.add_slide, layout_index=1, title="Indexed", presentation_id="memory_closed")
+    call(server.get_slide_info, slide_index=0, presentation_id="memory_closed")
+    package = _package_ref(server, "memory_closed")
+
+    call(server.close_presentation, presentation_id="memory_closed")
+    gc.collect()
+
+    assert package() is None
+
+
+def test_spilled_presentation_is_freed(server, monkeypatch):
+    call(server.create_presentation, id="memory_spilled")
+    call(server.add_slide, layout_index=1, presentation_id="memory_spilled")
+    package = _package_ref(server, "memory_spilled")
+
+    monkeypatch.setattr(server.presentations, "max_count", 1)
+    call(server.create_presentation, id="memory_spilled_newer")
+    gc.collect()
+
+    assert package() is None
+    assert server.presentations.info("memory_spilled")["resident"] is False
+    call(server.close_presentation, presentation_id="memory_spilled")
+    call(server.close_presentation, presentation_id="memory_spilled_newer")
+
+
+def test_presentation_with_cached_image_is_freed(server):
+    call(server.create_presentation, id="memory_image")
+    call(server.add_slide, layout_index=6, presentation_id="memory_image")
+    image = _png_base64()
+    for left in (1, 3):
+        result = call(server.add_image_from_base64, slide_index=0, base64_string=image,
+                      left=left, top=1, presentation_id="memory_image")
+        assert "error" not in result
+    package = _package_ref(server, "memory_image")
+
+    call(server.close_presentation, presentation_id="memory_image")
+    gc.collect()
+
+    assert package() is None
@@ -0,0 +1,115 @@
+import threading
+
+import ppt_utils
+
+
+def _blocking_save(monkeypatch, server):
+    """Make spills wait until released, returning (started, release) events."""
+    started, release = threading.Event(), threading.Event()
+    save = ppt_utils.save_presentation
+
+    def blocked_save(*args, **kwargs):
+        started.set()
+        assert release.wait(10)
+        return save(*args, **kwargs)
+
+    monkeypatch.setattr(server.ppt_utils, "save_presentation", blocked_save)
+    return started, release
+
+
+def _run(function):
+    thread = threading.Thread(target=function, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_spill_does_not_block_other_presentations(server, monkeypatch):
+    store = server.PresentationStore(max_count=2)
+    store["old"] = ppt_utils.create_presentation()
+    store["recent"] = ppt_utils.create_presentation()
+    started, release = _blocking_save(monkeypatch, server)
+
+    # Storing a third presentation spills "old"
+    spilling = _run(lambda: store.add(ppt_utils.create_presentation(), "new"))
+    assert started.wait(10)
+
+    reader = _run(lambda: (store["recent"], store.info("recent"), len(store)))
+    reader.join(5)
+    assert not reader.is_alive()
+
+    release.set()
+    spilling.join(10)
+    assert not store.info("old")["resident"]
+    assert store["old"] is not None
+    assert store.info("old")["resident"]
+
+
+def test_spilling_presentation_waits_for_use(server, monkeypatch):
+    store = server.PresentationStore(max_count=1)
+    store["old"] = ppt_utils.create_presentation()
+    started, release = _blocking_save(monkeypatch, server)
+    spilling = _run(lambda: store.add(ppt_utils.create_presentation(), "new"))
+    assert started.wait(10)
+
+    used = []
+
+    def use_old():
+        with store.use("old"):
+            used.append(store["old"])
+
+    user = _run(use_old)
+    user.join(0.2)
+    assert user.is_alive() and not used
+
+    release.set()
+    spilling.join(10)
+    user.join(10)
+    assert used and used[0] is not None
+
+
+def test_info_waits_for_writer(server):
+    store = server.PresentationStore()
+    store["deck"] = ppt_utils.create_presentation()
+    writing, done = threading.Event(), threading.Event()
+
+    def write():
+        with store.use("deck", write=True):
+            writing.set()
+            done.wait(10)
+
+    writer = _run(write)
+    assert writing.wait(10)
+    infos = []
+    reader = _run(lambda: infos.append(store.info("deck")))
+    reader.join(0.2)
+    assert reader.is_alive() and not infos
+
+    done.set()
+    writer.join(10)
+    reader.join(10)
+    assert infos[0]["resident"] and infos[0]["slide_count"] == 0
+
+
+def test_saves_of_one_presentation_run_one_at_a_time(server, monkeypatch, tmp_path):
+    # save_presentation is a read_only tool, so two calls can hold the presentation at once
+    presentation = ppt_utils.create_presentation()
+    running, overlapped = [], []
+    write = ppt_utils.write_presentation
+
+    def slow_write(*args, **kwargs):
+        running.append(1)
+        overlapped.append(len(running) > 1)
+        try:
+            threading.Event().wait(0.2)
+            return write(*args, **kwargs)
+        finally:
+            running.pop()
+
+    monkeypatch.setattr(ppt_utils, "write_presentation", slow_write)
+    path = str(tmp_path / "deck.pptx")
+    savers = [_run(lambda: ppt_utils.save_presentation(presentation, path)) for _ in range(3)]
+    for saver in savers:
+        saver.join(10)
+
+    assert overlapped == [False, False, False]
+    assert ppt_utils._package_sources[presentation.part.package].is_current